@@ -0,0 +1 @@
+"""Distribution-aware benchmark suite for Two Sum engines."""
@@ -0,0 +1,174 @@
+"""Distribution-aware benchmarks for every Two Sum engine.
+
+Each case runs one engine on one input distribution and size. The suite
+lives outside ``tests/`` so the default ``pytest`` run does not collect it;
+select cases with ``-k``, e.g. ``-k "adversarial and 100000"``.
+
+Store a JSON baseline (written under ``.benchmarks/``)::
+
+    uv run pytest benchmarks --benchmark-only --benchmark-save=baseline
+
+Compare a later run against the latest baseline, failing on regressions::
+
+    uv run pytest benchmarks --benchmark-only --benchmark-compare \
+        --benchmark-compare-fail=median:10%
+
+A median 10% slower is a throughput drop of about 9%. Every case also
+records ``size`` and ``elements_per_second`` in its ``extra_info``.
+"""
+
+import random
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+from typing import Any
+
+import pytest
+
+from src.two_sum import (
+    two_sum,
+    two_sum_auto,
+    two_sum_bounded,
+    two_sum_brute_force,
+    two_sum_compact,
+    two_sum_generator,
+    two_sum_hardened,
+    two_sum_np,
+    two_sum_stream,
+)
+
+SIZES = [10, 1_000, 100_000, 1_000_000, 10_000_000]
+
+DISTRIBUTIONS = ["random", "duplicates", "negative", "sorted", "adversarial"]
+
+
+def _random(rng: random.Random, size: int) -> list[int]:
+    """Uniform values, ten times as many possible values as elements."""
+    return [rng.randrange(10 * size) for _ in range(size)]
+
+
+def _duplicates(rng: random.Random, size: int) -> list[int]:
+    """About 100 copies of each value."""
+    pool = max(2, size // 100)
+    return [rng.randrange(pool) for _ in range(size)]
+
+
+def _negative(rng: random.Random, size: int) -> list[int]:
+    """Uniform negative values."""
+    return [rng.randrange(-10 * size, 0) for _ in range(size)]
+
+
+def _sorted(rng: random.Random, size: int) -> list[int]:
+    """Uniform values in ascending order."""
+    return sorted(_random(rng, size))
+
+
+def _adversarial(rng: random.Random, size: int) -> list[int]:
+    """Distinct shuffled even values closed by a single odd one.
+
+    With an odd target only the final element can be part of a pair, so
+    every engine has to look at (nearly) the whole input.
+    """
+    nums = list(range(0, 2 * (size - 1), 2))
+    rng.shuffle(nums)
+    nums.append(1)
+    return nums
+
+
+_GENERATORS: dict[str, Callable[[random.Random, int], list[int]]] = {
+    "random": _random,
+    "duplicates": _duplicates,
+    "negative": _negative,
+    "sorted": _sorted,
+    "adversarial": _adversarial,
+}
+
+
+@lru_cache(maxsize=1)
+def _workload(distribution: str, size: int) -> tuple[list[int], int]:
+    """Build a seeded input and a target that has at least one pair.
+
+    Cached so that consecutive engines on the same case share the input.
+    """
+    rng = random.Random(f"{distribution}-{size}")
+    nums = _GENERATORS[distribution](rng, size)
+    if distribution == "adversarial":
+        i, j = size - 2, size - 1
+    else:
+        i, j = rng.sample(range(size), 2)
+    return nums, nums[i] + nums[j]
+
+
+def _numpy_input(nums: list[int]) -> Any:
+    """Convert a workload to an int64 ndarray, skipping without NumPy."""
+    np = pytest.importorskip("numpy")
+    return np.array(nums, dtype=np.int64)
+
+
+def _parallel(nums: Any, target: int) -> Sequence[int]:
+    """Run ``two_sum_parallel`` (imported lazily: it requires NumPy)."""
+    from src.parallel import two_sum_parallel
+
+    return two_sum_parallel(nums, target)
+
+
+# Engine name -> (function, input conversion, largest size, distributions).
+# The caps keep quadratic or slow engines to sizes that finish in seconds.
+ENGINES: dict[
+    str,
+    tuple[
+        Callable[[Any, int], Sequence[int]],
+        Callable[[list[int]], Any] | None,
+        int,
+        tuple[str, ...] | None,
+    ],
+] = {
+    "two_sum": (two_sum, None, SIZES[-1], None),
+    "two_sum_generator": (two_sum_generator, None, SIZES[-1], None),
+    "two_sum_bounded": (two_sum_bounded, None, SIZES[-1], None),
+    "two_sum_hardened": (two_sum_hardened, None, SIZES[-1], None),
+    "two_sum_brute_force": (two_sum_brute_force, None, 1_000, None),
+    "two_sum_presorted": (
+        lambda nums, target: two_sum(nums, target, presorted=True),
+        None,
+        SIZES[-1],
+        ("sorted",),
+    ),
+    "two_sum_compact": (two_sum_compact, None, 1_000_000, None),
+    "two_sum_stream": (
+        lambda nums, target: two_sum_stream(iter(nums), target),
+        None,
+        SIZES[-1],
+        None,
+    ),
+    "two_sum_np": (two_sum_np, _numpy_input, SIZES[-1], None),
+    "two_sum_parallel": (_parallel, _numpy_input, SIZES[-1], None),
+    "two_sum_auto": (two_sum_auto, None, SIZES[-1], None),
+    "two_sum_auto_np": (two_sum_auto, _numpy_input, SIZES[-1], None),
+}
+
+CASES = [
+    pytest.param(distribution, size, engine, id=f"{distribution}-{size}-{engine}")
+    for distribution in DISTRIBUTIONS
+    for size in SIZES
+    for engine, (_, _, max_size, only) in ENGINES.items()
+    if size <= max_size and (only is None or distribution in only)
+]
+
+
+@pytest.mark.parametrize(("distribution", "size", "engine"), CASES)
+def test_engine(benchmark: Any, distribution: str, size: int, engine: str) -> None:
+    """Benchmark one engine on one distribution and size."""
+    nums, target = _workload(distribution, size)
+    func, convert, _, _ = ENGINES[engine]
+    data = nums if convert is None else convert(nums)
+
+    benchmark.group = f"{distribution}-{size}"
+    benchmark.extra_info["size"] = size
+    result = benchmark(func, data, target)
+
+    i, j = result
+    assert i != j
+    assert nums[i] + nums[j] == target
+    if benchmark.stats is not None:  # None under --benchmark-disable
+        median = benchmark.stats.stats.median
+        benchmark.extra_info["elements_per_second"] = size / median
@@ -0,0 +1,720 @@
+"""Large-input benchmarks for the Two Sum engines and services.
+
+Each class compares one engine or service with its baseline on inputs of
+hundreds of thousands to 10M elements. The suite lives outside ``tests/``
+so the default ``pytest`` run does not collect it; select classes with
+``-k``, e.g. ``-k sliding``::
+
+    uv run pytest benchmarks/test_engines.py --benchmark-only -k sliding
+
+Several cases record throughput or ratios in their ``extra_info``.
+"""
+
+import sys
+from array import array
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.two_sum import (
+    two_sum,
+    two_sum_all_pairs,
+    two_sum_auto,
+    two_sum_bounded,
+    two_sum_brute_force,
+    two_sum_closest,
+    two_sum_count,
+    two_sum_count_bands,
+    two_sum_count_range,
+    two_sum_cross,
+    two_sum_cross_mmap,
+    two_sum_generator,
+    two_sum_many,
+    two_sum_mmap,
+    two_sum_np,
+    two_sum_tolerance,
+)
+
+
+def _write_int64_file(path: Path, count: int) -> Path:
+    """Write 0..count-1 as packed little-endian int64 values."""
+    data = array("q", range(count))
+    if sys.byteorder == "big":
+        data.byteswap()
+    path.write_bytes(data.tobytes())
+    return path
+
+
+class TestTwoSumVectorizedPerformance:
+    """Benchmarks comparing the hash map and NumPy engines (1M elements)."""
+
+    @pytest.mark.benchmark(group="vectorized")
+    def test_performance_1m_optimized(self, benchmark: Any) -> None:
+        """Benchmark the hash map version on a 1M-element list."""
+        nums = list(range(1_000_000))
+        target = 1_999_997
+
+        result = benchmark(two_sum, nums, target)
+        assert result == [999_998, 999_999]
+
+    @pytest.mark.benchmark(group="vectorized")
+    def test_performance_1m_numpy(self, benchmark: Any) -> None:
+        """Benchmark the vectorized version on a 1M-element ndarray."""
+        np = pytest.importorskip("numpy")
+        nums = np.arange(1_000_000, dtype=np.int64)
+        target = 1_999_997
+
+        result = benchmark(two_sum_np, nums, target)
+        assert result == [999_998, 999_999]
+
+    @pytest.mark.benchmark(group="vectorized")
+    def test_performance_1m_numpy_array_buffer(self, benchmark: Any) -> None:
+        """Benchmark the vectorized version on an array.array buffer."""
+        from array import array
+
+        nums = array("q", range(1_000_000))
+        target = 1_999_997
+
+        pytest.importorskip("numpy")
+        result = benchmark(two_sum_np, nums, target)
+        assert result == [999_998, 999_999]
+
+
+class TestTwoSumClosestPerformance:
+    """Benchmarks for the closest-sum mode without an exact pair."""
+
+    @pytest.mark.benchmark(group="closest")
+    def test_performance_1m_list(self, benchmark: Any) -> None:
+        """Benchmark the sort-based scan on a 1M-element list of even values."""
+        import random
+
+        rng = random.Random(42)
+        nums = [2 * rng.randrange(10**12) for _ in range(1_000_000)]
+        target = 10**12 + 1  # odd: no exact pair, the scan runs to the end
+
+        i, j = benchmark.pedantic(
+            two_sum_closest, (nums, target), rounds=3, iterations=1
+        )
+        assert abs(nums[i] + nums[j] - target) >= 1
+
+    @pytest.mark.benchmark(group="closest")
+    def test_performance_10m_numpy(self, benchmark: Any) -> None:
+        """Benchmark the vectorized path on a 10M-element ndarray."""
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(42)
+        nums = 2 * rng.integers(0, 10**12, 10_000_000)
+        target = 10**12 + 1
+
+        i, j = benchmark.pedantic(
+            two_sum_closest, (nums, target), rounds=1, iterations=1
+        )
+        assert abs(int(nums[i]) + int(nums[j]) - target) >= 1
+
+
+class TestTwoSumTolerancePerformance:
+    """Float pairs within 1e-9 of the sum of the two largest values."""
+
+    @staticmethod
+    def _workload(n: int) -> tuple[Any, float]:
+        """Build n random float64 amounts; the pair closes at the very end."""
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(42)
+        nums = rng.uniform(0, 1e6, n)
+        top = np.sort(nums)[-2:]
+        return nums, float(top[0] + top[1])
+
+    @pytest.mark.benchmark(group="tolerance")
+    def test_performance_1m_list(self, benchmark: Any) -> None:
+        """Benchmark sort plus bisect on a 1M-element list of floats."""
+        nums, target = self._workload(1_000_000)
+        values = nums.tolist()
+
+        i, j = benchmark.pedantic(
+            two_sum_tolerance, (values, target, 1e-9), rounds=3, iterations=1
+        )
+        assert abs(values[i] + values[j] - target) <= 1e-9
+
+    @pytest.mark.benchmark(group="tolerance")
+    @pytest.mark.parametrize("n", [1_000_000, 10_000_000], ids=["1m", "10m"])
+    def test_performance_numpy(self, benchmark: Any, n: int) -> None:
+        """Benchmark argsort plus searchsorted on a float64 ndarray."""
+        nums, target = self._workload(n)
+
+        i, j = benchmark.pedantic(
+            two_sum_tolerance, (nums, target, 1e-9), rounds=1, iterations=1
+        )
+        assert abs(nums[i] + nums[j] - target) <= 1e-9
+
+
+class TestTwoSumCountPerformance:
+    """Counting pairs among 10M values drawn from 0..9999."""
+
+    @staticmethod
+    def _workload() -> Any:
+        """Build 10M duplicate-heavy int64 values."""
+        np = pytest.importorskip("numpy")
+        return np.random.default_rng(42).integers(0, 10_000, 10_000_000)
+
+    @pytest.mark.benchmark(group="count")
+    def test_performance_10m_list(self, benchmark: Any) -> None:
+        """Benchmark the Counter over a 10M-element list."""
+        nums = self._workload()
+        values = nums.tolist()
+
+        count = benchmark.pedantic(
+            two_sum_count, (values, 9_999), rounds=1, iterations=1
+        )
+        assert count == two_sum_count(nums, 9_999)
+
+    @pytest.mark.benchmark(group="count")
+    def test_performance_10m_numpy(self, benchmark: Any) -> None:
+        """Benchmark np.unique counts plus searchsorted on a 10M ndarray."""
+        nums = self._workload()
+
+        count = benchmark.pedantic(two_sum_count, (nums, 9_999), rounds=3, iterations=1)
+        # About (10M / 10K)^2 = 1M pairs for each of the 5K value pairs
+        assert 0.9 * 5 * 10**9 < count < 1.1 * 5 * 10**9
+
+
+class TestTwoSumCountRangePerformance:
+    """Counting pairs in sum bands over 1M values from 0..10^6."""
+
+    @staticmethod
+    def _workload() -> Any:
+        """Build 1M seeded random int64 values."""
+        np = pytest.importorskip("numpy")
+        return np.random.default_rng(42).integers(0, 1_000_000, 1_000_000)
+
+    @pytest.mark.benchmark(group="count-range")
+    def test_performance_band_per_target(self, benchmark: Any) -> None:
+        """Benchmark the baseline: one two_sum_count per target in a 100-wide band."""
+        nums = self._workload()
+
+        def run() -> int:
+            return sum(two_sum_count(nums, t) for t in range(1_000_000, 1_000_100))
+
+        count = benchmark.pedantic(run, rounds=1, iterations=1)
+        assert count == two_sum_count_range(nums, 1_000_000, 1_000_099)
+
+    @pytest.mark.benchmark(group="count-range")
+    def test_performance_band_list(self, benchmark: Any) -> None:
+        """Benchmark sort plus two-pointer prefix counts on a 1M list."""
+        nums = self._workload()
+        values = nums.tolist()
+
+        count = benchmark.pedantic(
+            two_sum_count_range, (values, 1_000_000, 1_000_099), rounds=1
+        )
+        assert count == two_sum_count_range(nums, 1_000_000, 1_000_099)
+
+    @pytest.mark.benchmark(group="count-range")
+    def test_performance_band_numpy(self, benchmark: Any) -> None:
+        """Benchmark sort plus searchsorted on a 1M ndarray."""
+        nums = self._workload()
+
+        count = benchmark.pedantic(
+            two_sum_count_range, (nums, 1_000_000, 1_000_099), rounds=3
+        )
+        # About 5 * 10^11 pairs, 1 in 10^4 with a sum in the band
+        assert 0.9 * 5 * 10**7 < count < 1.1 * 5 * 10**7
+
+    @pytest.mark.benchmark(group="count-range")
+    def test_performance_100_bands_numpy(self, benchmark: Any) -> None:
+        """Benchmark 100 adjacent bands answered after a single sort."""
+        nums = self._workload()
+        bands = [(lo, lo + 9_999) for lo in range(0, 1_000_000, 10_000)]
+
+        counts = benchmark.pedantic(two_sum_count_bands, (nums, bands), rounds=1)
+        assert sum(counts) == two_sum_count_range(nums, 0, 999_999)
+
+
+class TestTwoSumBoundedPerformance:
+    """Benchmarks on 1M values from the small range 0..65535."""
+
+    @staticmethod
+    def _workload() -> tuple[list[int], int]:
+        """Build even values in range with one odd value closing the pair."""
+        import random
+
+        rng = random.Random(42)
+        nums = [2 * rng.randrange(32_768) for _ in range(1_000_000)]
+        nums[-1] = 1
+        return nums, nums[-2] + 1
+
+    @pytest.mark.benchmark(group="bounded-range")
+    def test_performance_1m_two_sum(self, benchmark: Any) -> None:
+        """Benchmark the dict-based two_sum."""
+        nums, target = self._workload()
+
+        result = benchmark(two_sum, nums, target)
+        assert result == [999_998, 999_999]
+
+    @pytest.mark.benchmark(group="bounded-range")
+    def test_performance_1m_bounded(self, benchmark: Any) -> None:
+        """Benchmark the bytearray direct-address table."""
+        nums, target = self._workload()
+
+        result = benchmark(two_sum_bounded, nums, target)
+        assert result == [999_998, 999_999]
+
+    @pytest.mark.benchmark(group="bounded-range")
+    def test_performance_1m_numpy_table(self, benchmark: Any) -> None:
+        """Benchmark two_sum_np, which switches to its direct-address table."""
+        np = pytest.importorskip("numpy")
+        nums, target = self._workload()
+        arr = np.array(nums, dtype=np.int64)
+
+        result = benchmark(two_sum_np, arr, target)
+        assert result == [999_998, 999_999]
+
+    @pytest.mark.benchmark(group="bounded-range")
+    def test_performance_1m_numpy_sort(
+        self, benchmark: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Benchmark two_sum_np with the table disabled (argsort path)."""
+        np = pytest.importorskip("numpy")
+        monkeypatch.setattr("src.two_sum._DIRECT_ADDRESS_MIN_SPAN", 0)
+        monkeypatch.setattr("src.two_sum._DIRECT_ADDRESS_SPAN_RATIO", 0)
+        nums, target = self._workload()
+        arr = np.array(nums, dtype=np.int64)
+
+        result = benchmark(two_sum_np, arr, target)
+        assert result == [999_998, 999_999]
+
+
+class TestTwoSumSortedPerformance:
+    """Benchmarks for already-sorted input: hashing vs skipping it."""
+
+    @staticmethod
+    def _sorted_workload(n: int) -> tuple[list[int], int]:
+        """Even numbers 0..2n-2 with the only pair at the very end.
+
+        Worst case for both scans: the hash map sees the pair last and the
+        left pointer has to walk across the whole array.
+        """
+        nums = list(range(0, 2 * n, 2))
+        return nums, nums[-2] + nums[-1]
+
+    @pytest.mark.benchmark(group="sorted-1m")
+    def test_performance_sorted_1m_hash(self, benchmark: Any) -> None:
+        """Benchmark the hash map version on 1M sorted elements."""
+        nums, target = self._sorted_workload(1_000_000)
+
+        i, j = benchmark(two_sum, nums, target)
+        assert nums[i] + nums[j] == target
+
+    @pytest.mark.benchmark(group="sorted-1m")
+    def test_performance_sorted_1m_two_pointer(self, benchmark: Any) -> None:
+        """Benchmark the two-pointer fast path on 1M sorted elements."""
+        nums, target = self._sorted_workload(1_000_000)
+
+        i, j = benchmark(two_sum, nums, target, presorted=True)
+        assert nums[i] + nums[j] == target
+
+    @pytest.mark.benchmark(group="sorted-10m")
+    @pytest.mark.parametrize("presorted", [False, True])
+    def test_performance_sorted_10m_numpy(
+        self, benchmark: Any, presorted: bool
+    ) -> None:
+        """Benchmark two_sum_np on 10M sorted elements, with and without sort."""
+        np = pytest.importorskip("numpy")
+        nums = np.arange(0, 20_000_000, 2, dtype=np.int64)
+        target = int(nums[-2] + nums[-1])
+
+        i, j = benchmark(two_sum_np, nums, target, presorted=presorted)
+        assert nums[i] + nums[j] == target
+
+
+class TestTwoSumAutoPerformance:
+    """two_sum_auto against every fixed engine, one input shape at a time.
+
+    Each workload has one pair, completed at the end of the input, early
+    on (0.5% in) or at a seeded random position. ``extra_info`` records the
+    fastest fixed engine and the ratio to it; the dispatcher is designed to
+    stay within 1.25 of it inside the hash-scanned prefix, 1.5 for a pair
+    at the end and 3 just past the prefix. The ratios are recorded, not
+    asserted: wall-clock ratios of microsecond calls are too noisy to fail
+    a test run on.
+    """
+
+    _WORKLOADS = (
+        "tiny-list",
+        "list-100",
+        "list-wide",
+        "list-wide-early",
+        "list-wide-random",
+        "list-narrow",
+        "list-narrow-early",
+        "list-narrow-random",
+        "array-wide",
+        "array-wide-early",
+        "ndarray-sorted",
+        "ndarray-narrow",
+        "ndarray-narrow-random",
+    )
+
+    @staticmethod
+    def _workload(name: str) -> tuple[Any, int, int]:
+        """Build (nums, target, calls per timing) for a named input shape."""
+        import random
+
+        np = pytest.importorskip("numpy")
+        rng = random.Random(42)
+        if name == "tiny-list":
+            return [3, 2, 4], 6, 20_000
+        size = 100 if name == "list-100" else 200_000
+        if name.endswith("-early"):
+            j = size // 200
+        elif name.endswith("-random"):
+            j = rng.randrange(1, size)
+        else:
+            j = size - 1
+        if "narrow" in name:
+            # Even values and one odd partner
+            nums = [2 * rng.randrange(32_768) for _ in range(size)]
+            nums[j] = 1
+        else:
+            nums = [rng.randrange(10**12) for _ in range(size)]
+            if "sorted" in name:
+                nums.sort()
+            nums[j] = 10**13
+        target = nums[j - 1] + nums[j]
+        # Sub-millisecond calls are repeated so that one timing is not noise
+        calls = 2_000 if size == 100 else 10 if name.endswith("-early") else 1
+        if name.startswith("array"):
+            return array("q", nums), target, calls
+        if name.startswith("ndarray"):
+            return np.array(nums), target, calls
+        return nums, target, calls
+
+    @pytest.mark.benchmark(group="auto")
+    @pytest.mark.parametrize("workload", _WORKLOADS)
+    def test_performance_auto_vs_fixed(self, benchmark: Any, workload: str) -> None:
+        """Benchmark two_sum_auto and compare it with the best fixed engine."""
+        import timeit
+
+        nums, target, calls = self._workload(workload)
+        fixed: dict[str, Callable[[], object]] = {
+            "two_sum": lambda: two_sum(nums, target),
+            "two_sum_bounded": lambda: two_sum_bounded(nums, target),
+            "two_sum_np": lambda: two_sum_np(nums, target),
+        }
+        if len(nums) <= 100:
+            fixed["two_sum_brute_force"] = lambda: two_sum_brute_force(nums, target)
+            fixed["two_sum_generator"] = lambda: two_sum_generator(nums, target)
+        if workload.endswith("sorted"):
+            fixed["two_sum_np_presorted"] = lambda: two_sum_np(
+                nums, target, presorted=True
+            )
+
+        def best_times(funcs: dict[str, Callable[[], object]]) -> dict[str, float]:
+            # Rounds interleave the candidates so that drift in machine speed
+            # hits all of them alike; each candidate is timed twice per round
+            # so that the caches another one left cold are not charged to
+            # it. Line tracing (coverage) would multiply the cost of every
+            # Python-level step, so it is paused meanwhile
+            best = dict.fromkeys(funcs, float("inf"))
+            tracer = sys.gettrace()
+            sys.settrace(None)
+            try:
+                for _ in range(3):
+                    for name, func in funcs.items():
+                        timings = timeit.repeat(func, number=calls, repeat=2)
+                        seconds = min(timings) / calls
+                        best[name] = min(best[name], seconds)
+            finally:
+                sys.settrace(tracer)
+            return best
+
+        result = benchmark.pedantic(two_sum_auto, (nums, target), rounds=3)
+        assert result == two_sum(list(nums), target)
+        if benchmark.stats is None:  # --benchmark-disable
+            return
+
+        times = best_times({**fixed, "auto": lambda: two_sum_auto(nums, target)})
+        auto = times.pop("auto")
+        best = min(times, key=times.__getitem__)
+        benchmark.extra_info["best_fixed"] = best
+        benchmark.extra_info["ratio_to_best"] = round(auto / times[best], 2)
+
+
+class TestTwoSumMmapPerformance:
+    """Benchmarks for searching a 1M-element int64 file in place."""
+
+    @pytest.mark.benchmark(group="mmap")
+    def test_performance_1m_file_vectorized(
+        self, benchmark: Any, tmp_path: Path
+    ) -> None:
+        """Benchmark the memory-mapped vectorized path."""
+        pytest.importorskip("numpy")
+        path = _write_int64_file(tmp_path / "nums.bin", 1_000_000)
+
+        result = benchmark(two_sum_mmap, path, 1_999_997, vectorized=True)
+        assert result == [999_998, 999_999]
+
+    @pytest.mark.benchmark(group="mmap")
+    def test_performance_1m_file_chunked(self, benchmark: Any, tmp_path: Path) -> None:
+        """Benchmark the memory-mapped chunked path."""
+        path = _write_int64_file(tmp_path / "nums.bin", 1_000_000)
+
+        result = benchmark(two_sum_mmap, path, 1_999_997, vectorized=False)
+        assert result == [999_998, 999_999]
+
+
+class TestTwoSumCrossPerformance:
+    """Joining 10K in-memory values against a 4M-element int64 file."""
+
+    # Only the last file element (3_999_999) pairs with a[-1]
+    _TARGET = 3_999_999 + 10_000_000
+
+    @staticmethod
+    def _left() -> list[int]:
+        """Values that only match the end of the file."""
+        return list(range(10_000_000 - 9_999, 10_000_001))
+
+    @pytest.mark.benchmark(group="cross")
+    def test_performance_cross_file_vectorized(
+        self, benchmark: Any, tmp_path: Path
+    ) -> None:
+        """Benchmark the memmap path: np.unique index, range-filtered chunks."""
+        pytest.importorskip("numpy")
+        path = _write_int64_file(tmp_path / "b.bin", 4_000_000)
+        a = self._left()
+
+        result = benchmark.pedantic(
+            two_sum_cross_mmap,
+            args=(a, path, self._TARGET),
+            kwargs={"vectorized": True},
+            rounds=3,
+            iterations=1,
+        )
+        assert result == [9_999, 3_999_999]
+
+    @pytest.mark.benchmark(group="cross")
+    def test_performance_cross_file_chunked(
+        self, benchmark: Any, tmp_path: Path
+    ) -> None:
+        """Benchmark the NumPy-free path: dict index, mapped blocks."""
+        path = _write_int64_file(tmp_path / "b.bin", 4_000_000)
+        a = self._left()
+
+        result = benchmark.pedantic(
+            two_sum_cross_mmap,
+            args=(a, path, self._TARGET),
+            kwargs={"vectorized": False},
+            rounds=3,
+            iterations=1,
+        )
+        assert result == [9_999, 3_999_999]
+
+    @pytest.mark.benchmark(group="cross")
+    def test_performance_cross_concatenated(self, benchmark: Any) -> None:
+        """Benchmark the baseline: all pairs of the concatenation, filtered.
+
+        Pairs within one input have to be skipped, so every solution of the
+        concatenation is enumerated until a cross pair shows up.
+        """
+        a = self._left()
+        b = list(range(4_000_000))
+
+        def run() -> tuple[int, int]:
+            for i, j in two_sum_all_pairs(a + b, self._TARGET):
+                if i < len(a) <= j:
+                    return i, j - len(a)
+            raise ValueError("no cross pair")
+
+        assert benchmark.pedantic(run, rounds=1, iterations=1) == (9_999, 3_999_999)
+        assert two_sum_cross(a, b, self._TARGET) == [9_999, 3_999_999]
+
+
+class TestSlidingWindowPerformance:
+    """Sustained throughput over a 3M-event stream of values below 10^9."""
+
+    _EVENTS = 3_000_000
+
+    @staticmethod
+    def _workload() -> list[int]:
+        """Build a seeded random stream; pairs to 10^9 are rare."""
+        import random
+
+        rng = random.Random(42)
+        return [rng.randrange(1_000_000_000) for _ in range(3_000_000)]
+
+    @pytest.mark.benchmark(group="sliding-window")
+    @pytest.mark.parametrize("window", [10_000, 1_000_000], ids=["w10k", "w1m"])
+    def test_performance_windowed_two_sum(self, benchmark: Any, window: int) -> None:
+        """Benchmark the generator; events/sec is recorded in extra_info.
+
+        Every event past the first ``window`` evicts one, so the second
+        half of the run is all steady state even at W = 1M.
+        """
+        from src.sliding_window import windowed_two_sum
+
+        events = self._workload()
+
+        def run() -> int:
+            return sum(1 for _ in windowed_two_sum(events, 10**9, window))
+
+        benchmark.pedantic(run, rounds=1, iterations=1)
+        if benchmark.stats is not None:  # None under --benchmark-disable
+            seconds = benchmark.stats.stats.mean
+            benchmark.extra_info["events_per_second"] = round(self._EVENTS / seconds)
+
+    @pytest.mark.benchmark(group="sliding-window")
+    def test_performance_push_w10k(self, benchmark: Any) -> None:
+        """Benchmark one push call per event on the processor object."""
+        from src.sliding_window import SlidingWindowTwoSum
+
+        events = self._workload()
+
+        def run() -> int:
+            push = SlidingWindowTwoSum(10**9, 10_000).push
+            return sum(push(value) is not None for value in events)
+
+        benchmark.pedantic(run, rounds=1, iterations=1)
+        if benchmark.stats is not None:  # None under --benchmark-disable
+            seconds = benchmark.stats.stats.mean
+            benchmark.extra_info["events_per_second"] = round(self._EVENTS / seconds)
+
+
+class TestTwoSumParallelPerformance:
+    """Scaling of the partitioned multi-core engine (2M elements)."""
+
+    @pytest.mark.benchmark(group="parallel")
+    @pytest.mark.parametrize("workers", [1, 2, 4])
+    def test_performance_2m_parallel(self, benchmark: Any, workers: int) -> None:
+        """Benchmark two_sum_parallel with 1 to 4 worker processes.
+
+        The pool is started before timing so only the search is measured.
+        """
+        np = pytest.importorskip("numpy")
+        from concurrent.futures import ProcessPoolExecutor
+
+        from src.parallel import two_sum_parallel
+
+        rng = np.random.default_rng(8)
+        nums = rng.permutation(2_000_000).astype(np.int64)
+        target = int(nums[-2] + nums[-1])
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            result = benchmark.pedantic(
+                two_sum_parallel,
+                args=(nums, target),
+                kwargs={"workers": workers, "executor": pool},
+                rounds=3,
+                iterations=1,
+            )
+        assert nums[result[0]] + nums[result[1]] == target
+
+
+class TestMappedIndexPerformance:
+    """Reopening a persisted 4M-value index versus sorting the data again."""
+
+    # Even values only, so an odd target tries every candidate and misses
+    _SIZE = 4_000_000
+    _HIT = 2 * (_SIZE - 1) + 2 * (_SIZE - 2)
+
+    @staticmethod
+    def _workload() -> Any:
+        """Build a seeded permutation of the first 4M even numbers."""
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(11)
+        return rng.permutation(4_000_000).astype(np.int64) * 2
+
+    @pytest.mark.benchmark(group="mapped-index")
+    def test_performance_rebuild(self, benchmark: Any, tmp_path: Path) -> None:
+        """Benchmark the start-up being replaced: sort, write, open, query."""
+        from src.mapped_index import MappedTwoSumIndex, write_index
+
+        nums = self._workload()
+        path = tmp_path / "nums.idx"
+
+        def run() -> list[int] | None:
+            write_index(nums, path)
+            with MappedTwoSumIndex(path) as index:
+                return index.query(self._HIT)
+
+        result = benchmark.pedantic(run, rounds=1, iterations=1)
+        assert result is not None
+
+    @pytest.mark.benchmark(group="mapped-index")
+    @pytest.mark.parametrize("target", ["hit", "miss"])
+    def test_performance_reopen(
+        self, benchmark: Any, tmp_path: Path, target: str
+    ) -> None:
+        """Benchmark opening the written file and answering one query.
+
+        A hit near the top of the value range stops in the first search
+        chunk; the odd target binary-searches all 2M candidates.
+        """
+        from src.mapped_index import MappedTwoSumIndex, write_index
+
+        nums = self._workload()
+        path = tmp_path / "nums.idx"
+        write_index(nums, path)
+
+        def run() -> list[int] | None:
+            with MappedTwoSumIndex(path) as index:
+                return index.query(self._HIT if target == "hit" else self._SIZE + 1)
+
+        result = benchmark.pedantic(run, rounds=5, iterations=1)
+        assert (result is not None) == (target == "hit")
+
+
+class TestTwoSumBatchPerformance:
+    """Benchmarks for answering 10K targets against one 1M-element list."""
+
+    @staticmethod
+    def _workload() -> tuple[list[int], list[int]]:
+        """Build a seeded random 1M list and 10K targets inside its range."""
+        import random
+
+        rng = random.Random(42)
+        nums = [rng.randrange(1_000_000) for _ in range(1_000_000)]
+        targets = [rng.randrange(500_000, 1_500_000) for _ in range(10_000)]
+        return nums, targets
+
+    @pytest.mark.benchmark(group="batch")
+    def test_performance_10k_targets_two_sum_many(self, benchmark: Any) -> None:
+        """Benchmark two_sum_many: one index build, 10K queries."""
+        nums, targets = self._workload()
+
+        results = benchmark(two_sum_many, nums, targets)
+        assert len(results) == len(targets)
+        assert None not in results
+
+    @pytest.mark.benchmark(group="batch")
+    def test_performance_10k_targets_repeated_two_sum(self, benchmark: Any) -> None:
+        """Benchmark the baseline: one two_sum call per target."""
+        nums, targets = self._workload()
+
+        def run() -> list[list[int]]:
+            return [two_sum(nums, target) for target in targets]
+
+        results = benchmark.pedantic(run, rounds=1, iterations=1)
+        assert len(results) == len(targets)
+
+
+class TestTwoSumStatsPerformance:
+    """Cost of the opt-in instrumentation on a 1M-element worst case."""
+
+    @pytest.mark.benchmark(group="stats")
+    @pytest.mark.parametrize("enabled", [False, True], ids=["disabled", "enabled"])
+    def test_performance_1m_two_sum_stats(self, benchmark: Any, enabled: bool) -> None:
+        """Benchmark two_sum with stats=None against a TwoSumStats record.
+
+        Disabled, two_sum runs its uninstrumented loop. Enabled, the scan is
+        the same and the index is recounted afterwards.
+        """
+        from src.stats import TwoSumStats
+
+        nums = list(range(1_000_000))
+        target = nums[-2] + nums[-1]
+
+        def run() -> list[int]:
+            return two_sum(nums, target, stats=TwoSumStats() if enabled else None)
+
+        result = benchmark.pedantic(run, rounds=5, iterations=1)
+        assert result == [999_998, 999_999]
@@ -1,13 +1,22 @@
-"""Demo script for Two Sum implementation."""
+"""Command-line entry point for the Two Sum solver.
 
-from src.two_sum import (
-    two_sum,
-    two_sum_brute_force,
-    two_sum_generator
-)
+By default, reads NDJSON queries ``{"nums": [...], "target": t}`` from stdin
+and writes one ``{"result": [i, j]}`` (or ``{"error": ...}``) line per query
+to stdout, then prints a throughput and latency summary on stderr::
 
+    cat queries.ndjson | python main.py --workers 4 > results.ndjson
 
-def main() -> None:
+``--demo`` prints worked examples instead.
+"""
+
+import argparse
+import sys
+
+from src.batch import run_batch
+from src.two_sum import two_sum
+
+
+def demo() -> None:
     """Run examples demonstrating the Two Sum function."""
     print("=" * 60)
     print("TWO SUM - Challenge 2")
@@ -81,6 +90,37 @@ def main() -> None:
     print("🎨 Lint code with: uv run ruff check .")
 
 
-if __name__ == "__main__":
-    main()
+def main(argv: list[str] | None = None) -> int:
+    """Parse arguments and run the batch solver (or the demo).
 
+    Returns:
+        The process exit status.
+    """
+    parser = argparse.ArgumentParser(
+        description="Solve Two Sum queries streamed as NDJSON on stdin."
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="number of worker processes (default: 1, in-process)",
+    )
+    parser.add_argument(
+        "--demo", action="store_true", help="print worked examples and exit"
+    )
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error(f"--workers must be at least 1, got {args.workers}")
+
+    if args.demo:
+        demo()
+        return 0
+
+    summary = run_batch(sys.stdin.buffer, sys.stdout.buffer, workers=args.workers)
+    print(summary.format(), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
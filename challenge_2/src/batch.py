@@ -0,0 +1,156 @@
+"""Batch solving of Two Sum queries streamed as NDJSON.
+
+Each input line is a JSON object ``{"nums": [...], "target": t}``; each
+output line is ``{"result": [i, j]}`` or ``{"error": "..."}``, in input
+order. Lines are processed in batches so that reads and writes go through
+the buffered streams in large blocks, and batches can be fanned out to a
+process pool.
+"""
+
+import json
+import time
+from array import array
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import BinaryIO, NamedTuple
+
+from src.stats import percentile
+from src.two_sum import two_sum_hardened
+
+# Lines per unit of work: large enough to amortize pool dispatch and
+# write calls, small enough to keep memory bounded
+_BATCH_SIZE = 1024
+
+
+class BatchSummary(NamedTuple):
+    """Throughput and latency of a ``run_batch`` call.
+
+    Latencies cover parsing, solving and encoding one query, excluding the
+    time it spent waiting in a batch or in the pool queue.
+    """
+
+    queries: int
+    seconds: float
+    p50_ns: int
+    p99_ns: int
+
+    @property
+    def queries_per_second(self) -> float:
+        """Queries completed per wall-clock second."""
+        return self.queries / self.seconds if self.seconds > 0 else 0.0
+
+    def format(self) -> str:
+        """Render the summary as a single human-readable line."""
+        return (
+            f"{self.queries} queries in {self.seconds:.3f}s "
+            f"({self.queries_per_second:,.0f} queries/s), "
+            f"latency p50 {self.p50_ns / 1000:.1f}us, "
+            f"p99 {self.p99_ns / 1000:.1f}us"
+        )
+
+
+def solve_line(line: bytes) -> bytes:
+    """Answer one NDJSON query, returning the encoded result line.
+
+    Uses ``two_sum_hardened``, since queries may come from untrusted
+    sources. Malformed queries and queries without a solution produce an
+    ``{"error": ...}`` line instead of stopping the batch.
+    """
+    try:
+        query = json.loads(line)
+        nums, target = query["nums"], query["target"]
+        # bool is an int subclass: JSON true/false must not pass as 1/0
+        if (
+            not isinstance(nums, list)
+            or type(target) is not int
+            or not set(map(type, nums)) <= {int}
+        ):
+            raise TypeError(
+                "expected a list of integers 'nums' and an integer 'target'"
+            )
+        answer: dict[str, object] = {"result": two_sum_hardened(nums, target)}
+    except KeyError as error:
+        answer = {"error": f"missing field {error}"}
+    except (ValueError, TypeError, RecursionError) as error:
+        # json.JSONDecodeError is a ValueError; deeply nested input exceeds
+        # the decoder's recursion limit
+        answer = {"error": str(error)}
+    return json.dumps(answer, separators=(",", ":")).encode() + b"\n"
+
+
+def _solve_batch(lines: list[bytes]) -> tuple[bytes, array[int]]:
+    """Solve a batch of lines, returning the joined output and latencies."""
+    clock = time.perf_counter_ns
+    output = []
+    latencies = array("q")
+    for line in lines:
+        start = clock()
+        output.append(solve_line(line))
+        latencies.append(clock() - start)
+    return b"".join(output), latencies
+
+
+def _batches(source: BinaryIO) -> Iterator[list[bytes]]:
+    """Yield non-blank input lines in lists of ``_BATCH_SIZE``."""
+    lines = (line for line in source if not line.isspace())
+    while batch := list(islice(lines, _BATCH_SIZE)):
+        yield batch
+
+
+def run_batch(source: BinaryIO, sink: BinaryIO, *, workers: int = 1) -> BatchSummary:
+    """Stream NDJSON queries from source and write one result line each.
+
+    Args:
+        source: Binary stream of NDJSON queries, e.g. ``sys.stdin.buffer``.
+            Blank lines are skipped.
+        sink: Binary stream receiving the result lines in input order.
+        workers: Number of processes. With 1, queries are solved in the
+            calling process; otherwise batches are spread over a pool, with
+            at most two batches per worker in flight.
+
+    Returns:
+        The number of queries, elapsed wall time and latency percentiles.
+
+    Raises:
+        ValueError: If workers is less than 1.
+
+    Time Complexity: O(total query size) - each query is solved once
+    Space Complexity: O(workers * batch size) for the queries in flight,
+        plus 8 bytes of latency per query
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+
+    latencies = array("q")
+    started = time.perf_counter()
+
+    if workers == 1:
+        for batch in _batches(source):
+            output, timings = _solve_batch(batch)
+            sink.write(output)
+            latencies.extend(timings)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending: deque[Future[tuple[bytes, array[int]]]] = deque()
+            for batch in _batches(source):
+                pending.append(pool.submit(_solve_batch, batch))
+                if len(pending) >= 2 * workers:
+                    output, timings = pending.popleft().result()
+                    sink.write(output)
+                    latencies.extend(timings)
+            while pending:
+                output, timings = pending.popleft().result()
+                sink.write(output)
+                latencies.extend(timings)
+
+    sink.flush()
+    seconds = time.perf_counter() - started
+    ordered = sorted(latencies)
+    return BatchSummary(
+        queries=len(ordered),
+        seconds=seconds,
+        p50_ns=percentile(ordered, 0.50),
+        p99_ns=percentile(ordered, 0.99),
+    )
@@ -0,0 +1,190 @@
+"""Compact open-addressing hash table for integer keys.
+
+This module provides ``CompactIndexTable``, a memory-lean replacement for
+the ``dict[int, int]`` value -> index maps used by the Two Sum engines.
+"""
+
+import sys
+from array import array
+from collections.abc import Iterator
+
+# Slot markers stored in the value array; real values are indices (>= 0)
+_EMPTY = -1
+_DELETED = -2
+
+# 2**64 / golden ratio, used for Fibonacci hashing of the keys
+_FIBONACCI_MULTIPLIER = 0x9E3779B97F4A7C15
+_UINT64_MASK = (1 << 64) - 1
+
+_MIN_CAPACITY = 8
+
+
+class CompactIndexTable:
+    """Open-addressing hash table mapping int64 keys to non-negative ints.
+
+    A ``dict[int, int]`` costs roughly 100 bytes per entry once the boxed
+    int objects for keys and values are counted. This table stores keys and
+    values unboxed in two ``array("q")`` buffers, 16 bytes per slot, and
+    keeps the load factor between 3/8 and 3/4, i.e. about 21-43 bytes per
+    entry. Slots are found with Fibonacci hashing and linear probing;
+    deletions leave tombstones that are cleaned up on the next resize.
+
+    The trade-off is speed: probing runs in Python, so operations are about
+    an order of magnitude slower than the C-implemented dict. Use it when
+    the index would not otherwise fit in memory.
+
+    Keys must fit in a signed 64-bit integer and values must be in
+    ``[0, 2**63)``; anything else raises ``OverflowError`` or ``ValueError``.
+
+    Time Complexity: O(1) expected per operation, amortized over resizes
+    Space Complexity: O(n) - 16 bytes per slot, at most 8/3 slots per entry
+
+    Examples:
+        >>> table = CompactIndexTable()
+        >>> table[7] = 0
+        >>> table.get(7), table.get(8)
+        (0, None)
+        >>> len(table)
+        1
+    """
+
+    def __init__(self, capacity: int = 0) -> None:
+        """Create an empty table.
+
+        Args:
+            capacity: Number of entries to pre-size for, avoiding resizes
+                when the final size is known up front.
+        """
+        size = _MIN_CAPACITY
+        while size * 3 < capacity * 4:
+            size *= 2
+        self._allocate(size)
+
+    def __len__(self) -> int:
+        """Return the number of stored keys."""
+        return self._used
+
+    def __contains__(self, key: int) -> bool:
+        """Return True if key is stored."""
+        return self.get(key) is not None
+
+    def __getitem__(self, key: int) -> int:
+        """Return the value stored for key.
+
+        Raises:
+            KeyError: If key is not stored.
+        """
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: int, value: int) -> None:
+        """Store value for key, replacing any previous value."""
+        if value < 0:
+            raise ValueError(f"Values must be non-negative, got {value}")
+        if (self._filled + 1) * 4 > self._capacity * 3:
+            self._resize()
+
+        keys = self._keys
+        values = self._values
+        mask = self._capacity - 1
+        slot = ((key * _FIBONACCI_MULTIPLIER) & _UINT64_MASK) >> self._shift
+        tombstone = -1
+        while True:
+            current = values[slot]
+            if current == _EMPTY:
+                break
+            if current == _DELETED:
+                if tombstone < 0:
+                    tombstone = slot
+            elif keys[slot] == key:
+                values[slot] = value
+                return
+            slot = (slot + 1) & mask
+
+        if tombstone >= 0:
+            slot = tombstone
+        else:
+            self._filled += 1
+        keys[slot] = key
+        values[slot] = value
+        self._used += 1
+
+    def __delitem__(self, key: int) -> None:
+        """Remove key, leaving a tombstone in its slot.
+
+        Raises:
+            KeyError: If key is not stored.
+        """
+        slot = self._find(key)
+        if slot < 0:
+            raise KeyError(key)
+        self._values[slot] = _DELETED
+        self._used -= 1
+
+    def get(self, key: int, default: int | None = None) -> int | None:
+        """Return the value for key, or default if key is not stored."""
+        slot = self._find(key)
+        return default if slot < 0 else self._values[slot]
+
+    def items(self) -> Iterator[tuple[int, int]]:
+        """Yield (key, value) pairs in slot order."""
+        keys = self._keys
+        for slot, value in enumerate(self._values):
+            if value >= 0:
+                yield keys[slot], value
+
+    @property
+    def nbytes(self) -> int:
+        """Memory footprint in bytes, including the array objects."""
+        return sys.getsizeof(self._keys) + sys.getsizeof(self._values)
+
+    def _find(self, key: int) -> int:
+        """Return the slot holding key, or -1 if it is not stored."""
+        keys = self._keys
+        values = self._values
+        mask = self._capacity - 1
+        slot = ((key * _FIBONACCI_MULTIPLIER) & _UINT64_MASK) >> self._shift
+        while True:
+            current = values[slot]
+            if current == _EMPTY:
+                return -1
+            if current != _DELETED and keys[slot] == key:
+                return slot
+            slot = (slot + 1) & mask
+
+    def _allocate(self, capacity: int) -> None:
+        """Replace the buffers with empty ones of the given power-of-2 size."""
+        self._capacity = capacity
+        # Fibonacci hashing keeps the top log2(capacity) bits of the product
+        self._shift = 65 - capacity.bit_length()
+        self._keys = array("q", bytes(8 * capacity))
+        self._values = array("q", [_EMPTY]) * capacity
+        self._used = 0
+        self._filled = 0  # used slots plus tombstones
+
+    def _resize(self) -> None:
+        """Rehash live entries into a table at most 3/8 full."""
+        old_keys, old_values = self._keys, self._values
+        capacity = _MIN_CAPACITY
+        while capacity * 3 < self._used * 8:
+            capacity *= 2
+        self._allocate(capacity)
+
+        keys = self._keys
+        values = self._values
+        mask = capacity - 1
+        shift = self._shift
+        # The new table has no tombstones or duplicates: take the first gap
+        for old_slot, value in enumerate(old_values):
+            if value < 0:
+                continue
+            key = old_keys[old_slot]
+            slot = ((key * _FIBONACCI_MULTIPLIER) & _UINT64_MASK) >> shift
+            while values[slot] != _EMPTY:
+                slot = (slot + 1) & mask
+            keys[slot] = key
+            values[slot] = value
+            self._used += 1
+        self._filled = self._used
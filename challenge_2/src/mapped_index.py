@@ -0,0 +1,422 @@
+"""Persisted Two Sum index that is memory-mapped instead of rebuilt.
+
+``write_index`` sorts the values once and saves them, together with their
+original positions, in a small binary file. ``MappedTwoSumIndex`` maps that
+file read-only and answers queries directly against the mapped pages, so
+opening even a very large index costs a header check rather than a sort.
+
+File layout (all fields little-endian)::
+
+    offset  size  field
+         0     8  magic b"TWOSUMIX"
+         8     4  format version
+        12     4  header size (64)
+        16     8  number of values n
+        24    16  blake2b-128 checksum of the two arrays below
+        40    16  blake2b-128 digest of the source values, in input order
+        56     8  reserved (zero)
+        64    8n  int64 values, ascending
+      64+8n   8n  int64 original index of each value (stable order)
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
+from types import TracebackType
+from typing import Any, Self
+
+from src.two_sum import as_int_array, require_numpy, two_sum
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError:  # pragma: no cover - exercised only without the extra
+    np = None  # type: ignore[assignment]
+
+_MAGIC = b"TWOSUMIX"
+
+# Bump whenever the layout or the meaning of a field changes; files written
+# with another version are rejected instead of being misread
+_FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sIIQ16s16s8x")
+_HEADER_SIZE = _HEADER.size
+
+_DIGEST_SIZE = 16
+
+# Candidates searched by the first vectorized step of a query; later steps
+# double up to _CHUNK_SIZE
+_FIRST_CHUNK_SIZE = 1 << 10
+
+# Elements converted or searched per vectorized step
+_CHUNK_SIZE = 1 << 20
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+# Bytes hashed per step when checksumming the mapped payload
+_CHECKSUM_CHUNK_SIZE = 1 << 24
+
+
+def _hasher() -> "hashlib.blake2b":
+    """Return the hash used for both header digests."""
+    return hashlib.blake2b(digest_size=_DIGEST_SIZE)
+
+
+def _int64_bytes(values: Sequence[int]) -> bytes:
+    """Pack ints as little-endian int64 bytes."""
+    packed = array("q", values)
+    if sys.byteorder == "big":  # pragma: no cover - big-endian hosts only
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def source_digest(nums: "Sequence[int] | npt.NDArray[Any]") -> bytes:
+    """Return the digest an index file records for its source values.
+
+    The digest covers the values in input order as little-endian int64, so
+    it changes whenever any value is edited, inserted, removed or moved.
+
+    Args:
+        nums: The values an index was (or would be) built from.
+
+    Returns:
+        A 16-byte blake2b digest.
+
+    Raises:
+        OverflowError: If a value does not fit in int64.
+
+    Time Complexity: O(n)
+    Space Complexity: O(1) beyond one chunk of the input
+
+    Examples:
+        >>> source_digest([1, 2]) == source_digest([1, 2])
+        True
+        >>> source_digest([1, 2]) == source_digest([2, 1])
+        False
+    """
+    digest = _hasher()
+    if np is not None and isinstance(nums, np.ndarray):
+        arr = as_int_array(nums)
+        _check_int64_range(arr)
+        for start in range(0, len(arr), _CHUNK_SIZE):
+            digest.update(arr[start : start + _CHUNK_SIZE].astype("<i8").data)
+        return digest.digest()
+    for start in range(0, len(nums), _CHUNK_SIZE):
+        digest.update(_int64_bytes(nums[start : start + _CHUNK_SIZE]))
+    return digest.digest()
+
+
+def _check_int64_range(arr: "npt.NDArray[Any]") -> None:
+    """Raise OverflowError for uint64 values that int64 cannot hold."""
+    if arr.dtype == np.uint64 and len(arr) and int(arr.max()) > _INT64_MAX:
+        raise OverflowError("Index values must fit in int64")
+
+
+def write_index(
+    nums: "Sequence[int] | npt.NDArray[Any]",
+    path: str | os.PathLike[str],
+    *,
+    vectorized: bool | None = None,
+) -> None:
+    """Sort nums once and save the result as a mappable index file.
+
+    The file is written next to ``path`` and renamed over it when complete,
+    so a crash mid-write never leaves a truncated index behind.
+
+    Args:
+        nums: One-dimensional int64-range integers (sequence or ndarray).
+        path: Destination file.
+        vectorized: Sort with NumPy (``argsort``) or in pure Python. None
+            uses NumPy when it is installed.
+
+    Raises:
+        OverflowError: If a value does not fit in int64.
+        ImportError: If vectorized is True and NumPy is not installed.
+
+    Time Complexity: O(n log n) - one stable sort
+    Space Complexity: O(n)
+
+    Examples:
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "nums.idx")
+        >>> write_index([5, 1, 4], path)
+        >>> with MappedTwoSumIndex(path) as index:
+        ...     index.query(9), index.query(2)
+        ([0, 2], None)
+    """
+    if vectorized is None:
+        vectorized = np is not None
+    if vectorized:
+        require_numpy("write_index(vectorized=True)")
+        arr = as_int_array(nums)
+        _check_int64_range(arr)
+        order = np.argsort(arr, kind="stable")
+        chunks: Iterator[bytes | memoryview] = (
+            part.astype("<i8").data for part in (arr[order], order)
+        )
+        count = len(arr)
+    else:
+        if np is not None and isinstance(nums, np.ndarray):
+            values = nums.tolist()
+        else:
+            values = list(nums)
+        ranks = sorted(range(len(values)), key=values.__getitem__)
+        chunks = iter((_int64_bytes([values[i] for i in ranks]), _int64_bytes(ranks)))
+        count = len(values)
+
+    digest = source_digest(nums)
+    checksum = _hasher()
+    partial = f"{os.fspath(path)}.partial"
+    with open(partial, "wb") as file:
+        file.write(bytes(_HEADER_SIZE))
+        for chunk in chunks:
+            checksum.update(chunk)
+            file.write(chunk)
+        file.seek(0)
+        file.write(
+            _HEADER.pack(
+                _MAGIC,
+                _FORMAT_VERSION,
+                _HEADER_SIZE,
+                count,
+                checksum.digest(),
+                digest,
+            )
+        )
+    os.replace(partial, path)
+
+
+class MappedTwoSumIndex:
+    """Read-only Two Sum index served from a memory-mapped file.
+
+    Opening validates the header (magic, format version and file size)
+    and maps the file; nothing is read or sorted up front, so start-up
+    time does not depend on the index size. Pages are faulted in by the
+    queries that touch them and shared with every other process mapping
+    the same file.
+
+    A query binary-searches the partner of each candidate value in the
+    sorted array. With NumPy this runs vectorized over chunks of
+    candidates; without it a two-pointer scan reads the mapped values in
+    place. Both report the same pair.
+
+    Staleness is detected two ways. Passing the current data as
+    ``source`` compares its digest with the one recorded at write time,
+    and ``verify=True`` recomputes the payload checksum to catch files
+    that were corrupted or edited after writing. Both cost one
+    pass over the data, so they are opt-in.
+
+    Time Complexity: O(1) to open; O(k log n) per query, where k is the
+        number of candidate values tried before the pair (at most n / 2)
+    Space Complexity: O(1) beyond the mapping
+
+    Examples:
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "nums.idx")
+        >>> write_index([2, 7, 11, 15], path)
+        >>> index = MappedTwoSumIndex(path, source=[2, 7, 11, 15])
+        >>> len(index), index.query(26)
+        (4, [2, 3])
+        >>> index.close()
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        source: "Sequence[int] | npt.NDArray[Any] | None" = None,
+        verify: bool = False,
+        vectorized: bool | None = None,
+    ) -> None:
+        """Map an index file written by ``write_index``.
+
+        Args:
+            path: Index file to open.
+            source: The data the index is expected to describe. If given,
+                a file built from anything else is rejected as stale.
+            verify: Recompute the payload checksum and reject mismatches.
+            vectorized: Query with NumPy or in pure Python. None uses
+                NumPy when it is installed.
+
+        Raises:
+            ValueError: If the file is not an index, was written with
+                another format version, is truncated, fails verification
+                or does not match source.
+            ImportError: If vectorized is True and NumPy is not installed.
+        """
+        if vectorized is None:
+            vectorized = np is not None
+        elif vectorized:
+            require_numpy("MappedTwoSumIndex(vectorized=True)")
+        self.path = os.fspath(path)
+        self._vectorized = vectorized
+
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < _HEADER_SIZE:
+                raise ValueError(f"{self.path} is not a two_sum index file")
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._count, self.checksum, self.source_digest = self._read_header(size)
+            if verify:
+                self._verify_checksum()
+            if source is not None and source_digest(source) != self.source_digest:
+                raise ValueError(
+                    f"{self.path} is stale: it was built from different values"
+                )
+        except BaseException:
+            self._mmap.close()
+            raise
+
+        payload = _HEADER_SIZE + 8 * self._count
+        self._values: Any
+        self._order: Any
+        if vectorized:
+            self._values = np.frombuffer(
+                self._mmap, dtype="<i8", count=self._count, offset=_HEADER_SIZE
+            )
+            self._order = np.frombuffer(
+                self._mmap, dtype="<i8", count=self._count, offset=payload
+            )
+        elif sys.byteorder == "little":
+            with memoryview(self._mmap) as view:
+                self._values = view[_HEADER_SIZE:payload].cast("q")
+                self._order = view[payload : payload + 8 * self._count].cast("q")
+        else:  # pragma: no cover - big-endian hosts only
+            self._values = array("q", self._mmap[_HEADER_SIZE:payload])
+            self._order = array("q", self._mmap[payload : payload + 8 * self._count])
+            self._values.byteswap()
+            self._order.byteswap()
+
+    def _read_header(self, size: int) -> tuple[int, bytes, bytes]:
+        """Validate the header against the file; return its fields."""
+        magic, version, header_size, count, checksum, digest = _HEADER.unpack_from(
+            self._mmap
+        )
+        if magic != _MAGIC:
+            raise ValueError(f"{self.path} is not a two_sum index file")
+        if version != _FORMAT_VERSION or header_size != _HEADER_SIZE:
+            raise ValueError(
+                f"{self.path} has index format version {version}, "
+                f"expected {_FORMAT_VERSION}; rebuild it with write_index"
+            )
+        expected = _HEADER_SIZE + 16 * count
+        if size != expected:
+            raise ValueError(
+                f"{self.path} is truncated or padded: {size} bytes, "
+                f"expected {expected} for {count} values"
+            )
+        return count, checksum, digest
+
+    def _verify_checksum(self) -> None:
+        """Hash the mapped payload and compare it with the header."""
+        checksum = _hasher()
+        with memoryview(self._mmap) as view:
+            for start in range(_HEADER_SIZE, len(view), _CHECKSUM_CHUNK_SIZE):
+                with view[start : start + _CHECKSUM_CHUNK_SIZE] as block:
+                    checksum.update(block)
+        if checksum.digest() != self.checksum:
+            raise ValueError(f"{self.path} failed its checksum; rebuild it")
+
+    def __len__(self) -> int:
+        """Return the number of indexed values."""
+        return self._count
+
+    def __enter__(self) -> Self:
+        """Return the index itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the mapping."""
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """Whether ``close`` has been called."""
+        return self._mmap.closed
+
+    def close(self) -> None:
+        """Unmap the file. Further queries raise ValueError."""
+        if self._mmap.closed:
+            return
+        for view in (self._values, self._order):
+            if isinstance(view, memoryview):
+                view.release()
+        # NumPy views keep the mapping exported until the last one is dropped
+        del view
+        self._values = self._order = ()
+        self._mmap.close()
+
+    def query(self, target: int) -> list[int] | None:
+        """Find two indexed values summing to target.
+
+        Args:
+            target: Target sum to find.
+
+        Returns:
+            [i, j] with i < j, original indices of two values summing to
+            target, or None. Among all pairs, the one whose smaller value
+            is smallest is reported, with the last occurrence of its
+            partner.
+
+        Raises:
+            ValueError: If the index has been closed.
+        """
+        if self._mmap.closed:
+            raise ValueError("I/O operation on closed index")
+        values = self._values
+        if self._count < 2:
+            return None
+        if not 2 * int(values[0]) <= target <= 2 * int(values[-1]):
+            return None
+        if self._vectorized:
+            found = self._search_np(target)
+        else:
+            try:
+                found = two_sum(values, target, presorted=True)
+            except ValueError:
+                return None
+        if found is None:
+            return None
+        i, j = (int(self._order[position]) for position in found)
+        return [i, j] if i < j else [j, i]
+
+    def _search_np(self, target: int) -> list[int] | None:
+        """Chunked binary search for the partner of each candidate.
+
+        Candidates are the values in [target - max, target / 2]; for each
+        one the last occurrence of its partner is looked up, and the first
+        candidate whose partner exists at a later position wins, exactly as
+        in the two-pointer scan. Chunks start small and double, so an early
+        hit only touches a few pages.
+        """
+        values = self._values
+        first = int(np.searchsorted(values, max(target - int(values[-1]), _INT64_MIN)))
+        last = int(np.searchsorted(values, target // 2, side="right"))
+        # target may exceed int64; its halves cannot, and array arithmetic
+        # wraps, so (half - v) + rest lands on the in-range complement
+        half = np.int64(target // 2)
+        rest = np.int64(target - target // 2)
+        start, size = first, _FIRST_CHUNK_SIZE
+        while start < last:
+            stop = min(start + size, last)
+            complements = (half - values[start:stop]) + rest
+            partners = np.searchsorted(values, complements, side="right") - 1
+            hits = (partners > np.arange(start, stop)) & (
+                values[partners] == complements
+            )
+            if hits.any():
+                offset = int(hits.argmax())
+                return [start + offset, int(partners[offset])]
+            start, size = stop, min(2 * size, _CHUNK_SIZE)
+        return None
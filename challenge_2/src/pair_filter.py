@@ -0,0 +1,116 @@
+"""Prefilter that rejects Two Sum targets no pair of values can reach.
+
+This module provides ``PairSumFilter``, a Bloom-style filter over a fixed
+set of values that answers "might two of them sum to target?" without
+scanning the values.
+"""
+
+from collections.abc import Iterable
+
+# Moduli that expose common strides in the data (multiples of 2, 3, 5, 7)
+_SMALL_MODULI = (64, 81, 25, 49)
+
+# Largest modulus of the sparse filter: 4M bits, a 512 KB bitmask
+_MAX_SPARSE_MODULUS = 1 << 22
+
+# The sparse modulus is about this many times the number of value pairs
+_SPARSE_BITS_PER_PAIR = 16
+
+
+class PairSumFilter:
+    """Filter answering "might two values sum to target?" in O(1).
+
+    A Bloom filter over the values, with residues ``x mod m`` as its hash
+    functions, has a useful property: residues add up, so the residues of
+    every pair sum can be computed from the residues of the values alone.
+    For each modulus the filter keeps that pair-sum residue set as a bitmask
+    (built with one rotation of the value bitmask per distinct residue). A
+    target whose residue is missing from any bitmask, or that lies outside
+    ``[2 * min, 2 * max]``, has no solution.
+
+    The filter is sound: it never rejects a target that has a pair. How much
+    it rejects depends on the data:
+
+    - Values sharing a stride or residue (all even, prices in multiples
+      of 5, aligned offsets) are caught by the small moduli.
+    - Small value sets get an extra prime modulus of about 16 bits per value
+      pair, so roughly 1 in 16 impossible targets gets through.
+    - Large sets of unstructured values fill every bitmask, and only the
+      min/max check rejects anything.
+
+    Time Complexity:
+        construction: O(d + sum over moduli of r * m / w) for d distinct
+            values, r distinct residues and machine word size w
+        might_have_pair: O(1)
+    Space Complexity: O(m) bits per modulus, at most 512 KB in total
+
+    Examples:
+        >>> pairs = PairSumFilter([10, 20, 35])
+        >>> pairs.might_have_pair(30), pairs.might_have_pair(31)
+        (True, False)
+    """
+
+    def __init__(self, values: Iterable[int]) -> None:
+        """Build the filter for a fixed collection of values.
+
+        Args:
+            values: The values to index. Duplicates are ignored: the filter
+                treats every value as usable twice, which keeps it sound.
+
+        Raises:
+            ValueError: If values is empty.
+        """
+        distinct = set(values)
+        if not distinct:
+            raise ValueError("PairSumFilter needs at least 1 value")
+
+        self._lowest = 2 * min(distinct)
+        self._highest = 2 * max(distinct)
+
+        moduli = list(_SMALL_MODULI)
+        pairs = len(distinct) * (len(distinct) + 1) // 2
+        if pairs * _SPARSE_BITS_PER_PAIR <= _MAX_SPARSE_MODULUS:
+            moduli.append(_next_prime(pairs * _SPARSE_BITS_PER_PAIR))
+        # Stored as bytes: testing a bit of a big int would copy it
+        self._masks = [
+            (m, _pair_sum_residues(distinct, m).to_bytes((m + 7) // 8, "little"))
+            for m in moduli
+        ]
+
+    def might_have_pair(self, target: int) -> bool:
+        """Return False only if no two values can sum to target."""
+        if not self._lowest <= target <= self._highest:
+            return False
+        for modulus, mask in self._masks:
+            residue = target % modulus
+            if not mask[residue >> 3] >> (residue & 7) & 1:
+                return False
+        return True
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the residue bitmasks in bytes."""
+        return sum(len(mask) for _, mask in self._masks)
+
+
+def _pair_sum_residues(values: set[int], modulus: int) -> int:
+    """Return a bitmask of ``(a + b) % modulus`` over all a, b in values."""
+    residues = {value % modulus for value in values}
+    bits = 0
+    for residue in residues:
+        bits |= 1 << residue
+
+    # Adding residue r rotates the residue set left by r positions
+    mask = (1 << modulus) - 1
+    sums = 0
+    for residue in residues:
+        sums |= ((bits << residue) & mask) | (bits >> (modulus - residue))
+    return sums
+
+
+def _next_prime(n: int) -> int:
+    """Return the smallest prime >= n (trial division; n is at most 2**22)."""
+    candidate = max(n, 2)
+    while any(candidate % d == 0 for d in range(2, int(candidate**0.5) + 1)):
+        candidate += 1
+    return candidate
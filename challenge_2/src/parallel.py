@@ -0,0 +1,181 @@
+"""Multi-core Two Sum using a process pool and shared memory.
+
+The input is copied once into a ``multiprocessing.shared_memory`` block and
+split into value-range partitions that worker processes solve concurrently.
+Requires NumPy (the optional ``numpy`` extra).
+"""
+
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+from src.two_sum import as_int_array, require_numpy, two_sum_np
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError:  # pragma: no cover - exercised only without the extra
+    np = None  # type: ignore[assignment]
+
+# Inputs smaller than this are solved in-process: pool dispatch would cost
+# more than the search itself
+_PARALLEL_MIN_SIZE = 1 << 16
+
+# Elements per step when a worker scans the shared array for its partition
+_SCAN_CHUNK_SIZE = 1 << 20
+
+# Elements sampled to place the partition boundaries
+_SAMPLE_SIZE = 1 << 16
+
+# |2 * x - target| must fit in int64 for the partitioning arithmetic
+_SAFE_MAGNITUDE = 1 << 61
+
+
+def two_sum_parallel(
+    nums: "npt.ArrayLike",
+    target: int,
+    *,
+    workers: int | None = None,
+    executor: Executor | None = None,
+) -> list[int]:
+    """Solve Two Sum on several cores with value-range partitions.
+
+    For a pair x + y == target, x and y sit at the same distance from
+    target / 2, i.e. ``|2x - target| == |2y - target|``. Grouping elements
+    by that distance therefore splits the values into partitions where the
+    value range P below target / 2 travels with its mirror target - P
+    above it, and every pair lies entirely inside one partition.
+
+    The data is copied once into shared memory; each worker attaches to it
+    by name (nothing is pickled but a few scalars), collects the indices of
+    its partition in ascending order and runs ``two_sum_np`` on them. Since
+    that keeps relative order, each partition reports the same pair
+    ``two_sum`` would find among its elements, and the pair with the
+    smallest j across partitions is exactly the ``two_sum`` result.
+
+    Args:
+        nums: One-dimensional integer data (list, ndarray or buffer).
+        target: Target sum to find.
+        workers: Number of partitions / processes. Defaults to
+            ``os.cpu_count()``. With 1, or for small inputs, the search runs
+            in the calling process.
+        executor: Optional pool to reuse across calls (e.g. a
+            ``ProcessPoolExecutor``). A temporary one is created otherwise.
+
+    Returns:
+        List containing two indices [i, j] where nums[i] + nums[j] == target,
+        identical to ``two_sum(list(nums), target)``.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        TypeError: If nums does not contain integers.
+        ValueError: If nums has fewer than 2 elements.
+        ValueError: If no solution exists.
+
+    Time Complexity: O(n + (n / p) log(n / p)) per worker with p workers
+    Space Complexity: O(n) - one shared copy plus each partition's index
+    """
+    require_numpy("two_sum_parallel")
+    arr = as_int_array(nums)
+    partitions = workers if workers is not None else os.cpu_count() or 1
+    if partitions < 1:
+        raise ValueError(f"workers must be at least 1, got {partitions}")
+
+    n = arr.size
+    if partitions == 1 or n < max(_PARALLEL_MIN_SIZE, 2):
+        return two_sum_np(arr, target)
+
+    lo, hi = int(arr.min()), int(arr.max())
+    if not 2 * lo <= target <= 2 * hi:
+        raise ValueError(f"No two numbers in the list sum to {target}")
+    if max(-lo, hi) >= _SAFE_MAGNITUDE or abs(target) >= _SAFE_MAGNITUDE:
+        return two_sum_np(arr, target)
+
+    bounds = _partition_bounds(arr, target, partitions)
+    shared = SharedMemory(create=True, size=n * 8)
+    try:
+        view: npt.NDArray[Any] = np.ndarray((n,), dtype=np.int64, buffer=shared.buf)
+        view[:] = arr
+        del view  # release the export so the block can be closed
+
+        pool = executor or ProcessPoolExecutor(max_workers=len(bounds))
+        try:
+            futures = [
+                pool.submit(_solve_partition, shared.name, n, target, low, high)
+                for low, high in bounds
+            ]
+            pairs = [pair for f in futures if (pair := f.result()) is not None]
+        finally:
+            if executor is None:
+                pool.shutdown()
+    finally:
+        shared.close()
+        shared.unlink()
+
+    if not pairs:
+        raise ValueError(f"No two numbers in the list sum to {target}")
+    i, j = min(pairs, key=lambda pair: pair[1])
+    return [i, j]
+
+
+def _partition_bounds(
+    arr: "npt.NDArray[Any]", target: int, partitions: int
+) -> list[tuple[int, int]]:
+    """Split distances ``|2x - target|`` into ranges of similar size.
+
+    Boundaries are quantiles of an evenly spaced sample, so skewed inputs
+    still give balanced partitions. Returns half-open [low, high) ranges
+    covering every distance.
+    """
+    step = max(1, arr.size // _SAMPLE_SIZE)
+    sample = np.abs(2 * arr[::step].astype(np.int64) - target)
+    edges = np.unique(
+        np.quantile(sample, np.linspace(0, 1, partitions + 1)[1:-1]).astype(np.int64)
+    ).tolist()
+    cuts = [0, *edges, 2 * _SAFE_MAGNITUDE + abs(target) + 1]
+    return [
+        (low, high) for low, high in zip(cuts, cuts[1:], strict=False) if low < high
+    ]
+
+
+def _attach(name: str) -> SharedMemory:
+    """Attach to an existing shared memory block without owning it."""
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    # Pool workers share the parent's resource tracker, so the registration
+    # made here duplicates the parent's and the parent's unlink clears it
+    return SharedMemory(name=name)
+
+
+def _solve_partition(
+    name: str, size: int, target: int, low: int, high: int
+) -> tuple[int, int] | None:
+    """Worker: solve the partition with ``low <= |2x - target| < high``.
+
+    Returns the ``two_sum`` pair among the partition's elements as global
+    indices, or None if the partition holds no pair.
+    """
+    shared = _attach(name)
+    try:
+        arr: npt.NDArray[Any] = np.ndarray((size,), dtype=np.int64, buffer=shared.buf)
+        pieces = []
+        for start in range(0, size, _SCAN_CHUNK_SIZE):
+            chunk = arr[start : start + _SCAN_CHUNK_SIZE]
+            distance = np.abs(2 * chunk - target)
+            mask = (distance >= low) & (distance < high)
+            pieces.append(np.flatnonzero(mask) + start)
+        indices = np.concatenate(pieces)
+        values = arr[indices]  # a private copy, independent of the block
+        del arr, chunk
+    finally:
+        shared.close()
+
+    if indices.size < 2:
+        return None
+    try:
+        i, j = two_sum_np(values, target)
+    except ValueError:
+        return None
+    return int(indices[i]), int(indices[j])
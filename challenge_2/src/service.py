@@ -0,0 +1,345 @@
+"""Asyncio front end that solves Two Sum requests off the event loop.
+
+``TwoSumService`` accepts requests from many coroutines (e.g. HTTP
+handlers) through a bounded queue, groups requests that carry the same
+array into micro-batches, and solves each batch with ``two_sum_many`` in a
+process pool, so the event loop never runs the CPU-bound search.
+
+``generate_load`` drives a service with concurrent clients and reports
+throughput and latency; ``python -m src.service`` runs it locally.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import os
+import random
+import time
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from types import TracebackType
+from typing import NamedTuple, Self
+
+from src.batch import BatchSummary
+from src.stats import percentile
+from src.two_sum import two_sum_many
+
+
+class _Request(NamedTuple):
+    """A queued query and the future its caller is waiting on."""
+
+    fingerprint: bytes
+    nums: list[int]
+    target: int
+    future: "asyncio.Future[list[int]]"
+
+
+def _check_ints(nums: Sequence[int]) -> None:
+    """Raise TypeError unless every element is a plain int (not a bool)."""
+    kinds = set(map(type, nums))
+    if not kinds <= {int}:
+        bad = min(kind.__name__ for kind in kinds - {int})
+        raise TypeError(f"Input must contain integers, got {bad}")
+
+
+def _fingerprint(nums: Sequence[int]) -> bytes:
+    """Return a 128-bit digest identifying the contents of nums.
+
+    Arrays that fit in int64 are hashed as packed bytes, others by their
+    repr. The encoding tag and the length are hashed first, so the two
+    encodings can never produce the same input to the digest.
+    """
+    try:
+        tag, data = b"q", array("q", nums).tobytes()
+    except OverflowError:
+        tag, data = b"r", repr(list(nums)).encode()
+    digest = hashlib.blake2b(tag + len(nums).to_bytes(8, "little"), digest_size=16)
+    digest.update(data)
+    return digest.digest()
+
+
+def _cancel_queued(queue: "asyncio.Queue[_Request]") -> None:
+    """Cancel every request left in the queue of a closed service.
+
+    Each removal wakes one caller blocked on a full queue; that caller finds
+    the service closed and calls this again, so none of them is left hanging.
+    """
+    while not queue.empty():
+        queue.get_nowait().future.cancel()
+
+
+class TwoSumService:
+    """Micro-batching Two Sum service for asyncio applications.
+
+    ``solve`` enqueues a request and waits for its answer. A dispatcher task
+    takes the requests waiting in the queue (after a short batching window)
+    and groups them by a digest of their array. Each group becomes one
+    ``two_sum_many`` call in the executor, so N clients asking about the
+    same array pay for one index build and one pickling of the array.
+
+    Backpressure comes from two bounds: ``solve`` waits while the queue
+    holds ``max_pending`` requests, and at most ``max_in_flight`` groups run
+    in the executor at once.
+
+    Answers follow ``two_sum_many``: the pair with the smallest i, then the
+    smallest j, which may differ from ``two_sum`` when several pairs exist.
+
+    Examples:
+        >>> async def demo() -> list[int]:
+        ...     async with TwoSumService(workers=1) as service:
+        ...         return await service.solve([2, 7, 11, 15], 9)
+        >>> asyncio.run(demo())
+        [0, 1]
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int | None = None,
+        executor: Executor | None = None,
+        max_pending: int = 1024,
+        max_batch: int = 256,
+        batch_window: float = 0.0005,
+        max_in_flight: int | None = None,
+    ) -> None:
+        """Configure the service; call ``start`` or use ``async with``.
+
+        Args:
+            workers: Processes in the pool created by the service. Defaults
+                to ``os.cpu_count()``. Ignored when executor is given.
+            executor: Pool to run batches in, owned by the caller.
+            max_pending: Capacity of the request queue.
+            max_batch: Most requests taken from the queue per dispatch.
+            batch_window: Seconds to wait for more requests after the first
+                one of a batch arrives. 0 batches only what is queued.
+            max_in_flight: Most groups running at once. Defaults to twice
+                the number of workers.
+        """
+        self._workers = workers or os.cpu_count() or 1
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._max_pending = max_pending
+        self._max_batch = max_batch
+        self._batch_window = batch_window
+        self._max_in_flight = max_in_flight or 2 * self._workers
+        self._queue: asyncio.Queue[_Request] | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._running: set[asyncio.Task[None]] = set()
+
+    async def __aenter__(self) -> Self:
+        """Start the service."""
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the service."""
+        await self.close()
+
+    async def start(self) -> None:
+        """Create the queue, the pool (if owned) and the dispatcher task."""
+        if self._dispatcher is not None:
+            raise RuntimeError("TwoSumService is already running")
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers)
+        self._queue = asyncio.Queue(maxsize=self._max_pending)
+        self._slots = asyncio.Semaphore(self._max_in_flight)
+        self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def close(self) -> None:
+        """Stop dispatching, finish running batches and release the pool.
+
+        Requests still queued, waiting for room in the queue or waiting for
+        a batch are cancelled.
+        """
+        if self._dispatcher is None:
+            return
+        # Detaching the queue first makes new and blocked solve calls see
+        # that the service is closing
+        queue, self._queue = self._queue, None
+        assert queue is not None
+        self._dispatcher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._dispatcher
+        self._dispatcher = None
+        await asyncio.gather(*self._running)
+
+        _cancel_queued(queue)
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def solve(self, nums: Sequence[int], target: int) -> list[int]:
+        """Find two indices whose values sum to target.
+
+        Waits while the request queue is full. The element type check and
+        the array digest run on the event loop; each is a single C-level
+        pass over the values.
+
+        Args:
+            nums: Sequence of integers to search. Must contain at least 2
+                elements.
+            target: Target sum to find.
+
+        Returns:
+            A pair [i, j] with i < j and nums[i] + nums[j] == target.
+
+        Raises:
+            RuntimeError: If the service is not running.
+            TypeError: If nums holds anything but ints (bools included).
+            ValueError: If nums has fewer than 2 elements.
+            ValueError: If no solution exists.
+            asyncio.CancelledError: If the service closes before answering.
+        """
+        queue = self._queue
+        if self._dispatcher is None or queue is None:
+            raise RuntimeError("TwoSumService is not running")
+        _check_ints(nums)
+        future: asyncio.Future[list[int]] = asyncio.get_running_loop().create_future()
+        request = _Request(_fingerprint(nums), list(nums), target, future)
+        await queue.put(request)
+        if self._queue is not queue:
+            # The service closed while this call waited for room in the queue
+            _cancel_queued(queue)
+        return await future
+
+    async def _dispatch(self) -> None:
+        """Take batches from the queue and start one task per array."""
+        assert self._queue is not None and self._slots is not None
+        queue, slots = self._queue, self._slots
+        while True:
+            batch = [await queue.get()]
+            # Requests taken from the queue but not yet handed to a task
+            waiting = deque([batch])
+            try:
+                if self._batch_window > 0:
+                    await asyncio.sleep(self._batch_window)
+                while len(batch) < self._max_batch and not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                groups: dict[bytes, list[_Request]] = {}
+                for request in batch:
+                    groups.setdefault(request.fingerprint, []).append(request)
+                waiting = deque(groups.values())
+                while waiting:
+                    await slots.acquire()
+                    task = asyncio.create_task(self._run(waiting.popleft()))
+                    self._running.add(task)
+                    task.add_done_callback(self._running.discard)
+            except asyncio.CancelledError:
+                for group in waiting:
+                    for request in group:
+                        request.future.cancel()
+                raise
+
+    async def _run(self, group: list[_Request]) -> None:
+        """Solve every target of a group with one ``two_sum_many`` call."""
+        loop = asyncio.get_running_loop()
+        targets = [request.target for request in group]
+        try:
+            results = await loop.run_in_executor(
+                self._executor, two_sum_many, group[0].nums, targets
+            )
+        except Exception as error:
+            for request in group:
+                if not request.future.done():
+                    request.future.set_exception(error)
+        else:
+            for request, result in zip(group, results, strict=True):
+                if request.future.done():
+                    continue  # the caller gave up waiting
+                if result is None:
+                    request.future.set_exception(
+                        ValueError(
+                            f"No two numbers in the list sum to {request.target}"
+                        )
+                    )
+                else:
+                    request.future.set_result(result)
+        finally:
+            assert self._slots is not None
+            self._slots.release()
+
+
+async def generate_load(
+    service: TwoSumService,
+    requests: Sequence[tuple[Sequence[int], int]],
+    *,
+    concurrency: int = 64,
+) -> BatchSummary:
+    """Send requests from concurrent clients and measure the service.
+
+    Each of ``concurrency`` clients repeatedly takes the next request and
+    awaits its answer, so up to that many requests are outstanding.
+    Requests without a solution count like any other.
+
+    Args:
+        service: A running service.
+        requests: (nums, target) pairs, sent in order.
+        concurrency: Number of simultaneous clients.
+
+    Returns:
+        Request count, wall time and end-to-end latency percentiles
+        (queueing, batching and solving included).
+    """
+    pending = iter(requests)
+    latencies = array("q")
+    clock = time.perf_counter_ns
+
+    async def client() -> None:
+        for nums, target in pending:
+            start = clock()
+            with contextlib.suppress(ValueError):
+                await service.solve(nums, target)
+            latencies.append(clock() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    seconds = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return BatchSummary(
+        queries=len(ordered),
+        seconds=seconds,
+        p50_ns=percentile(ordered, 0.50),
+        p99_ns=percentile(ordered, 0.99),
+    )
+
+
+def _demo_requests(
+    count: int, arrays: int, size: int, seed: int = 42
+) -> list[tuple[list[int], int]]:
+    """Build count requests spread over a few shared random arrays."""
+    rng = random.Random(seed)
+    pool = [[rng.randrange(10 * size) for _ in range(size)] for _ in range(arrays)]
+    requests = []
+    for _ in range(count):
+        nums = rng.choice(pool)
+        i, j = rng.sample(range(size), 2)
+        requests.append((nums, nums[i] + nums[j]))
+    return requests
+
+
+async def _main(args: argparse.Namespace) -> BatchSummary:
+    """Run the load generator against a fresh service."""
+    requests = _demo_requests(args.requests, args.arrays, args.size)
+    async with TwoSumService(workers=args.workers) as service:
+        return await generate_load(service, requests, concurrency=args.concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load-test TwoSumService locally.")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--arrays", type=int, default=16, help="distinct arrays")
+    parser.add_argument("--size", type=int, default=1_000, help="array length")
+    parser.add_argument("--concurrency", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=None)
+    print(asyncio.run(_main(parser.parse_args())).format())
@@ -0,0 +1,162 @@
+"""Two Sum over the last W events of an unbounded stream.
+
+``SlidingWindowTwoSum`` keeps a ring buffer of the most recent events and a
+counting index of their values. Each push evicts the event that leaves the
+window and checks the new value against the ones still inside, in O(1), so
+memory stays O(W) however long the stream runs. ``windowed_two_sum`` runs
+the same procedure over an iterable and yields every match.
+"""
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+
+def _check_window(window: int) -> None:
+    """Raise ValueError unless a window of this size can hold a pair."""
+    if window < 2:
+        raise ValueError(f"Window must hold at least 2 events, got {window}")
+
+
+class SlidingWindowTwoSum:
+    """Pairs summing to a fixed target among the last ``window`` events.
+
+    Events are numbered by stream position, starting at 0. When event j is
+    pushed, event ``j - window`` is evicted first, and j is matched against
+    the events ``j - window + 1 .. j - 1`` that remain. Values are counted,
+    so duplicates are evicted one occurrence at a time and a value only
+    leaves the index when its last occurrence does.
+
+    Time Complexity: O(1) per push
+    Space Complexity: O(window)
+
+    Examples:
+        >>> window = SlidingWindowTwoSum(target=10, window=3)
+        >>> [window.push(value) for value in (4, 1, 2, 6, 8)]
+        [None, None, None, None, [2, 4]]
+        >>> window.partners(4), len(window)
+        (1, 3)
+    """
+
+    def __init__(self, target: int, window: int) -> None:
+        """Create an empty window.
+
+        Args:
+            target: Sum that a pair of events must reach.
+            window: Number of most recent events a pair is searched in.
+
+        Raises:
+            ValueError: If window is smaller than 2.
+        """
+        _check_window(window)
+        self.target = target
+        self.window = window
+        self._events: deque[int] = deque()
+        # Value -> occurrences inside the window
+        self._counts: dict[int, int] = {}
+        # Value -> position of its newest occurrence inside the window
+        self._latest: dict[int, int] = {}
+        self._pushed = 0
+
+    def __len__(self) -> int:
+        """Return the number of events currently in the window."""
+        return len(self._events)
+
+    @property
+    def pushed(self) -> int:
+        """Number of events pushed so far; the next event's position."""
+        return self._pushed
+
+    def push(self, value: int) -> list[int] | None:
+        """Add the next event and match it against the window.
+
+        Args:
+            value: Value of the new event.
+
+        Returns:
+            [i, j] where j is the new event's position and i the newest
+            event in the window with value target - value, or None.
+        """
+        if len(self._events) == self.window:
+            self._evict()
+        position = self._pushed
+        partner = self._latest.get(self.target - value)
+
+        self._events.append(value)
+        self._counts[value] = self._counts.get(value, 0) + 1
+        self._latest[value] = position
+        self._pushed = position + 1
+        return None if partner is None else [partner, position]
+
+    def partners(self, value: int) -> int:
+        """Return how many events in the window would pair with value."""
+        return self._counts.get(self.target - value, 0)
+
+    def _evict(self) -> None:
+        """Drop the oldest event from the buffer and the counting index."""
+        value = self._events.popleft()
+        count = self._counts[value]
+        if count == 1:
+            del self._counts[value]
+            del self._latest[value]
+        else:
+            self._counts[value] = count - 1
+
+
+def windowed_two_sum(
+    values: Iterable[int], target: int, window: int
+) -> Iterator[tuple[int, int]]:
+    """Yield a pair for every event that completes one within the window.
+
+    Equivalent to pushing each value into a ``SlidingWindowTwoSum`` and
+    yielding the non-None results as tuples, with the loop kept local for
+    throughput. Values are pulled lazily, so the stream may be unbounded.
+
+    Args:
+        values: Iterable of integers, e.g. a generator over a feed.
+        target: Sum that a pair of events must reach.
+        window: Number of most recent events a pair is searched in.
+
+    Yields:
+        (i, j) with j - i < window and values[i] + values[j] == target, where
+        j runs over the matching events in stream order and i is the newest
+        partner of j.
+
+    Raises:
+        ValueError: If window is smaller than 2.
+
+    Time Complexity: O(1) per event
+    Space Complexity: O(window)
+
+    Examples:
+        >>> list(windowed_two_sum([4, 1, 2, 6, 8, 4], 10, window=3))
+        [(2, 4), (3, 5)]
+    """
+    _check_window(window)
+    return _windowed_pairs(values, target, window)
+
+
+def _windowed_pairs(
+    values: Iterable[int], target: int, window: int
+) -> Iterator[tuple[int, int]]:
+    """Generator behind ``windowed_two_sum``, started after validation."""
+    events: deque[int] = deque()
+    counts: dict[int, int] = {}
+    latest: dict[int, int] = {}
+
+    for position, value in enumerate(values):
+        if len(events) == window:
+            old = events.popleft()
+            count = counts[old]
+            if count == 1:
+                del counts[old]
+                del latest[old]
+            else:
+                counts[old] = count - 1
+
+        partner = latest.get(target - value)
+        if partner is not None:
+            yield (partner, position)
+
+        events.append(value)
+        counts[value] = counts.get(value, 0) + 1
+        latest[value] = position
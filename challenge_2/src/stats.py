@@ -0,0 +1,160 @@
+"""Opt-in instrumentation for the Two Sum engines.
+
+Engines that accept a ``stats`` keyword fill in a ``TwoSumStats`` passed by
+the caller. With the default ``stats=None`` they run their uninstrumented
+code: nothing is counted or timed inside the search loops, so the argument
+can stay wired through production code and be enabled per request.
+"""
+
+import math
+import time
+
+# Slots in the first key table of a CPython dict
+_DICT_MIN_SIZE = 8
+
+# Layout of a dict with int keys on 64-bit CPython: the object with its GC
+# header, the key table header, and one (hash, key, value) entry per usable
+# slot
+_DICT_OBJECT_BYTES = 64
+_DICT_KEYS_HEADER_BYTES = 32
+_DICT_ENTRY_BYTES = 24
+
+
+class TwoSumStats:
+    """What a Two Sum call did and where its time went.
+
+    Attributes:
+        strategy: Engine path that produced the answer, e.g. ``"hash"``,
+            ``"two-pointer"``, ``"direct-address"`` or ``"sort-search"``.
+            Set by the last call.
+        elements_scanned: Input elements the search examined before it
+            stopped (range and conversion passes not included).
+        index_size: Entries (or table slots) in the lookup structure.
+        index_bytes: Memory of the lookup structure itself, excluding the
+            int objects a dict refers to.
+        resizes: Estimated number of times the index grew while it was
+            built; 0 for tables allocated at their final size.
+        phases: Seconds spent per phase, e.g. ``"convert"``, ``"range"``,
+            ``"sort"``, ``"table"``, ``"scan"`` or ``"search"``.
+
+    Counters and phase times add up across calls, including the call an
+    engine falls back to; use a fresh object to see a single request.
+
+    Examples:
+        >>> from src.two_sum import two_sum
+        >>> stats = TwoSumStats()
+        >>> two_sum([2, 7, 11, 15], 9, stats=stats)
+        [0, 1]
+        >>> stats.strategy, stats.elements_scanned, stats.index_size
+        ('hash', 2, 1)
+    """
+
+    __slots__ = (
+        "_mark",
+        "elements_scanned",
+        "index_bytes",
+        "index_size",
+        "phases",
+        "resizes",
+        "strategy",
+    )
+
+    def __init__(self) -> None:
+        """Create an empty record."""
+        self.strategy = ""
+        self.elements_scanned = 0
+        self.index_size = 0
+        self.index_bytes = 0
+        self.resizes = 0
+        self.phases: dict[str, float] = {}
+        self._mark = 0.0
+
+    def start(self) -> None:
+        """Start timing the first phase of a call."""
+        self._mark = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Charge the time since the last ``start`` or ``lap`` to phase."""
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._mark
+        self._mark = now
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the record as a plain dict, e.g. for structured logging."""
+        return {
+            "strategy": self.strategy,
+            "elements_scanned": self.elements_scanned,
+            "index_size": self.index_size,
+            "index_bytes": self.index_bytes,
+            "resizes": self.resizes,
+            "phases": dict(self.phases),
+        }
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.as_dict().items())
+        return f"TwoSumStats({fields})"
+
+
+def _dict_growth(entries: int) -> tuple[int, int]:
+    """Return the table size and the number of resizes after entries inserts."""
+    size, resizes = _DICT_MIN_SIZE, 0
+    while entries > size * 2 // 3:
+        size = 1 << (3 * (size * 2 // 3) - 1).bit_length()
+        resizes += 1
+    return size, resizes
+
+
+def estimate_dict_resizes(entries: int) -> int:
+    """Return how many times a dict grows while entries keys are inserted.
+
+    Follows CPython's growth policy: a table of s slots holds ``2 * s // 3``
+    keys, and when it is full it is rebuilt with the smallest power of two
+    holding three times the keys. Deletions are not modelled.
+
+    Examples:
+        >>> estimate_dict_resizes(5), estimate_dict_resizes(6)
+        (0, 1)
+    """
+    return _dict_growth(entries)[1]
+
+
+def estimate_dict_bytes(entries: int) -> int:
+    """Return ``sys.getsizeof`` of a dict after entries int keys are inserted.
+
+    The table size follows the same growth policy as
+    ``estimate_dict_resizes``. A table of s slots has s indices of the
+    narrowest width that can address it and ``2 * s // 3`` entries; an empty
+    dict has no table of its own. Nothing is allocated.
+
+    Examples:
+        >>> import sys
+        >>> estimate_dict_bytes(1000) == sys.getsizeof(dict.fromkeys(range(1000)))
+        True
+    """
+    if entries == 0:
+        return _DICT_OBJECT_BYTES
+    size = _dict_growth(entries)[0]
+    # Signed indices of 1, 2, 4 or 8 bytes, the narrowest that fits
+    index_bytes = 1
+    while size > 1 << (8 * index_bytes - 1):
+        index_bytes *= 2
+    return (
+        _DICT_OBJECT_BYTES
+        + _DICT_KEYS_HEADER_BYTES
+        + size * index_bytes
+        + size * 2 // 3 * _DICT_ENTRY_BYTES
+    )
+
+
+def percentile(ordered: list[int], fraction: float) -> int:
+    """Return the nearest-rank percentile of ascending values (0 when empty).
+
+    Examples:
+        >>> percentile([10, 20, 30, 40], 0.5), percentile([10, 20, 30, 40], 0.99)
+        (20, 40)
+    """
+    if not ordered:
+        return 0
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
@@ -1,23 +1,122 @@
 """Two Sum algorithm implementation using hash map approach.
 
-This module provides an efficient O(n) solution to the Two Sum problem.
+This module provides an efficient O(n) solution to the Two Sum problem,
+plus a NumPy-vectorized engine for large integer arrays. NumPy is an
+optional dependency: the pure-Python functions work without it.
 """
 
+import math
+import mmap
+import os
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from functools import partial
+from itertools import chain, groupby, islice
+from typing import Any, Literal
 
-def two_sum(nums: list[int], target: int) -> list[int]:
+from src.compact_index import CompactIndexTable
+from src.pair_filter import PairSumFilter
+from src.stats import TwoSumStats, estimate_dict_bytes, estimate_dict_resizes
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError:  # pragma: no cover - exercised only without the extra
+    np = None  # type: ignore[assignment]
+
+# Number of complements searched per vectorized step. Bounds the temporary
+# arrays to a few MB and lets the vectorized engine stop early.
+_NP_CHUNK_SIZE = 1 << 20
+
+# Elements per block when a memory-mapped file is streamed without NumPy
+_MMAP_CHUNK_SIZE = 1 << 16
+
+# Supported on-disk dtypes (little-endian) -> array/memoryview type codes
+_MMAP_TYPECODES: dict[str, Literal["i", "q"]] = {"int32": "i", "int64": "q"}
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+# Direct-address tables are used when max - min + 1 is at most this many
+# times the input size, or at most the minimum span
+_DIRECT_ADDRESS_SPAN_RATIO = 2
+_DIRECT_ADDRESS_MIN_SPAN = 1 << 16
+
+# Inputs shorter than this index their direct-address table with int32
+_INT32_LIMIT = 1 << 31
+
+# Ints below this magnitude hash to themselves (see two_sum_hardened)
+_HASH_MODULUS = sys.hash_info.modulus
+
+# Values and targets below this magnitude keep every sum and gap in int64
+_CLOSEST_SAFE_MAGNITUDE = 1 << 61
+
+# Up to this many elements, n * (n - 1) / 2 pairs can be counted in int64
+_COUNT_INT64_SIZE = 1 << 32
+
+# two_sum_auto crossovers, measured on CPython 3.12 with NumPy 2. Inputs up
+# to this length use a nested scan
+_AUTO_NESTED_MAX = 3
+# From these lengths the vectorized engine wins: arrays and buffers need no
+# conversion, lists must be converted first
+_AUTO_BUFFER_NUMPY_MIN = 1 << 8
+_AUTO_LIST_NUMPY_MIN = 1 << 14
+# Before the vectorized engine is set up, n >> shift leading elements are
+# hash-scanned, costing about half of what the vectorized search would: a
+# pair in that prefix is found as fast as by two_sum, and any other pair
+# costs at most about 1.5 times the vectorized engine alone. Measured cost
+# of two_sum_np relative to a full hash scan: lists ~1/2 (wide range), ~1/4
+# (sorted), ~1/8 (narrow range); arrays and buffers ~1/3, ~1/12, ~1/25
+_AUTO_PREFIX_SHIFTS = {
+    (True, "wide"): 2,
+    (True, "sorted"): 3,
+    (True, "narrow"): 4,
+    (False, "wide"): 3,
+    (False, "sorted"): 5,
+    (False, "narrow"): 6,
+}
+# The prefix is hash-scanned in chunks doubling from this size, so a pair
+# near the front is found without slicing much of the input
+_AUTO_FIRST_CHUNK = 1 << 10
+# From this length a narrow value range pays for two_sum_bounded
+_AUTO_BOUNDED_MIN = 1 << 14
+# Evenly spaced values sampled to estimate the range or probe sortedness
+_AUTO_SAMPLES = 32
+
+
+def two_sum(
+    nums: list[int],
+    target: int,
+    *,
+    presorted: bool = False,
+    stats: TwoSumStats | None = None,
+) -> list[int]:
     """Find indices of two numbers that sum to target.
 
     This function uses a hash map (dictionary) approach to solve the problem
     in a single pass with O(n) time complexity. For each element, it checks
     if the complement (target - current_number) exists in the hash map.
 
+    With ``presorted=True`` the input is trusted to be in ascending order
+    and a two-pointer scan is used instead: no hashing and O(1) extra
+    memory. ``looks_sorted`` is a cheap probe for deciding when to use it.
+
     Args:
         nums: List of integers to search. Must contain at least 2 elements.
         target: Target sum to find.
+        presorted: Set to True only if nums is sorted in ascending order;
+            otherwise the two-pointer scan may miss the pair.
+        stats: Optional ``TwoSumStats`` to fill in with the strategy, the
+            elements scanned, the index size and the scan time.
 
     Returns:
         List containing two indices [i, j] where nums[i] + nums[j] == target.
         The indices are returned in the order they are found (i < j).
+        With presorted=True the pair has the smallest i of any solution,
+        matched with the last j that completes it.
 
     Raises:
         ValueError: If nums has fewer than 2 elements.
@@ -25,6 +124,7 @@ def two_sum(nums: list[int], target: int) -> list[int]:
 
     Time Complexity: O(n) - Single pass through the array
     Space Complexity: O(n) - Hash map stores up to n elements
+        (O(1) with presorted=True)
 
     Examples:
         >>> two_sum([2, 7, 11, 15], 9)
@@ -35,6 +135,8 @@ def two_sum(nums: list[int], target: int) -> list[int]:
         [0, 1]
         >>> two_sum([-1, -2, -3, -4, -5], -8)
         [2, 4]
+        >>> two_sum([1, 2, 3, 4, 6], 7, presorted=True)
+        [0, 4]
     """
     # Validate input: need at least 2 elements to form a pair
     if len(nums) < 2:
@@ -42,6 +144,16 @@ def two_sum(nums: list[int], target: int) -> list[int]:
             f"Input list must contain at least 2 elements, got {len(nums)}"
         )
 
+    if stats is not None:
+        return _trace_scan(
+            lambda: two_sum(nums, target, presorted=presorted),
+            "two-pointer" if presorted else "hash",
+            nums,
+            stats,
+        )
+    if presorted:
+        return _two_sum_two_pointer(nums, target)
+
     # Hash map to store number -> index mapping
     # Key: number we've seen, Value: its index
     seen: dict[int, int] = {}
@@ -64,6 +176,106 @@ def two_sum(nums: list[int], target: int) -> list[int]:
     raise ValueError(f"No two numbers in the list sum to {target}")
 
 
+def _two_sum_two_pointer(nums: Sequence[int], target: int) -> list[int]:
+    """Two-pointer scan over ascending input using O(1) extra memory.
+
+    Moving ``left`` up while the sum is too small and ``right`` down while
+    it is too large never skips a solution: ``left`` stops at the smallest
+    index of any pair, and ``right`` reaches its last partner first.
+    """
+    left, right = 0, len(nums) - 1
+    while left < right:
+        total = nums[left] + nums[right]
+        if total == target:
+            return [left, right]
+        if total < target:
+            left += 1
+        else:
+            right -= 1
+
+    raise ValueError(f"No two numbers in the list sum to {target}")
+
+
+def _trace_scan(
+    run: Callable[[], list[int]],
+    strategy: str,
+    nums: Sequence[int],
+    stats: TwoSumStats,
+) -> list[int]:
+    """Run a single-pass engine uninstrumented, then record what it did.
+
+    Only ``run`` is timed. The elements scanned follow from where the pair
+    was found, and the index the engine held at that point is measured by
+    recounting its keys afterwards, so the search loop itself is untouched.
+    """
+    stats.strategy = strategy
+    stats.start()
+    result = None
+    try:
+        result = run()
+        return result
+    finally:
+        stats.lap("scan")
+        n = len(nums)
+        if strategy == "two-pointer":
+            # The pointers read positions 0..i and j..n-1 before meeting
+            stats.elements_scanned += (
+                n if result is None else result[0] + 1 + n - result[1]
+            )
+        else:
+            # A single pass stops at j, having indexed the elements before it
+            stop = n if result is None else result[1]
+            stats.elements_scanned += n if result is None else stop + 1
+            if strategy not in ("direct-address", "nested-loop"):
+                keys = _count_keys(islice(nums, stop), strategy == "hardened-hash")
+                stats.index_size += keys
+                stats.index_bytes += estimate_dict_bytes(keys)
+                stats.resizes += estimate_dict_resizes(keys)
+
+
+def _count_keys(nums: Iterable[int], hardened: bool) -> int:
+    """Count the distinct keys a hash scan over nums inserts."""
+    if not hardened:
+        return len(set(nums))
+    # Key large values as two_sum_hardened does, so this recount is safe
+    bound = _HASH_MODULUS
+    return len({num if -bound < num < bound else _seeded_key(num) for num in nums})
+
+
+def looks_sorted(nums: Sequence[int], samples: int = 32) -> bool:
+    """Cheap probe for ascending order.
+
+    Checks ``samples`` evenly spaced adjacent pairs plus the endpoints
+    instead of the whole input, so it costs O(samples) regardless of n.
+    A False result is definitive; True means "probably sorted" and is meant
+    for choosing a fast path such as ``two_sum(..., presorted=True)`` when
+    the data source is known to usually deliver sorted input.
+
+    Args:
+        nums: Sequence of integers to probe.
+        samples: Number of adjacent pairs to inspect.
+
+    Returns:
+        False if an inversion was found, True otherwise.
+
+    Time Complexity: O(samples)
+    Space Complexity: O(1)
+
+    Examples:
+        >>> looks_sorted([1, 2, 2, 5, 9])
+        True
+        >>> looks_sorted([3, 1, 2])
+        False
+    """
+    n = len(nums)
+    if n < 2:
+        return True
+    if nums[0] > nums[n - 1]:
+        return False
+    step = max(1, (n - 1) // samples)
+    return all(nums[i] <= nums[i + 1] for i in range(0, n - 1, step))
+
+
 def two_sum_brute_force(nums: list[int], target: int) -> list[int]:
     """Alternative brute force implementation for comparison.
 
@@ -132,3 +344,1943 @@ def two_sum_generator(nums: list[int], target: int) -> tuple[int, int]:
         seen[num] = i
 
     raise ValueError(f"No two numbers in the list sum to {target}")
+
+
+def two_sum_compact(nums: Sequence[int], target: int) -> list[int]:
+    """Hash map Two Sum using a compact array-backed index.
+
+    Same algorithm and result as ``two_sum``, but the ``seen`` map is a
+    ``CompactIndexTable`` storing unboxed int64 keys and indices (16 bytes
+    per slot) instead of a ``dict`` (~100 bytes per entry with its boxed
+    ints). It is slower per element; use it when the index for a large
+    input would not fit in memory.
+
+    Args:
+        nums: Sequence of integers that fit in int64. Must contain at least
+            2 elements.
+        target: Target sum to find.
+
+    Returns:
+        List containing two indices [i, j] where nums[i] + nums[j] == target,
+        identical to ``two_sum``.
+
+    Raises:
+        ValueError: If nums has fewer than 2 elements.
+        ValueError: If no solution exists.
+        OverflowError: If a value does not fit in int64.
+
+    Time Complexity: O(n) expected
+    Space Complexity: O(n) - about 21-43 bytes per distinct value
+
+    Examples:
+        >>> two_sum_compact([2, 7, 11, 15], 9)
+        [0, 1]
+    """
+    if len(nums) < 2:
+        raise ValueError(
+            f"Input list must contain at least 2 elements, got {len(nums)}"
+        )
+
+    seen = CompactIndexTable()
+    get = seen.get
+
+    for i, num in enumerate(nums):
+        j = get(target - num)
+        if j is not None:
+            return [j, i]
+        seen[num] = i
+
+    raise ValueError(f"No two numbers in the list sum to {target}")
+
+
+def two_sum_hardened(
+    nums: list[int], target: int, *, stats: TwoSumStats | None = None
+) -> list[int]:
+    """Hash map Two Sum that resists hash-collision attacks.
+
+    CPython hashes an int by reducing it modulo ``sys.hash_info.modulus``
+    (2**61 - 1 on 64-bit builds), so values congruent modulo that prime all
+    share one hash and pile up in a single ``dict`` probe chain, turning
+    ``two_sum`` quadratic. Use this variant on untrusted input.
+
+    Below the modulus the hash is the value itself and distinct values never
+    collide, so those keys are stored as-is. Larger magnitudes are keyed by
+    their byte encoding instead, whose hash is SipHash with a per-process
+    random seed: colliding inputs cannot be crafted in advance (unless
+    ``PYTHONHASHSEED`` pins the seed).
+
+    Args:
+        nums: List of integers to search. Must contain at least 2 elements.
+        target: Target sum to find.
+        stats: Optional ``TwoSumStats`` to fill in (see ``two_sum``).
+
+    Returns:
+        List containing two indices [i, j] where nums[i] + nums[j] == target,
+        identical to ``two_sum``.
+
+    Raises:
+        ValueError: If nums has fewer than 2 elements.
+        ValueError: If no solution exists.
+
+    Time Complexity: O(n) expected, whatever the values
+    Space Complexity: O(n) - plus a bytes key per large value
+
+    Examples:
+        >>> two_sum_hardened([2, 7, 11, 15], 9)
+        [0, 1]
+    """
+    if len(nums) < 2:
+        raise ValueError(
+            f"Input list must contain at least 2 elements, got {len(nums)}"
+        )
+
+    if stats is not None:
+        return _trace_scan(
+            lambda: two_sum_hardened(nums, target), "hardened-hash", nums, stats
+        )
+
+    bound = _HASH_MODULUS
+    seen: dict[int | bytes, int] = {}
+
+    for i, num in enumerate(nums):
+        complement = target - num
+        if -bound < complement < bound:
+            j = seen.get(complement)
+        else:
+            j = seen.get(_seeded_key(complement))
+        if j is not None:
+            return [j, i]
+        seen[num if -bound < num < bound else _seeded_key(num)] = i
+
+    raise ValueError(f"No two numbers in the list sum to {target}")
+
+
+def _seeded_key(num: int) -> bytes:
+    """Encode an int as the shortest signed little-endian byte string."""
+    return num.to_bytes((num.bit_length() + 8) // 8, "little", signed=True)
+
+
+def two_sum_bounded(
+    nums: Sequence[int], target: int, *, stats: TwoSumStats | None = None
+) -> list[int]:
+    """Two Sum with a direct-address table for small value ranges.
+
+    When ``max - min`` is small relative to n (at most
+    ``_DIRECT_ADDRESS_SPAN_RATIO * n``, or any range up to
+    ``_DIRECT_ADDRESS_MIN_SPAN``), a ``bytearray`` with one byte per
+    possible value replaces the ``seen`` dict: no hashing, and a footprint
+    of at most two bytes per value in the range instead of ~100 bytes per
+    distinct value. The table is offset by the minimum, so negative values
+    work, and padded to cover every complement so lookups need no bounds
+    check. Wider ranges fall back to ``two_sum``.
+
+    The table only records which values were seen; once the first j whose
+    complement appeared earlier is found, the complement's latest index is
+    recovered with a single backward scan.
+
+    Args:
+        nums: Sequence of integers to search. Must contain at least 2 elements.
+        target: Target sum to find.
+        stats: Optional ``TwoSumStats`` to fill in (see ``two_sum``).
+
+    Returns:
+        List containing two indices [i, j] where nums[i] + nums[j] == target,
+        identical to ``two_sum``.
+
+    Raises:
+        ValueError: If nums has fewer than 2 elements.
+        ValueError: If no solution exists.
+
+    Time Complexity: O(n + max - min)
+    Space Complexity: O(max - min) - at most 2 bytes per value in the range
+
+    Examples:
+        >>> two_sum_bounded([3, -2, 4, 3], 6)
+        [0, 3]
+    """
+    n = len(nums)
+    if n < 2:
+        raise ValueError(f"Input list must contain at least 2 elements, got {n}")
+
+    if stats is not None:
+        stats.start()
+    lo, hi = min(nums), max(nums)
+    if stats is not None:
+        stats.lap("range")
+    span = hi - lo + 1
+    if span > max(_DIRECT_ADDRESS_MIN_SPAN, _DIRECT_ADDRESS_SPAN_RATIO * n):
+        return two_sum(list(nums), target, stats=stats)
+    # No pair can reach a target outside [2 * min, 2 * max]
+    if not 2 * lo <= target <= 2 * hi:
+        raise ValueError(f"No two numbers in the list sum to {target}")
+
+    if stats is not None:
+        slots = max(hi, target - lo) - min(lo, target - hi) + 1
+        stats.index_size += slots
+        stats.index_bytes += slots
+        return _trace_scan(
+            lambda: _direct_address_scan(nums, target, lo, hi),
+            "direct-address",
+            nums,
+            stats,
+        )
+    return _direct_address_scan(nums, target, lo, hi)
+
+
+def _direct_address_scan(
+    nums: Sequence[int], target: int, lo: int, hi: int
+) -> list[int]:
+    """Scan for ``two_sum_bounded`` once the range checks have passed."""
+    # Complements fall in [target - hi, target - lo]; extend the table below
+    # lo or above hi so that both num and target - num index it directly
+    shift = min(lo, target - hi)
+    seen = bytearray(max(hi, target - lo) - shift + 1)
+    base = target - shift
+
+    for j, num in enumerate(nums):
+        if seen[base - num]:
+            complement = target - num
+            for i in range(j - 1, -1, -1):
+                if nums[i] == complement:
+                    return [i, j]
+        seen[num - shift] = 1
+
+    raise ValueError(f"No two numbers in the list sum to {target}")
+
+
+def two_sum_auto(
+    nums: "Sequence[int] | npt.NDArray[Any]",
+    target: int,
+    *,
+    stats: TwoSumStats | None = None,
+) -> list[int]:
+    """Two Sum through whichever engine suits the input best.
+
+    A few cheap features of the input pick the engine:
+
+    - length: up to ``_AUTO_NESTED_MAX`` elements a nested scan beats
+      building a dict; longer inputs go to the vectorized ``two_sum_np``
+      when NumPy is installed and the input is long enough to amortize it.
+    - container: ndarrays (including ``np.memmap``) and buffers such as
+      ``array.array`` or ``memoryview`` are searched in place from
+      ``_AUTO_BUFFER_NUMPY_MIN`` elements. Lists must be converted, which
+      pays from ``_AUTO_LIST_NUMPY_MIN`` elements.
+    - pair position: before vectorizing, a hash scan covers the leading
+      elements that cost about half the vectorized search (n / 4 for a
+      wide-range list down to n / 64 for a narrow-range array). A pair in
+      that prefix is found as fast as by ``two_sum``; any other pair costs
+      at most about 1.5 times ``two_sum_np`` alone, and about 3 times the
+      better of the two in the worst case, just past the prefix.
+    - sortedness: a sampled probe, confirmed by one vectorized comparison,
+      lets ``two_sum_np`` skip its argsort.
+    - value range: estimated from a sample, it sends narrow-range sequences
+      to ``two_sum_bounded`` when NumPy is not available (``two_sum_np``
+      makes the same choice itself).
+
+    Every engine used returns the same pair as ``two_sum``, so only the
+    speed depends on the choice. The engine that produced the answer is
+    recorded in ``stats.strategy``; the feature probes are timed as the
+    ``"probe"`` phase.
+
+    Args:
+        nums: Sequence or one-dimensional array of integers. Must contain
+            at least 2 elements.
+        target: Target sum to find.
+        stats: Optional ``TwoSumStats`` to fill in (see ``two_sum``).
+
+    Returns:
+        List containing two indices [i, j] where nums[i] + nums[j] == target,
+        identical to ``two_sum(list(nums), target)``.
+
+    Raises:
+        TypeError: If an ndarray does not contain integers.
+        ValueError: If nums has fewer than 2 elements.
+        ValueError: If no solution exists.
+
+    Time Complexity: that of the engine chosen, plus O(1) probes (O(n) for
+        the sortedness check and list conversion on the vectorized path)
+    Space Complexity: that of the engine chosen
+
+    Examples:
+        >>> two_sum_auto([2, 7, 11, 15], 9)
+        [0, 1]
+        >>> stats = TwoSumStats()
+        >>> two_sum_auto([3, 2, 4], 6, stats=stats)
+        [1, 2]
+        >>> stats.strategy
+        'nested-loop'
+    """
+    n = len(nums)
+    if n < 2:
+        raise ValueError(f"Input list must contain at least 2 elements, got {n}")
+    if stats is not None:
+        stats.start()
+
+    values: Sequence[int]
+    if np is not None and isinstance(nums, np.ndarray):
+        arr = as_int_array(nums)
+        if n >= _AUTO_BUFFER_NUMPY_MIN:
+            result = _two_sum_auto_np(arr, target, stats)
+            assert result is not None  # arr is already an integer array
+            return result
+        # Too short to amortize the vectorized setup
+        values = arr.tolist()
+    else:
+        values = nums
+
+    if n <= _AUTO_NESTED_MAX:
+        if stats is None:
+            return _two_sum_nested(values, target)
+        stats.lap("probe")
+        return _trace_scan(
+            lambda: _two_sum_nested(values, target), "nested-loop", values, stats
+        )
+
+    if np is not None and n >= (
+        _AUTO_LIST_NUMPY_MIN if isinstance(values, list) else _AUTO_BUFFER_NUMPY_MIN
+    ):
+        result = _two_sum_auto_np(values, target, stats)
+        if result is not None:
+            return result
+
+    narrow = n >= _AUTO_BOUNDED_MIN and _sampled_span(values) <= max(
+        _DIRECT_ADDRESS_MIN_SPAN, _DIRECT_ADDRESS_SPAN_RATIO * n
+    )
+    if stats is not None:
+        stats.lap("probe")
+    if narrow:
+        return two_sum_bounded(values, target, stats=stats)
+    if not isinstance(values, list):
+        values = list(values)
+    return two_sum(values, target, stats=stats)
+
+
+def _two_sum_auto_np(
+    nums: "Sequence[int] | npt.NDArray[Any]",
+    target: int,
+    stats: TwoSumStats | None,
+) -> list[int] | None:
+    """Vectorized branch of ``two_sum_auto``.
+
+    Returns None, having found no pair in the prefix, when nums cannot be
+    held in an integer ndarray (e.g. a list with values beyond int64).
+    """
+    # Where the pair lies is unknown, so a hash scan, which stops at the
+    # pair, gets a prefix sized to about half the vectorized cost first
+    prefix = (
+        len(nums) >> _AUTO_PREFIX_SHIFTS[isinstance(nums, list), _sampled_shape(nums)]
+    )
+    if stats is None:
+        found = _hash_prefix(nums, target, prefix)
+    else:
+        head: list[int] = list(_chunk_items(nums[:prefix]))
+        try:
+            found = _trace_scan(lambda: two_sum(head, target), "hash", head, stats)
+        except ValueError:
+            found = None
+    if found is not None:
+        return found
+
+    try:
+        arr = as_int_array(nums)
+    except (OverflowError, TypeError, ValueError):
+        return None
+    # A strided sample rules out most unsorted inputs; one vectorized pass,
+    # far cheaper than the argsort it saves, confirms the rest
+    sample = arr[:: max(1, arr.size // _AUTO_SAMPLES)]
+    presorted = bool(np.all(sample[1:] >= sample[:-1])) and bool(
+        np.all(arr[1:] >= arr[:-1])
+    )
+    if stats is not None:
+        stats.lap("probe")
+    return two_sum_np(arr, target, presorted=presorted, stats=stats)
+
+
+def _two_sum_nested(nums: Sequence[int], target: int) -> list[int]:
+    """Nested scan for tiny inputs, in the order ``two_sum`` finds pairs.
+
+    Trying each j in turn against the i before it, latest first, returns
+    the smallest j with the latest partner, the same pair as the hash map.
+    """
+    for j in range(1, len(nums)):
+        complement = target - nums[j]
+        for i in range(j - 1, -1, -1):
+            if nums[i] == complement:
+                return [i, j]
+    raise ValueError(f"No two numbers in the list sum to {target}")
+
+
+def _sampled_shape(nums: "Sequence[int] | npt.NDArray[Any]") -> str:
+    """Classify nums as "sorted", "narrow" (range) or "wide" from a sample."""
+    sample: list[int] = list(_chunk_items(nums[:: max(1, len(nums) // _AUTO_SAMPLES)]))
+    if all(a <= b for a, b in zip(sample, sample[1:], strict=False)):
+        return "sorted"
+    span = max(sample) - min(sample) + 1
+    if span <= max(_DIRECT_ADDRESS_MIN_SPAN, _DIRECT_ADDRESS_SPAN_RATIO * len(nums)):
+        return "narrow"
+    return "wide"
+
+
+def _hash_prefix(
+    nums: "Sequence[int] | npt.NDArray[Any]", target: int, stop: int
+) -> list[int] | None:
+    """Run the ``two_sum`` scan over nums[:stop] in doubling chunks.
+
+    Returns the pair ``two_sum`` would return if it lies in the prefix,
+    otherwise None.
+    """
+    seen: dict[int, int] = {}
+    start, size = 0, _AUTO_FIRST_CHUNK
+    while start < stop:
+        end = min(start + size, stop)
+        for j, num in enumerate(_chunk_items(nums[start:end]), start):
+            complement = target - num
+            if complement in seen:
+                return [seen[complement], j]
+            seen[num] = j
+        start, size = end, 2 * size
+    return None
+
+
+def _sampled_span(nums: Sequence[int]) -> int:
+    """Return max - min over evenly spaced samples: a lower bound on the span."""
+    sample = nums[:: max(1, len(nums) // _AUTO_SAMPLES)]
+    return max(sample) - min(sample) + 1
+
+
+def two_sum_many(
+    nums: Sequence[int], targets: Iterable[int], *, prefilter: bool = False
+) -> list[list[int] | None]:
+    """Answer many Two Sum queries against the same list.
+
+    Calling ``two_sum`` once per target rebuilds the ``seen`` hash map every
+    time. This function indexes ``nums`` once (first and second occurrence
+    of every value) and answers each target with read-only lookups.
+
+    Each query walks the list from the front and stops at the first element
+    whose complement exists anywhere else in the list, so a target with many
+    solutions costs only a handful of lookups instead of a scan until the
+    pair completes. Targets outside ``[2 * min, 2 * max]`` are rejected
+    without scanning, and repeated targets are answered once.
+
+    A target without a solution still costs a full pass. With
+    ``prefilter=True`` a ``PairSumFilter`` over the values is built first
+    and rejects many such targets in O(1); it pays off for batches dominated
+    by unsolvable targets on values with a common stride or on small arrays
+    (see ``PairSumFilter`` for when it cannot help).
+
+    Args:
+        nums: Sequence of integers to search. Must contain at least 2 elements.
+        targets: Target sums to look up.
+        prefilter: Screen targets with a ``PairSumFilter`` before searching.
+
+    Returns:
+        One entry per target, in order: a pair [i, j] with i < j and
+        nums[i] + nums[j] == target, or None when no pair exists. The pair
+        is the one ``two_sum_brute_force`` returns (smallest i, then
+        smallest j), which may differ from ``two_sum`` when several
+        solutions exist.
+
+    Raises:
+        ValueError: If nums has fewer than 2 elements.
+
+    Time Complexity: O(n + k * m) - one index build, then each of the k
+        queries scans up to the m-th element, the first one with a partner
+    Space Complexity: O(n + k) - the shared index plus one result per target
+
+    Examples:
+        >>> two_sum_many([2, 7, 11, 15], [9, 18, 100])
+        [[0, 1], [1, 2], None]
+    """
+    if len(nums) < 2:
+        raise ValueError(
+            f"Input list must contain at least 2 elements, got {len(nums)}"
+        )
+
+    # Value -> index of its first and second occurrence, built once.
+    # The second occurrence is only needed when a value pairs with itself.
+    first: dict[int, int] = {}
+    second: dict[int, int] = {}
+    for i, num in enumerate(nums):
+        if num not in first:
+            first[num] = i
+        elif num not in second:
+            second[num] = i
+
+    lowest, highest = min(first), max(first)
+    screen = PairSumFilter(first).might_have_pair if prefilter else None
+    answers: dict[int, tuple[int, int] | None] = {}
+    results: list[list[int] | None] = []
+
+    for target in targets:
+        if target not in answers:
+            if 2 * lowest <= target <= 2 * highest and (
+                screen is None or screen(target)
+            ):
+                answers[target] = _query_index(nums, first, second, target)
+            else:
+                answers[target] = None
+        answer = answers[target]
+        results.append(None if answer is None else list(answer))
+
+    return results
+
+
+def _query_index(
+    nums: Sequence[int],
+    first: dict[int, int],
+    second: dict[int, int],
+    target: int,
+) -> tuple[int, int] | None:
+    """Find the smallest-i pair for target using prebuilt occurrence maps.
+
+    The first element whose complement exists at another index is the
+    smallest i of any solution. Its partner cannot occur before i (that
+    element would have matched first), so the earliest other occurrence of
+    the complement is the smallest j.
+    """
+    get = first.get
+    for i, num in enumerate(nums):
+        j = get(target - num)
+        if j is None:
+            continue
+        if j == i:
+            # num pairs with itself: use its second occurrence, if any
+            j = second.get(num)
+            if j is None:
+                continue
+        return (i, j)
+    return None
+
+
+def two_sum_cross(a: Sequence[int], b: Sequence[int], target: int) -> list[int]:
+    """Find a value in a and a value in b that sum to target.
+
+    A pair join between two datasets: unlike ``two_sum`` on the
+    concatenation, both values always come from different inputs. The
+    smaller input is indexed (value -> first index) and the larger one is
+    streamed against it, stopping at the first match, so memory is bounded
+    by the smaller side.
+
+    Args:
+        a: First sequence of integers. Must not be empty.
+        b: Second sequence of integers. Must not be empty.
+        target: Target sum to find.
+
+    Returns:
+        List [i, j] where a[i] + b[j] == target. The pair has the smallest
+        index in the larger input (b when the lengths are equal), matched
+        with the first index of its complement in the other one.
+
+    Raises:
+        ValueError: If a or b is empty.
+        ValueError: If no solution exists.
+
+    Time Complexity: O(s + m) - s is the smaller length, m the position in
+        the larger input where the pair completes
+    Space Complexity: O(s) - the index of the smaller input
+
+    Examples:
+        >>> two_sum_cross([1, 5, 9], [10, 4, 2], 13)
+        [2, 1]
+        >>> two_sum_cross([3, 3], [3], 6)
+        [0, 0]
+    """
+    if not len(a) or not len(b):
+        raise ValueError(
+            f"Both inputs must be non-empty, got {len(a)} and {len(b)} elements"
+        )
+    if len(a) <= len(b):
+        found = _cross_scan(_first_positions(a), b, target)
+        if found is not None:
+            return [found[0], found[1]]
+    else:
+        found = _cross_scan(_first_positions(b), a, target)
+        if found is not None:
+            return [found[1], found[0]]
+    raise ValueError(f"No two numbers in the lists sum to {target}")
+
+
+def _first_positions(values: Sequence[int]) -> dict[int, int]:
+    """Map each value to the index of its first occurrence."""
+    # Inserting from the back lets earlier indices overwrite later ones
+    return dict(zip(reversed(values), range(len(values) - 1, -1, -1), strict=True))
+
+
+def _cross_scan(
+    first: dict[int, int], stream: Iterable[int], target: int
+) -> tuple[int, int] | None:
+    """Return (indexed position, stream position) of the first match."""
+    get = first.get
+    for j, num in enumerate(stream):
+        i = get(target - num)
+        if i is not None:
+            return (i, j)
+    return None
+
+
+def two_sum_stream(values: Iterable[int], target: int) -> list[int]:
+    """Streaming Two Sum over any iterable, including one-shot iterators.
+
+    Unlike ``two_sum_generator``, the input is never measured or
+    materialized: values are pulled one at a time and reading stops as soon
+    as the pair is complete. Only the hash map of values seen so far is
+    kept in memory, so generators, sockets and files work, and answers near
+    the front of a huge feed are found without reading the rest.
+
+    Args:
+        values: Iterable of integers, e.g. a generator or
+            ``(int(line) for line in file)``.
+        target: Target sum to find.
+
+    Returns:
+        List containing two indices [i, j] (positions in the stream) where
+        values[i] + values[j] == target, identical to ``two_sum``.
+
+    Raises:
+        ValueError: If the stream yields fewer than 2 elements.
+        ValueError: If no solution exists.
+
+    Time Complexity: O(m) - m is the position where the pair completes
+    Space Complexity: O(m) - hash map of the values read so far
+
+    Examples:
+        >>> two_sum_stream((x for x in [2, 7, 11, 15]), 9)
+        [0, 1]
+    """
+    seen: dict[int, int] = {}
+    count = 0
+
+    for i, num in enumerate(values):
+        complement = target - num
+        if complement in seen:
+            return [seen[complement], i]
+        seen[num] = i
+        count = i + 1
+
+    if count < 2:
+        raise ValueError(f"Input list must contain at least 2 elements, got {count}")
+    raise ValueError(f"No two numbers in the list sum to {target}")
+
+
+def two_sum_stream_chunks(chunks: Iterable[Iterable[int]], target: int) -> list[int]:
+    """Streaming Two Sum over an iterable of chunks.
+
+    Chunks are consumed lazily and indices run across chunk boundaries, as
+    if the chunks were concatenated. Chunks exposing ``tolist()``
+    (``ndarray``, ``array.array``, ``memoryview``) are converted one chunk
+    at a time, which is much faster than iterating their elements.
+
+    Args:
+        chunks: Iterable of integer chunks, e.g. successive
+            ``memoryview(file.read(size)).cast("q")`` blocks.
+        target: Target sum to find.
+
+    Returns:
+        List containing two global indices [i, j], identical to calling
+        ``two_sum`` on the concatenated chunks.
+
+    Raises:
+        ValueError: If the chunks hold fewer than 2 elements in total.
+        ValueError: If no solution exists.
+
+    Time Complexity: O(m) - m is the position where the pair completes
+    Space Complexity: O(m + c) - hash map plus one converted chunk of size c
+
+    Examples:
+        >>> two_sum_stream_chunks([[2, 7], [11, 15]], 26)
+        [2, 3]
+    """
+    return two_sum_stream(chain.from_iterable(map(_chunk_items, chunks)), target)
+
+
+def _chunk_items(chunk: Iterable[int]) -> Iterable[int]:
+    """Return a fast-to-iterate view of a chunk's items."""
+    tolist = getattr(chunk, "tolist", None)
+    if tolist is not None:
+        items: list[int] = tolist()
+        return items
+    return chunk
+
+
+def two_sum_all_pairs(nums: Iterable[int], target: int) -> Iterator[tuple[int, int]]:
+    """Lazily yield every index pair whose values sum to target.
+
+    ``two_sum`` stops at the first pair and its ``seen`` map keeps only the
+    latest index of each value. This generator keeps every position: a value
+    seen once is stored as a bare int and promoted to an ``array("q")``
+    (8 bytes per position) when it repeats. Pairs are produced on demand, so
+    inputs with millions of matches are never materialized, and the input
+    itself is consumed in a single pass (any iterable works).
+
+    Args:
+        nums: Iterable of integers.
+        target: Target sum to find.
+
+    Yields:
+        Tuples (i, j) with i < j and nums[i] + nums[j] == target, ordered by
+        j and then by i. The first tuple therefore has the same j as the
+        pair ``two_sum`` returns.
+
+    Time Complexity: O(n + p) - one pass plus p yielded pairs
+    Space Complexity: O(n) - the position index; output is not stored
+
+    Examples:
+        >>> list(two_sum_all_pairs([1, 3, 2, 2, 3], 5))
+        [(1, 2), (1, 3), (2, 4), (3, 4)]
+        >>> list(two_sum_all_pairs([3, 3, 3], 6))
+        [(0, 1), (0, 2), (1, 2)]
+    """
+    # Value -> positions so far: an int for one occurrence, then an array
+    positions: dict[int, int | array[int]] = {}
+
+    for j, num in enumerate(nums):
+        earlier = positions.get(target - num)
+        if earlier is not None:
+            if isinstance(earlier, int):
+                yield (earlier, j)
+            else:
+                for i in earlier:
+                    yield (i, j)
+
+        current = positions.get(num)
+        if current is None:
+            positions[num] = j
+        elif isinstance(current, int):
+            positions[num] = array("q", (current, j))
+        else:
+            current.append(j)
+
+
+def two_sum_count(nums: "Iterable[int] | npt.NDArray[Any]", target: int) -> int:
+    """Count the index pairs i < j with nums[i] + nums[j] == target.
+
+    Pairs are counted, never listed: the values are reduced to their
+    frequencies, and each distinct value x below ``target - x`` contributes
+    ``count(x) * count(target - x)`` pairs. A value equal to its own
+    complement (``2 * x == target``) pairs with its other occurrences only,
+    contributing ``count(x) * (count(x) - 1) / 2``.
+
+    NumPy arrays take a vectorized path: ``np.unique`` frequencies computed
+    chunk by chunk and merged, then complements located with
+    ``searchsorted``. Either way the working memory is bounded by the
+    number of distinct values (plus one chunk for arrays).
+
+    Args:
+        nums: Iterable of integers (consumed once), or a one-dimensional
+            integer ndarray.
+        target: Target sum to count.
+
+    Returns:
+        The number of pairs; 0 when there are none, including for inputs
+        with fewer than 2 elements.
+
+    Raises:
+        TypeError: If an ndarray does not contain integers.
+
+    Time Complexity: O(n) expected for iterables, O(n log n) for arrays
+    Space Complexity: O(d) - d is the number of distinct values
+
+    Examples:
+        >>> two_sum_count([1, 5, 3, 3, 3, 7, 5], 10)  # 3 x (3, 7) + (5, 5)
+        4
+        >>> two_sum_count([2, 2, 2, 2], 4)
+        6
+    """
+    if np is not None and isinstance(nums, np.ndarray):
+        return _two_sum_count_np(as_int_array(nums), target)
+
+    counts = Counter(nums)
+    total = 0
+    for value, count in counts.items():
+        complement = target - value
+        if value < complement:
+            total += count * counts.get(complement, 0)
+        elif value == complement:
+            total += count * (count - 1) // 2
+    return total
+
+
+def two_sum_count_range(
+    nums: "Iterable[int] | npt.NDArray[Any]", lo: int, hi: int
+) -> int:
+    """Count the index pairs i < j with lo <= nums[i] + nums[j] <= hi.
+
+    Equivalent to summing ``two_sum_count`` over every target in the band,
+    but costs one sort regardless of the band's width. See
+    ``two_sum_count_bands`` to answer many bands after that sort.
+
+    Args:
+        nums: Iterable of integers, or a one-dimensional integer ndarray.
+        lo: Smallest pair sum counted.
+        hi: Largest pair sum counted.
+
+    Returns:
+        The number of pairs; 0 for an empty band (lo > hi) or fewer than 2
+        elements.
+
+    Raises:
+        TypeError: If an ndarray does not contain integers.
+
+    Time Complexity: O(n log n)
+    Space Complexity: O(n) - sorted copy of the values
+
+    Examples:
+        >>> two_sum_count_range([1, 2, 3, 4, 5], 5, 7)
+        6
+    """
+    return two_sum_count_bands(nums, [(lo, hi)])[0]
+
+
+def two_sum_count_bands(
+    nums: "Iterable[int] | npt.NDArray[Any]", bands: Iterable[tuple[int, int]]
+) -> list[int]:
+    """Count the pairs whose sum falls in each [lo, hi] band, sorting once.
+
+    The values are sorted once; each band is then the difference of two
+    prefix counts, ``pairs(sum <= hi) - pairs(sum <= lo - 1)``. Over a sorted
+    list a prefix count is a two-pointer pass: when the smallest remaining
+    value plus the largest fits under the limit, so does every value between
+    them. NumPy arrays count with ``searchsorted`` instead. Prefix counts are
+    shared between bands with a common bound.
+
+    Args:
+        nums: Iterable of integers, or a one-dimensional integer ndarray.
+        bands: (lo, hi) pairs of inclusive bounds.
+
+    Returns:
+        One pair count per band, in order.
+
+    Raises:
+        TypeError: If an ndarray does not contain integers.
+
+    Time Complexity: O(n log n + q * n) for q bands (O(n log n) per band
+        for arrays, in vectorized steps)
+    Space Complexity: O(n + q)
+
+    Examples:
+        >>> two_sum_count_bands([1, 2, 3, 4, 5], [(5, 7), (3, 3), (10, 20)])
+        [6, 1, 0]
+    """
+    if np is not None and isinstance(nums, np.ndarray):
+        arr = as_int_array(nums)
+        smallest = int(arr.min()) if arr.size else 0
+        largest = int(arr.max()) if arr.size else 0
+        if max(-smallest, largest) < _CLOSEST_SAFE_MAGNITUDE:
+            sorted_values = np.sort(arr.astype(np.int64, copy=False))
+
+            def at_most(limit: int) -> int:
+                return _pairs_at_most_np(sorted_values, limit)
+
+            return _count_bands(at_most, bands)
+        # Sums beyond int64 are counted with Python ints
+        nums = arr.tolist()
+
+    values = sorted(nums)
+    return _count_bands(partial(_pairs_at_most, values), bands)
+
+
+def _count_bands(
+    at_most: Callable[[int], int], bands: Iterable[tuple[int, int]]
+) -> list[int]:
+    """Answer each band from prefix counts, computing each limit once."""
+    cache: dict[int, int] = {}
+
+    def cached(limit: int) -> int:
+        if limit not in cache:
+            cache[limit] = at_most(limit)
+        return cache[limit]
+
+    return [cached(hi) - cached(lo - 1) if lo <= hi else 0 for lo, hi in bands]
+
+
+def _pairs_at_most(values: Sequence[int], limit: int) -> int:
+    """Count pairs i < j of sorted values with values[i] + values[j] <= limit."""
+    total = 0
+    left, right = 0, len(values) - 1
+    while left < right:
+        if values[left] + values[right] <= limit:
+            # values[left] pairs with everything up to values[right]
+            total += right - left
+            left += 1
+        else:
+            right -= 1
+    return total
+
+
+def k_sum(nums: Sequence[int], target: int, k: int) -> list[tuple[int, ...]]:
+    """Find every distinct combination of k values that sums to target.
+
+    Nesting ``two_sum`` calls finds at most one combination per call and
+    reports the same values again under other indices. This engine works on
+    the distinct values instead: each value is kept with up to k of its
+    indices, so every multiset of values is produced exactly once.
+
+    - k = 2 looks complements up in a hash map of the distinct values.
+    - k = 3 fixes the smallest value and runs the k = 2 kernel on the rest.
+    - k = 4 meets in the middle: the sums of the two smaller values are
+      indexed once and matched against the sums of the two larger ones.
+    - k >= 5 fixes the smallest value and recurses down to k = 4.
+
+    Args:
+        nums: Sequence of integers to search. Must contain at least k
+            elements.
+        target: Target sum to find.
+        k: Number of values per combination (at least 2).
+
+    Returns:
+        One tuple of k ascending indices per distinct multiset of values
+        summing to target, ordered by their sorted values. A value used m
+        times takes the first m indices holding it. Empty if there is none.
+
+    Raises:
+        ValueError: If k is less than 2.
+        ValueError: If nums has fewer than k elements.
+
+    Time Complexity: over the d distinct values, O(n) for k = 2, O(n + d²)
+        for k = 3 (optimal for 3Sum), and O(n + d^(k-2)) plus the number of
+        results for k >= 4
+    Space Complexity: O(n) for k <= 3, O(n + d²) for k >= 4
+
+    Examples:
+        >>> k_sum([-1, 0, 1, 2, -1, -4], 0, 3)
+        [(0, 3, 4), (0, 1, 2)]
+        >>> k_sum([1, 0, -1, 0, -2, 2], 0, 4)
+        [(0, 2, 4, 5), (1, 3, 4, 5), (0, 1, 2, 3)]
+    """
+    if k < 2:
+        raise ValueError(f"k must be at least 2, got {k}")
+    if len(nums) < k:
+        raise ValueError(
+            f"Input list must contain at least {k} elements, got {len(nums)}"
+        )
+
+    # Value -> its first k indices; no combination uses a value more often
+    positions: dict[int, list[int]] = {}
+    for i, num in enumerate(nums):
+        found = positions.get(num)
+        if found is None:
+            positions[num] = [i]
+        elif len(found) < k:
+            found.append(i)
+
+    values = sorted(positions)
+    counts = [len(positions[value]) for value in values]
+    index = {value: rank for rank, value in enumerate(values)}
+
+    results: list[tuple[int, ...]] = []
+    for combo in sorted(_k_sum_ranks(values, counts, index, 0, target, k)):
+        indices: list[int] = []
+        for rank, group in groupby(combo):
+            indices.extend(positions[values[rank]][: len(list(group))])
+        results.append(tuple(sorted(indices)))
+    return results
+
+
+def _k_sum_ranks(
+    values: list[int],
+    counts: list[int],
+    index: dict[int, int],
+    start: int,
+    target: int,
+    k: int,
+) -> Iterator[tuple[int, ...]]:
+    """Yield non-decreasing rank tuples from ``start`` that sum to target.
+
+    Ranks are positions in the sorted distinct ``values``; ``counts`` holds
+    how many more times each value may be used and is updated in place
+    while a smaller value is fixed.
+    """
+    if k == 2:
+        yield from _pair_ranks(values, counts, index, start, target)
+        return
+    if k == 4:
+        yield from _quad_ranks(values, counts, start, target)
+        return
+
+    highest = values[-1]
+    for rank in range(start, len(values)):
+        value = values[rank]
+        if value * k > target:
+            break  # every remaining value is at least as large
+        if not counts[rank] or value + (k - 1) * highest < target:
+            continue
+        counts[rank] -= 1
+        for rest in _k_sum_ranks(values, counts, index, rank, target - value, k - 1):
+            yield (rank, *rest)
+        counts[rank] += 1
+
+
+def _pair_ranks(
+    values: list[int],
+    counts: list[int],
+    index: dict[int, int],
+    start: int,
+    target: int,
+) -> Iterator[tuple[int, int]]:
+    """Hash kernel: yield rank pairs (a, b), start <= a <= b, summing to target.
+
+    Only values in ``[target - max, target // 2]`` can be the smaller half
+    of a pair, so the scan is limited to that slice of ``values``.
+    """
+    get = index.get
+    low = bisect_left(values, target - values[-1], start)
+    high = bisect_right(values, target // 2)
+    for a in range(low, high):
+        b = get(target - values[a])
+        if b is None or not counts[a] or not counts[b]:
+            continue
+        if a != b or counts[a] >= 2:
+            yield (a, b)
+
+
+def _quad_ranks(
+    values: list[int], counts: list[int], start: int, target: int
+) -> Iterator[tuple[int, int, int, int]]:
+    """Meet in the middle: yield rank quadruples (a, b, c, d), a <= b <= c <= d.
+
+    Sums of the lower pairs (a, b) are indexed with b ascending, then every
+    upper pair (c, d) looks up the complement of its sum and takes the
+    lower pairs with b <= c, so each quadruple is produced once.
+    """
+    size = len(values)
+    highest = values[-1]
+    lowest = values[start]
+
+    # Pair sum -> lower pairs encoded as a * size + b, in ascending b.
+    # A lower pair needs an upper pair with c >= b, i.e. a sum between
+    # 2 * values[b] and 2 * highest.
+    lower: dict[int, list[int]] = {}
+    for b in range(start, size):
+        if not counts[b]:
+            continue
+        vb = values[b]
+        if 3 * vb + lowest > target:
+            break
+        low = bisect_left(values, target - vb - 2 * highest, start, b + 1)
+        high = bisect_right(values, target - 3 * vb, start, b + 1)
+        for a in range(low, high):
+            if counts[a] and (a != b or counts[a] >= 2):
+                lower.setdefault(values[a] + vb, []).append(a * size + b)
+
+    # An upper pair needs a lower sum between 2 * lowest and 2 * values[c]
+    for c in range(start, size):
+        if not counts[c]:
+            continue
+        vc = values[c]
+        low = bisect_left(values, target - 3 * vc, c)
+        high = bisect_right(values, target - vc - 2 * lowest, c)
+        for d in range(low, high):
+            if not counts[d] or (c == d and counts[c] < 2):
+                continue
+            pairs = lower.get(target - vc - values[d])
+            if pairs is None:
+                continue
+            for pair in pairs:
+                a, b = divmod(pair, size)
+                if b > c:
+                    break
+                if b < c or _fits(counts, (a, b, c, d)):
+                    yield (a, b, c, d)
+
+
+def _fits(counts: list[int], ranks: tuple[int, ...]) -> bool:
+    """Return True if no rank is used more often than its count allows."""
+    return all(ranks.count(rank) <= counts[rank] for rank in set(ranks))
+
+
+def two_sum_closest(nums: "Sequence[int] | npt.NDArray[Any]", target: int) -> list[int]:
+    """Find the pair whose sum is nearest to target.
+
+    Unlike ``two_sum`` this never fails for lack of an exact match: it
+    returns the pair minimizing ``|nums[i] + nums[j] - target|`` (an exact
+    pair when one exists). The values are sorted once, then a two-pointer
+    scan moves inward from both ends, keeping the closest sum seen.
+
+    NumPy arrays take a vectorized path instead: after an argsort, each
+    element's best partner among the larger values is located with
+    ``searchsorted`` in chunks of ``_NP_CHUNK_SIZE``.
+
+    Args:
+        nums: Sequence of integers, or a one-dimensional integer ndarray.
+            Must contain at least 2 elements.
+        target: Target sum to approach.
+
+    Returns:
+        List containing two indices [i, j] with i < j whose values sum
+        closest to target. When several pairs are equally close, any one of
+        them may be returned.
+
+    Raises:
+        ValueError: If nums has fewer than 2 elements.
+        TypeError: If an ndarray does not contain integers.
+
+    Time Complexity: O(n log n) - dominated by the sort
+    Space Complexity: O(n) - the sort permutation and sorted values
+
+    Examples:
+        >>> two_sum_closest([2, 7, 11, 15], 19)
+        [1, 2]
+        >>> two_sum_closest([2, 7, 11, 15], 9)
+        [0, 1]
+    """
+    if np is not None and isinstance(nums, np.ndarray):
+        return _two_sum_closest_np(as_int_array(nums), target)
+
+    n = len(nums)
+    if n < 2:
+        raise ValueError(f"Input list must contain at least 2 elements, got {n}")
+
+    order = sorted(range(n), key=nums.__getitem__)
+    values = [nums[i] for i in order]
+
+    best_gap, best = -1, (0, 1)
+    left, right = 0, n - 1
+    while left < right:
+        total = values[left] + values[right]
+        gap = abs(total - target)
+        if best_gap < 0 or gap < best_gap:
+            best_gap, best = gap, (left, right)
+            if gap == 0:
+                break
+        # Moving the pointer on the side of the error can only get closer
+        if total < target:
+            left += 1
+        else:
+            right -= 1
+
+    i, j = order[best[0]], order[best[1]]
+    return [min(i, j), max(i, j)]
+
+
+def two_sum_tolerance(
+    nums: "Sequence[float] | npt.NDArray[Any]", target: float, eps: float
+) -> list[int]:
+    """Find two indices whose values sum to target within a tolerance.
+
+    Exact lookups cannot match floating-point amounts, so this variant
+    accepts any pair with ``|nums[i] + nums[j] - target| <= eps``. The
+    values are sorted once; then, in ascending order, each value's partners
+    among the larger values are the range ``[target - x - eps,
+    target - x + eps]``, found with two binary searches. The bounds are
+    widened by a few ulps of ``target`` and ``x`` so that rounding cannot
+    drop a partner, and each candidate is confirmed with the float test
+    itself. The scan stops at the first value with a partner, or once
+    ``2 * x`` exceeds ``target + eps``.
+
+    NumPy arrays take a vectorized path with ``searchsorted`` over chunks
+    of ``_NP_CHUNK_SIZE`` elements. float64 arrays are searched as they
+    are; other real dtypes are converted to float64 once.
+
+    Args:
+        nums: Sequence of numbers, or a one-dimensional real ndarray. Must
+            contain at least 2 elements and no NaN.
+        target: Target sum to match.
+        eps: Largest accepted distance from target. 0 asks for an exact sum.
+
+    Returns:
+        List containing two indices [i, j] with i < j and
+        ``abs(nums[i] + nums[j] - target) <= eps``: the pair with the
+        smallest value that has a partner, matched with its smallest
+        partner. Both paths return the same pair for float64 data. With
+        eps 0 this finds pairs whose float sum equals target.
+
+    Raises:
+        ValueError: If eps is negative or NaN.
+        ValueError: If nums has fewer than 2 elements or contains NaN.
+        ValueError: If no pair is within eps of target.
+        TypeError: If an ndarray does not contain real numbers.
+
+    Time Complexity: O(n log n) - the sort, then two binary searches per
+        value
+    Space Complexity: O(n) - the sort permutation and sorted values
+
+    Examples:
+        >>> two_sum_tolerance([0.1, 5.0, 0.2], 0.3, 1e-9)  # 0.1 + 0.2 != 0.3
+        [0, 2]
+        >>> two_sum_tolerance([1.0, 2.0, 4.0], 5.05, 0.1)
+        [0, 2]
+    """
+    if not eps >= 0:
+        raise ValueError(f"eps must be non-negative, got {eps}")
+    if np is not None and isinstance(nums, np.ndarray):
+        return _two_sum_tolerance_np(nums, target, eps)
+
+    n = len(nums)
+    if n < 2:
+        raise ValueError(f"Input list must contain at least 2 elements, got {n}")
+    if any(num != num for num in nums):
+        raise ValueError("Input must not contain NaN")
+
+    order = sorted(range(n), key=nums.__getitem__)
+    values = [nums[i] for i in order]
+    base = _tolerance_slack(target, eps)
+    limit = target + eps + base
+
+    for p, value in enumerate(values):
+        # Partners come later in sorted order, so the sum is at least 2x
+        if value + value > limit:
+            break
+        slack = _finite_or_zero(base + 2 * math.ulp(value))
+        high = target - value + eps + slack
+        q = bisect_left(values, target - value - eps - slack, p + 1)
+        if q < n and values[q] <= high:
+            k = _tolerance_partner(
+                values, value, q, bisect_right(values, high, q), target, eps
+            )
+            if k is not None:
+                i, j = order[p], order[k]
+                return [min(i, j), max(i, j)]
+
+    raise ValueError(f"No two numbers in the list sum to {target} within {eps}")
+
+
+def _tolerance_slack(target: float, eps: float) -> float:
+    """Return the rounding slack that ``value + partner`` can carry.
+
+    A float sum within eps of target is rounded to the ulp of
+    ``|target| + eps``; searching for ``target - value`` rounds once more
+    at the ulp of value, which callers add per value. Infinite bounds
+    need no slack.
+    """
+    return _finite_or_zero(2 * math.ulp(abs(target) + eps))
+
+
+def _finite_or_zero(slack: float) -> float:
+    """Return slack, or 0 when an infinite operand made it infinite."""
+    return slack if slack < math.inf else 0.0
+
+
+def _tolerance_partner(
+    values: "Sequence[float] | npt.NDArray[np.float64]",
+    value: float,
+    start: int,
+    stop: int,
+    target: float,
+    eps: float,
+) -> int | None:
+    """Return the first position in [start, stop) within eps of a partner.
+
+    The binary-search bounds are rounded, so candidates are confirmed with
+    the exact test; normally the first one passes.
+    """
+    for k in range(start, stop):
+        if abs(value + values[k] - target) <= eps:
+            return k
+    return None
+
+
+def two_sum_mmap(
+    path: str | os.PathLike[str],
+    target: int,
+    dtype: str = "int64",
+    *,
+    vectorized: bool | None = None,
+) -> list[int]:
+    """Two Sum over a raw binary file of little-endian integers.
+
+    The file is memory-mapped and searched in place, so the operating
+    system's page cache does the I/O and no Python list is ever built
+    (a list costs 28+ bytes per int plus 8 bytes per slot). Two paths are
+    available:
+
+    - vectorized: the mapped pages are handed to ``two_sum_np`` as an
+      ``np.memmap`` without copying (int32 data is widened once).
+    - chunked: blocks of ``_MMAP_CHUNK_SIZE`` elements are read through a
+      ``memoryview`` and fed to ``two_sum_stream_chunks``, stopping at the
+      first block that completes the pair. Needs no third-party packages.
+
+    Args:
+        path: Path to a file holding nothing but packed integers.
+        target: Target sum to find.
+        dtype: On-disk element type, "int32" or "int64".
+        vectorized: Force the vectorized (True) or chunked (False) path.
+            By default the vectorized path is used when NumPy is installed.
+
+    Returns:
+        List containing two element indices [i, j] where
+        data[i] + data[j] == target. The chunked path returns the same pair
+        as ``two_sum``; so does the vectorized one, via ``two_sum_np``.
+
+    Raises:
+        ImportError: If vectorized=True and NumPy is not installed.
+        ValueError: If dtype is not supported or the file size is not a
+            multiple of the element size.
+        ValueError: If the file holds fewer than 2 elements.
+        ValueError: If no solution exists.
+
+    Time Complexity: O(n log n) vectorized, O(m) chunked (m = pair position)
+    Space Complexity: O(n) for the index; the data itself stays on disk
+    """
+    typecode, count = _mapped_length(path, dtype)
+    # mmap cannot map an empty file; fail with the usual message instead
+    if count < 2:
+        raise ValueError(f"Input list must contain at least 2 elements, got {count}")
+
+    if vectorized is None:
+        vectorized = np is not None
+    if vectorized:
+        require_numpy("two_sum_mmap(vectorized=True)")
+        data = np.memmap(path, dtype=np.dtype(dtype).newbyteorder("<"), mode="r")
+        return two_sum_np(data, target)
+
+    with (
+        open(path, "rb") as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        view = memoryview(mapped).cast(typecode)
+        try:
+            return two_sum_stream_chunks(_mapped_blocks(view), target)
+        finally:
+            view.release()
+
+
+def two_sum_cross_mmap(
+    a: Sequence[int],
+    path: str | os.PathLike[str],
+    target: int,
+    dtype: str = "int64",
+    *,
+    vectorized: bool | None = None,
+) -> list[int]:
+    """``two_sum_cross`` between an in-memory sequence and a binary file.
+
+    The file (packed little-endian integers, as for ``two_sum_mmap``) is
+    memory-mapped and streamed against an index of a, so a multi-GB file
+    is read page by page and the search stops at the first match. If the
+    file is the smaller side, it is indexed instead.
+
+    - vectorized: the mapping is handed to ``two_sum_cross_np`` as an
+      ``np.memmap`` and searched one chunk at a time.
+    - chunked: blocks of ``_MMAP_CHUNK_SIZE`` elements are read through a
+      ``memoryview`` and probed against a dict. Needs no third-party
+      packages.
+
+    Args:
+        a: Sequence of integers kept in memory. Must not be empty.
+        path: Path to a file holding nothing but packed integers.
+        target: Target sum to find.
+        dtype: On-disk element type, "int32" or "int64".
+        vectorized: Force the vectorized (True) or chunked (False) path.
+            By default the vectorized path is used when NumPy is installed.
+
+    Returns:
+        List [i, j] where a[i] + data[j] == target, the same pair as
+        ``two_sum_cross(a, data, target)`` on both paths.
+
+    Raises:
+        ImportError: If vectorized=True and NumPy is not installed.
+        ValueError: If dtype is not supported or the file size is not a
+            multiple of the element size.
+        ValueError: If a or the file is empty.
+        ValueError: If no solution exists.
+
+    Time Complexity: O(s + m) chunked, O(s log s + m) vectorized - s is the
+        smaller length, m the position in the larger input of the match
+    Space Complexity: O(s) for the index; the file stays on disk
+    """
+    typecode, count = _mapped_length(path, dtype)
+    if not len(a) or not count:
+        raise ValueError(
+            f"Both inputs must be non-empty, got {len(a)} and {count} elements"
+        )
+
+    if vectorized is None:
+        vectorized = np is not None
+    if vectorized:
+        require_numpy("two_sum_cross_mmap(vectorized=True)")
+        data = np.memmap(path, dtype=np.dtype(dtype).newbyteorder("<"), mode="r")
+        return two_sum_cross_np(a, data, target)
+
+    with (
+        open(path, "rb") as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        view = memoryview(mapped).cast(typecode)
+        try:
+            # The block generator is passed inline: it must be gone (and
+            # its last slice released) before the view is released
+            if len(a) <= count:
+                found = _cross_scan(
+                    _first_positions(a),
+                    chain.from_iterable(_mapped_blocks(view)),
+                    target,
+                )
+            else:
+                indexed = _first_positions(
+                    list(chain.from_iterable(_mapped_blocks(view)))
+                )
+                swapped = _cross_scan(indexed, a, target)
+                found = None if swapped is None else (swapped[1], swapped[0])
+        finally:
+            view.release()
+    if found is None:
+        raise ValueError(f"No two numbers in the lists sum to {target}")
+    return [found[0], found[1]]
+
+
+def _mapped_length(
+    path: str | os.PathLike[str], dtype: str
+) -> tuple[Literal["i", "q"], int]:
+    """Validate a packed integer file; return its typecode and length."""
+    typecode = _MMAP_TYPECODES.get(dtype)
+    if typecode is None:
+        raise ValueError(
+            f"Unsupported dtype {dtype!r}, expected one of {sorted(_MMAP_TYPECODES)}"
+        )
+    itemsize = array(typecode).itemsize
+    size = os.path.getsize(path)
+    if size % itemsize:
+        raise ValueError(
+            f"File size {size} is not a multiple of the {dtype} size ({itemsize})"
+        )
+    return typecode, size // itemsize
+
+
+def _mapped_blocks(view: memoryview) -> Iterator[list[int]]:
+    """Yield blocks of a little-endian typed memoryview as int lists."""
+    for start in range(0, len(view), _MMAP_CHUNK_SIZE):
+        # Release each slice right away so the mapping can be closed
+        with view[start : start + _MMAP_CHUNK_SIZE] as block:
+            if sys.byteorder == "little":
+                yield block.tolist()
+            else:  # pragma: no cover - big-endian hosts only
+                swapped = array(block.format, block)
+                swapped.byteswap()
+                yield swapped.tolist()
+
+
+def require_numpy(feature: str) -> None:
+    """Raise a helpful ImportError when NumPy is not installed."""
+    if np is None:
+        raise ImportError(
+            f"{feature} requires NumPy; install it with `uv sync --extra numpy`"
+        )
+
+
+def as_int_array(nums: "npt.ArrayLike") -> "npt.NDArray[Any]":
+    """View ``nums`` as a 1-D integer ndarray without copying when possible.
+
+    NumPy arrays and buffer-protocol objects (``array.array``,
+    ``memoryview``, ``mmap``) are wrapped in place; other sequences are
+    converted once.
+
+    Raises:
+        ValueError: If the input is not one-dimensional.
+        TypeError: If the input does not hold integers.
+    """
+    arr = np.asarray(nums)
+    if arr.ndim != 1:
+        raise ValueError(f"Input must be one-dimensional, got shape {arr.shape}")
+    if arr.size and not np.issubdtype(arr.dtype, np.integer):
+        raise TypeError(f"Input must contain integers, got dtype {arr.dtype}")
+    return arr
+
+
+def two_sum_np(
+    nums: "npt.ArrayLike",
+    target: int,
+    *,
+    presorted: bool = False,
+    stats: TwoSumStats | None = None,
+) -> list[int]:
+    """Vectorized Two Sum for NumPy arrays and buffer-protocol objects.
+
+    The values are sorted once with a stable argsort, then the complement of
+    every element is located with ``searchsorted`` in chunks of
+    ``_NP_CHUNK_SIZE`` elements. Because the sort is stable, the first
+    position of each value is known, which is enough to find the same pair
+    the hash map version returns: the smallest ``j`` whose complement
+    appears before it, paired with the latest such index ``i < j``.
+
+    With ``presorted=True`` the argsort is skipped and the input itself is
+    searched, saving the O(n log n) sort and its 16 bytes per element.
+
+    Inputs whose value range is small relative to their size (see
+    ``two_sum_bounded``) skip the sort as well: a direct-address table
+    holding the first index of every value in the range answers each
+    complement lookup in O(1).
+
+    Args:
+        nums: One-dimensional integer data, e.g. ``np.ndarray``,
+            ``array.array`` or ``memoryview``. Buffers are not copied into
+            a Python list.
+        target: Target sum to find.
+        presorted: Set to True only if nums is in ascending order.
+        stats: Optional ``TwoSumStats`` to fill in (see ``two_sum``). The
+            vectorized search counts whole chunks as scanned.
+
+    Returns:
+        List containing two indices [i, j] where nums[i] + nums[j] == target,
+        identical to ``two_sum(list(nums), target)``.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        TypeError: If nums does not contain integers.
+        ValueError: If nums has fewer than 2 elements.
+        ValueError: If no solution exists.
+
+    Time Complexity: O(n log n) - dominated by the argsort (or by the
+        binary searches with presorted=True); O(n + max - min) for small
+        value ranges
+    Space Complexity: O(n) - the sort permutation and sorted values
+        (O(1) beyond bounded chunk buffers with presorted=True)
+
+    Examples:
+        >>> import numpy as np
+        >>> two_sum_np(np.array([2, 7, 11, 15]), 9)
+        [0, 1]
+        >>> from array import array
+        >>> two_sum_np(array("q", [3, 2, 4]), 6)
+        [1, 2]
+    """
+    require_numpy("two_sum_np")
+    if stats is not None:
+        stats.start()
+    arr = as_int_array(nums)
+    n = arr.size
+    if n < 2:
+        raise ValueError(f"Input list must contain at least 2 elements, got {n}")
+    if stats is not None:
+        stats.lap("convert")
+
+    if presorted:
+        lo, hi = int(arr[0]), int(arr[-1])
+    else:
+        lo, hi = int(arr.min()), int(arr.max())
+    if stats is not None:
+        stats.lap("range")
+    # No pair can reach a target outside [2 * min, 2 * max]
+    if not 2 * lo <= target <= 2 * hi:
+        raise ValueError(f"No two numbers in the list sum to {target}")
+
+    # uint64 data or a target beyond int64 cannot be handled with int64
+    # arithmetic; fall back to exact Python ints for these rare inputs.
+    if hi > _INT64_MAX or not _INT64_MIN <= target <= _INT64_MAX:
+        return two_sum(arr.tolist(), target, presorted=presorted, stats=stats)
+
+    values = arr.astype(np.int64, copy=False)
+    if stats is not None:
+        stats.lap("convert")
+    span = hi - lo + 1
+    if not presorted and span <= max(
+        _DIRECT_ADDRESS_MIN_SPAN, _DIRECT_ADDRESS_SPAN_RATIO * n
+    ):
+        return _two_sum_direct_np(values, target, lo, span, stats)
+
+    # Complements outside the int64 range wrap around and must be ignored
+    may_overflow = not _INT64_MIN <= target - hi <= target - lo <= _INT64_MAX
+
+    if presorted:
+        # Sorted input is its own sort permutation: position == index
+        order = None
+        sorted_values = values
+    else:
+        order = np.argsort(values, kind="stable")
+        sorted_values = values[order]
+    if stats is not None:
+        stats.strategy = "presorted-search" if presorted else "sort-search"
+        if order is not None:
+            stats.index_size += n
+            stats.index_bytes += order.nbytes + sorted_values.nbytes
+            stats.lap("sort")
+    t = np.int64(target)
+
+    for start in range(0, n, _NP_CHUNK_SIZE):
+        stop = min(start + _NP_CHUNK_SIZE, n)
+        chunk = values[start:stop]
+        complements = t - chunk
+        pos = np.searchsorted(sorted_values, complements, side="left")
+        np.minimum(pos, n - 1, out=pos)
+        hits = sorted_values[pos] == complements
+        if may_overflow:
+            hits &= ((t ^ chunk) & (t ^ complements)) >= 0
+        # A hit only counts if the complement first occurs before j
+        first = pos if order is None else order[pos]
+        hits &= first < np.arange(start, stop)
+        if not hits.any():
+            continue
+
+        offset = int(np.argmax(hits))
+        j = start + offset
+        complement = complements[offset]
+        left = int(pos[offset])
+        right = int(np.searchsorted(sorted_values, complement, side="right"))
+        # Indices of the complement in ascending order (stable sort)
+        positions = np.arange(left, right) if order is None else order[left:right]
+        i = int(positions[np.searchsorted(positions, j, side="left") - 1])
+        if stats is not None:
+            stats.elements_scanned += stop
+            stats.lap("search")
+        return [i, j]
+
+    if stats is not None:
+        stats.elements_scanned += n
+        stats.lap("search")
+    raise ValueError(f"No two numbers in the list sum to {target}")
+
+
+def _two_sum_closest_np(arr: "npt.NDArray[Any]", target: int) -> list[int]:
+    """Vectorized ``two_sum_closest`` for a one-dimensional integer array.
+
+    For the element at sorted position p, the best partner among positions
+    after p sits next to the insertion point of ``target - value``, so two
+    candidates per element cover every pair.
+    """
+    n = arr.size
+    if n < 2:
+        raise ValueError(f"Input list must contain at least 2 elements, got {n}")
+
+    lo, hi = int(arr.min()), int(arr.max())
+    # Sums and gaps must stay within int64; fall back to Python ints otherwise
+    if max(-lo, hi) >= _CLOSEST_SAFE_MAGNITUDE or (
+        abs(target) >= _CLOSEST_SAFE_MAGNITUDE
+    ):
+        return two_sum_closest(arr.tolist(), target)
+
+    values = arr.astype(np.int64, copy=False)
+    # Ties may resolve to any pair, so the faster unstable sort will do
+    order = np.argsort(values)
+    sorted_values = values[order]
+    t = np.int64(target)
+
+    best_gap, best = -1, (0, 1)
+    for start in range(0, n - 1, _NP_CHUNK_SIZE):
+        stop = min(start + _NP_CHUNK_SIZE, n - 1)
+        chunk = sorted_values[start:stop]
+        pos = np.searchsorted(sorted_values, t - chunk, side="left")
+        after = np.arange(start + 1, stop + 1)
+        for candidates in (pos - 1, pos):
+            # Partners must come later in sorted order
+            np.clip(candidates, after, n - 1, out=candidates)
+            gaps = np.abs(chunk + sorted_values[candidates] - t)
+            offset = int(np.argmin(gaps))
+            gap = int(gaps[offset])
+            if best_gap < 0 or gap < best_gap:
+                best_gap = gap
+                best = (start + offset, int(candidates[offset]))
+        if best_gap == 0:
+            break
+
+    i, j = int(order[best[0]]), int(order[best[1]])
+    return [min(i, j), max(i, j)]
+
+
+def _two_sum_tolerance_np(
+    nums: "npt.NDArray[Any]", target: float, eps: float
+) -> list[int]:
+    """Vectorized ``two_sum_tolerance`` for a one-dimensional real array."""
+    if nums.ndim != 1:
+        raise ValueError(f"Input must be one-dimensional, got shape {nums.shape}")
+    if nums.dtype.kind not in "fiu":
+        raise TypeError(f"Input must contain real numbers, got dtype {nums.dtype}")
+    n = nums.size
+    if n < 2:
+        raise ValueError(f"Input list must contain at least 2 elements, got {n}")
+
+    values = nums.astype(np.float64, copy=False)
+    order = np.argsort(values, kind="stable")
+    sorted_values = values[order]
+    # NaN sorts last
+    if np.isnan(sorted_values[-1]):
+        raise ValueError("Input must not contain NaN")
+
+    base = _tolerance_slack(target, eps)
+    limit = target + eps + base
+    for start in range(0, n - 1, _NP_CHUNK_SIZE):
+        stop = min(start + _NP_CHUNK_SIZE, n - 1)
+        chunk = sorted_values[start:stop]
+        # Same widening as the list path; spacing(inf) is NaN
+        slacks = base + 2 * np.spacing(np.abs(chunk))
+        slacks[~np.isfinite(slacks)] = 0.0
+        lows = target - chunk - eps - slacks
+        lefts = np.searchsorted(sorted_values, lows, side="left")
+        # Partners must come later in sorted order
+        np.maximum(lefts, np.arange(start + 1, stop + 1), out=lefts)
+        highs = target - chunk + eps + slacks
+        rights = np.searchsorted(sorted_values, highs, side="right")
+        for offset in np.flatnonzero(lefts < rights).tolist():
+            value = float(chunk[offset])
+            k = _tolerance_partner(
+                sorted_values,
+                value,
+                int(lefts[offset]),
+                int(rights[offset]),
+                target,
+                eps,
+            )
+            if k is not None:
+                i, j = int(order[start + offset]), int(order[k])
+                return [min(i, j), max(i, j)]
+        if chunk[-1] + chunk[-1] > limit:
+            break
+
+    raise ValueError(f"No two numbers in the list sum to {target} within {eps}")
+
+
+def _two_sum_count_np(arr: "npt.NDArray[Any]", target: int) -> int:
+    """Vectorized ``two_sum_count`` for a one-dimensional integer array."""
+    n = arr.size
+    if n < 2:
+        return 0
+    # uint64 data or a target beyond int64 cannot be handled with int64
+    # arithmetic; count exact Python ints instead, one chunk at a time.
+    if not _INT64_MIN <= target <= _INT64_MAX or (
+        arr.dtype.kind == "u" and int(arr.max()) > _INT64_MAX
+    ):
+        chunks = (
+            arr[start : start + _NP_CHUNK_SIZE].tolist()
+            for start in range(0, n, _NP_CHUNK_SIZE)
+        )
+        return two_sum_count(chain.from_iterable(chunks), target)
+
+    values, counts = _unique_counts_np(arr)
+    lo, hi = int(values[0]), int(values[-1])
+    # No pair can reach a target outside [2 * min, 2 * max]
+    if not 2 * lo <= target <= 2 * hi:
+        return 0
+
+    # Values x < target - x whose complement can be present, i.e. x in
+    # [target - hi, target / 2); their complements lie in [lo, hi]
+    first = int(np.searchsorted(values, max(target - hi, lo), side="left"))
+    half = -(-target // 2)  # smallest x with 2 * x >= target
+    last = int(np.searchsorted(values, half, side="left"))
+
+    total = 0
+    if first < last:
+        complements = np.int64(target) - values[first:last]
+        pos = np.searchsorted(values, complements, side="left")
+        np.minimum(pos, values.size - 1, out=pos)
+        matched = values[pos] == complements
+        left = counts[first:last][matched]
+        right = counts[pos[matched]]
+        if n <= _COUNT_INT64_SIZE:
+            total = int(np.dot(left, right))
+        else:  # pragma: no cover - over 4 billion elements
+            pairs = zip(left.tolist(), right.tolist(), strict=True)
+            total = sum(a * b for a, b in pairs)
+
+    if target % 2 == 0:
+        middle = int(np.searchsorted(values, target // 2, side="left"))
+        if values[middle] == target // 2:
+            count = int(counts[middle])
+            total += count * (count - 1) // 2
+    return total
+
+
+def _unique_counts_np(
+    arr: "npt.NDArray[Any]",
+) -> tuple["npt.NDArray[np.int64]", "npt.NDArray[np.int64]"]:
+    """Return the sorted distinct values of arr and their frequencies.
+
+    Each chunk is reduced with ``np.unique``; the partial results are merged
+    whenever they outgrow the merged table, so every distinct value takes
+    part in O(log n) merges and memory stays O(distinct values + chunk).
+    """
+    merged_values = np.empty(0, dtype=np.int64)
+    merged_counts = np.empty(0, dtype=np.int64)
+    pending: list[tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]] = []
+    pending_size = 0
+
+    for start in range(0, arr.size, _NP_CHUNK_SIZE):
+        chunk = arr[start : start + _NP_CHUNK_SIZE].astype(np.int64, copy=False)
+        chunk_values, chunk_counts = np.unique(chunk, return_counts=True)
+        pending.append((chunk_values, chunk_counts.astype(np.int64, copy=False)))
+        pending_size += chunk_values.size
+        if pending_size >= merged_values.size:
+            pending.append((merged_values, merged_counts))
+            merged_values, merged_counts = _merge_counts(pending)
+            pending, pending_size = [], 0
+
+    if pending:
+        pending.append((merged_values, merged_counts))
+        merged_values, merged_counts = _merge_counts(pending)
+    return merged_values, merged_counts
+
+
+def _merge_counts(
+    parts: list[tuple["npt.NDArray[np.int64]", "npt.NDArray[np.int64]"]],
+) -> tuple["npt.NDArray[np.int64]", "npt.NDArray[np.int64]"]:
+    """Merge (values, counts) tables, adding the counts of equal values."""
+    if len(parts) == 1:
+        return parts[0]
+    values = np.concatenate([part[0] for part in parts])
+    counts = np.concatenate([part[1] for part in parts])
+    order = np.argsort(values, kind="stable")
+    values, counts = values[order], counts[order]
+    starts = np.flatnonzero(np.concatenate(([True], values[1:] != values[:-1])))
+    return values[starts], np.add.reduceat(counts, starts)
+
+
+def _pairs_at_most_np(sorted_values: "npt.NDArray[np.int64]", limit: int) -> int:
+    """Vectorized ``_pairs_at_most`` for values within the safe magnitude.
+
+    For sorted position i, the partners after i with a small enough sum
+    end at the insertion point of ``limit - value``. Only positions with
+    ``2 * value <= limit`` can have one, and limits outside
+    [2 * min, 2 * max] are answered directly, so ``limit - value`` stays
+    within int64.
+    """
+    n = sorted_values.size
+    if n < 2 or limit < 2 * int(sorted_values[0]):
+        return 0
+    if limit >= 2 * int(sorted_values[-1]):
+        return n * (n - 1) // 2
+
+    t = np.int64(limit)
+    last = int(np.searchsorted(sorted_values, limit // 2, side="right"))
+    total = 0
+    for start in range(0, last, _NP_CHUNK_SIZE):
+        stop = min(start + _NP_CHUNK_SIZE, last)
+        ends = np.searchsorted(
+            sorted_values, t - sorted_values[start:stop], side="right"
+        )
+        ends -= np.arange(start + 1, stop + 1)
+        total += int(ends.sum())
+    return total
+
+
+def _two_sum_direct_np(
+    values: "npt.NDArray[np.int64]",
+    target: int,
+    lo: int,
+    span: int,
+    stats: TwoSumStats | None = None,
+) -> list[int]:
+    """Vectorized direct-address ``two_sum`` for a small value range.
+
+    ``first[v - lo]`` holds the first index of value v (n if absent). The
+    first j whose complement's first index is below j ends the search, and
+    the complement's latest index before j completes the pair. The caller
+    has already rejected targets outside ``[2 * lo, 2 * hi]``, so the
+    offset arithmetic stays within a few spans of zero.
+    """
+    n = values.size
+    index_type = np.int32 if n < _INT32_LIMIT else np.int64
+    first = np.full(span, n, dtype=index_type)
+    # Repeated fancy indices leave an unspecified write, so take the
+    # minimum explicitly; ufunc.at is unbuffered and O(n)
+    np.minimum.at(first, values - lo, np.arange(n, dtype=index_type))
+    if stats is not None:
+        stats.strategy = "direct-address"
+        stats.index_size += span
+        stats.index_bytes += first.nbytes
+        stats.lap("table")
+
+    base = np.int64(target - lo)
+    for start in range(0, n, _NP_CHUNK_SIZE):
+        stop = min(start + _NP_CHUNK_SIZE, n)
+        offsets = base - values[start:stop]
+        in_range = (offsets >= 0) & (offsets < span)
+        np.clip(offsets, 0, span - 1, out=offsets)
+        hits = in_range & (first[offsets] < np.arange(start, stop))
+        if not hits.any():
+            continue
+
+        j = start + int(np.argmax(hits))
+        complement = target - int(values[j])
+        i = int(np.flatnonzero(values[:j] == complement)[-1])
+        if stats is not None:
+            stats.elements_scanned += stop
+            stats.lap("search")
+        return [i, j]
+
+    if stats is not None:
+        stats.elements_scanned += n
+        stats.lap("search")
+    raise ValueError(f"No two numbers in the list sum to {target}")
+
+
+def two_sum_cross_np(a: "npt.ArrayLike", b: "npt.ArrayLike", target: int) -> list[int]:
+    """Vectorized ``two_sum_cross`` for NumPy arrays and buffers.
+
+    The smaller input is reduced to its sorted distinct values and their
+    first indices (``np.unique``); the larger one is scanned in chunks of
+    ``_NP_CHUNK_SIZE`` elements, and only elements whose complement falls in
+    the smaller input's value range are located with ``searchsorted``. The
+    scan stops at the first chunk with a match. Only one chunk of the larger
+    input is converted at a time, so it can be an ``np.memmap`` of a file far
+    larger than memory (see ``two_sum_cross_mmap``).
+
+    Args:
+        a: One-dimensional integer data (list, ndarray or buffer).
+        b: One-dimensional integer data (list, ndarray or buffer).
+        target: Target sum to find.
+
+    Returns:
+        List [i, j] where a[i] + b[j] == target, identical to
+        ``two_sum_cross(list(a), list(b), target)``.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        TypeError: If a or b does not contain integers.
+        ValueError: If a or b is empty.
+        ValueError: If no solution exists.
+
+    Time Complexity: O(s log s + m log s) - s is the smaller length, m the
+        position in the larger input where the pair completes
+    Space Complexity: O(s + chunk) - the index plus one chunk's temporaries
+
+    Examples:
+        >>> import numpy as np
+        >>> two_sum_cross_np(np.array([1, 5, 9]), np.array([10, 4, 2]), 13)
+        [2, 1]
+    """
+    require_numpy("two_sum_cross_np")
+    left, right = as_int_array(a), as_int_array(b)
+    if not left.size or not right.size:
+        raise ValueError(
+            f"Both inputs must be non-empty, got {left.size} and {right.size} elements"
+        )
+
+    swapped = left.size > right.size
+    small, large = (right, left) if swapped else (left, right)
+    found = _cross_search_np(small, large, target)
+    if found is None:
+        raise ValueError(f"No two numbers in the lists sum to {target}")
+    i, j = found
+    return [j, i] if swapped else [i, j]
+
+
+def _cross_search_np(
+    small: "npt.NDArray[Any]", large: "npt.NDArray[Any]", target: int
+) -> tuple[int, int] | None:
+    """Return (small position, large position) of the first match."""
+    values, first = np.unique(small, return_index=True)
+    large_max = int(large.max()) if large.dtype.kind == "u" else _INT64_MAX
+    # uint64 data or a target beyond int64 cannot be handled with int64
+    # arithmetic; fall back to exact Python ints for these rare inputs.
+    if (
+        int(values[-1]) > _INT64_MAX
+        or large_max > _INT64_MAX
+        or not _INT64_MIN <= target <= _INT64_MAX
+    ):
+        chunks = (
+            large[start : start + _NP_CHUNK_SIZE].tolist()
+            for start in range(0, large.size, _NP_CHUNK_SIZE)
+        )
+        index = dict(zip(values.tolist(), first.tolist(), strict=True))
+        return _cross_scan(index, chain.from_iterable(chunks), target)
+
+    values = values.astype(np.int64, copy=False)
+    # Only elements in [target - hi, target - lo] can have a partner; their
+    # complements lie in [lo, hi], so the int64 arithmetic cannot overflow
+    low = max(target - int(values[-1]), _INT64_MIN)
+    high = min(target - int(values[0]), _INT64_MAX)
+    if low > high:
+        return None
+    last = values.size - 1
+    t = np.int64(target)
+    for start in range(0, large.size, _NP_CHUNK_SIZE):
+        chunk = large[start : start + _NP_CHUNK_SIZE].astype(np.int64, copy=False)
+        candidates = np.flatnonzero((chunk >= low) & (chunk <= high))
+        if not candidates.size:
+            continue
+        complements = t - chunk[candidates]
+        pos = np.searchsorted(values, complements, side="left")
+        np.minimum(pos, last, out=pos)
+        hits = values[pos] == complements
+        if hits.any():
+            offset = int(np.argmax(hits))
+            return int(first[pos[offset]]), start + int(candidates[offset])
+    return None
@@ -0,0 +1,338 @@
+"""Incremental Two Sum index for continuously updated data.
+
+This module provides ``TwoSumIndex``, a hash map index that supports
+appending and removing values between queries without being rebuilt.
+Its storage is either plain dicts (fast) or compact int64 arrays
+(``compact=True``) for indexes that must fit in limited memory.
+"""
+
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Protocol
+
+from src.compact_index import CompactIndexTable
+
+# Link terminator for the compact store's per-value chains
+_NO_INDEX = -1
+
+
+class _Store(Protocol):
+    """Index -> value storage with a value -> live indices multimap."""
+
+    def __len__(self) -> int:
+        """Return the number of indices ever assigned."""
+        ...
+
+    def append(self, value: int) -> int:
+        """Store value at the next index and return that index."""
+        ...
+
+    def value_at(self, index: int) -> int | None:
+        """Return the value at index, or None if it is not live."""
+        ...
+
+    def remove(self, index: int, value: int) -> None:
+        """Forget the live index holding value."""
+        ...
+
+    def partner(self, value: int, exclude: int) -> int | None:
+        """Return a live index holding value other than ``exclude``."""
+        ...
+
+    def representatives(self) -> Iterator[tuple[int, int]]:
+        """Yield one (value, live index) pair per distinct live value."""
+        ...
+
+    def nbytes(self) -> int:
+        """Return the approximate memory footprint in bytes."""
+        ...
+
+
+class _DictStore:
+    """Store backed by a list and a dict of insertion-ordered index sets."""
+
+    def __init__(self) -> None:
+        # Index -> value; None marks a removed index
+        self._values: list[int | None] = []
+        # Value -> live indices holding it (a dict used as an ordered set)
+        self._positions: dict[int, dict[int, None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def append(self, value: int) -> int:
+        index = len(self._values)
+        self._values.append(value)
+        positions = self._positions.get(value)
+        if positions is None:
+            self._positions[value] = {index: None}
+        else:
+            positions[index] = None
+        return index
+
+    def value_at(self, index: int) -> int | None:
+        return self._values[index] if 0 <= index < len(self._values) else None
+
+    def remove(self, index: int, value: int) -> None:
+        self._values[index] = None
+        positions = self._positions[value]
+        del positions[index]
+        if not positions:
+            del self._positions[value]
+
+    def partner(self, value: int, exclude: int) -> int | None:
+        positions = self._positions.get(value)
+        if positions is None:
+            return None
+        # At most two iterations: exclude can appear only once
+        for index in positions:
+            if index != exclude:
+                return index
+        return None
+
+    def representatives(self) -> Iterator[tuple[int, int]]:
+        for value, positions in self._positions.items():
+            yield value, next(iter(positions))
+
+    def nbytes(self) -> int:
+        # Walks every container, so this is O(n); values shared with the
+        # caller's objects are counted too, as they are kept alive here.
+        total = sys.getsizeof(self._values) + sys.getsizeof(self._positions)
+        for value, positions in self._positions.items():
+            total += sys.getsizeof(value) + sys.getsizeof(positions)
+            total += sum(sys.getsizeof(index) for index in positions)
+        return total
+
+
+class _CompactStore:
+    """Store backed by int64 arrays and a ``CompactIndexTable``.
+
+    Live indices holding the same value form a doubly linked chain through
+    the ``_next``/``_prev`` arrays; the table maps each value to the head of
+    its chain. Every index costs 25 bytes plus its share of the table.
+    """
+
+    def __init__(self) -> None:
+        self._values = array("q")
+        self._live = bytearray()
+        self._next = array("q")
+        self._prev = array("q")
+        self._heads = CompactIndexTable()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def append(self, value: int) -> int:
+        index = len(self._values)
+        head = self._heads.get(value)
+        self._values.append(value)
+        self._live.append(1)
+        self._next.append(_NO_INDEX if head is None else head)
+        self._prev.append(_NO_INDEX)
+        if head is not None:
+            self._prev[head] = index
+        self._heads[value] = index
+        return index
+
+    def value_at(self, index: int) -> int | None:
+        if 0 <= index < len(self._values) and self._live[index]:
+            return self._values[index]
+        return None
+
+    def remove(self, index: int, value: int) -> None:
+        self._live[index] = 0
+        after, before = self._next[index], self._prev[index]
+        if after != _NO_INDEX:
+            self._prev[after] = before
+        if before != _NO_INDEX:
+            self._next[before] = after
+        elif after != _NO_INDEX:
+            self._heads[value] = after
+        else:
+            del self._heads[value]
+
+    def partner(self, value: int, exclude: int) -> int | None:
+        head = self._heads.get(value)
+        if head is None or head != exclude:
+            return head
+        after = self._next[head]
+        return None if after == _NO_INDEX else after
+
+    def representatives(self) -> Iterator[tuple[int, int]]:
+        return self._heads.items()
+
+    def nbytes(self) -> int:
+        return (
+            sys.getsizeof(self._values)
+            + sys.getsizeof(self._live)
+            + sys.getsizeof(self._next)
+            + sys.getsizeof(self._prev)
+            + self._heads.nbytes
+        )
+
+
+class TwoSumIndex:
+    """Hash map index answering "which two values sum to target?" queries.
+
+    Values are appended with ``add``/``extend`` and receive stable indices
+    (like list positions that never shift). ``remove`` frees an index without
+    renumbering the others. Unlike the ``seen`` map in ``two_sum``, which
+    keeps only the latest index of each value, every live occurrence is
+    tracked, so duplicates pair with each other and survive removals.
+
+    With ``compact=True`` values and links live in int64 arrays and the
+    value map is a ``CompactIndexTable``: roughly 50-70 bytes per value
+    instead of 300+, at the cost of slower updates. ``nbytes`` reports the
+    footprint of either layout.
+
+    Query results are cached per target:
+
+    - A cached pair is reused while both of its indices are still live.
+    - A cached miss remembers how many indices existed when it was computed.
+      Removals cannot create a new pair, so a later query only has to check
+      the values appended since then.
+
+    Time Complexity:
+        add / remove: O(1) amortized
+        extend: O(k) for k values
+        query: O(1) for a still-valid cached pair, O(k) for a cached miss
+            with k values appended since, O(d) otherwise (d distinct values)
+    Space Complexity: O(n + q) - n indices ever added, q distinct targets
+
+    Examples:
+        >>> index = TwoSumIndex([2, 7, 11])
+        >>> index.query(9)
+        [0, 1]
+        >>> index.remove(0)
+        2
+        >>> index.query(9) is None
+        True
+        >>> index.add(2)
+        3
+        >>> index.query(9)
+        [1, 3]
+    """
+
+    def __init__(self, values: Iterable[int] = (), *, compact: bool = False) -> None:
+        """Create an index, optionally pre-filled with values.
+
+        Args:
+            values: Initial values, assigned indices 0, 1, 2, ...
+            compact: Store the index in int64 arrays instead of dicts.
+                Values must then fit in int64.
+        """
+        self._store: _Store = _CompactStore() if compact else _DictStore()
+        self._size = 0
+        # Target -> last pair found for it
+        self._hits: dict[int, tuple[int, int]] = {}
+        # Target -> number of indices that existed when no pair was found
+        self._misses: dict[int, int] = {}
+        self.extend(values)
+
+    def __len__(self) -> int:
+        """Return the number of live values."""
+        return self._size
+
+    def __getitem__(self, index: int) -> int:
+        """Return the value stored at a live index.
+
+        Raises:
+            IndexError: If index was never assigned or has been removed.
+        """
+        return self._live_value(index)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory footprint of the stored values and index.
+
+        O(1) for the compact layout; the dict layout has to walk every
+        container, which is O(n). The per-target query cache is excluded.
+        """
+        return self._store.nbytes()
+
+    def add(self, value: int) -> int:
+        """Append a value and return the index assigned to it."""
+        index = self._store.append(value)
+        self._size += 1
+        return index
+
+    def extend(self, values: Iterable[int]) -> None:
+        """Append every value from an iterable."""
+        for value in values:
+            self.add(value)
+
+    def remove(self, index: int) -> int:
+        """Remove the value at index and return it.
+
+        Other indices are not renumbered, and the removed index is never
+        reused.
+
+        Raises:
+            IndexError: If index was never assigned or has been removed.
+        """
+        value = self._live_value(index)
+        self._store.remove(index, value)
+        self._size -= 1
+        return value
+
+    def query(self, target: int) -> list[int] | None:
+        """Find two live indices whose values sum to target.
+
+        Args:
+            target: Target sum to find.
+
+        Returns:
+            A pair [i, j] with i < j and index[i] + index[j] == target, or
+            None when no such pair exists.
+        """
+        hit = self._hits.get(target)
+        if hit is not None:
+            i, j = hit
+            value_at = self._store.value_at
+            if value_at(i) is not None and value_at(j) is not None:
+                return [i, j]
+            del self._hits[target]
+
+        checked = self._misses.get(target)
+        if checked is None:
+            pair = self._search_all(target)
+        else:
+            # Only values appended since the miss can complete a new pair
+            pair = self._search_from(target, checked)
+
+        if pair is None:
+            self._misses[target] = len(self._store)
+            return None
+        self._misses.pop(target, None)
+        self._hits[target] = pair
+        return list(pair)
+
+    def _live_value(self, index: int) -> int:
+        """Return the value at index, raising IndexError if it is not live."""
+        value = self._store.value_at(index)
+        if value is None:
+            raise IndexError(f"No value at index {index}")
+        return value
+
+    def _search_all(self, target: int) -> tuple[int, int] | None:
+        """Check every distinct value for a partner."""
+        partner_of = self._store.partner
+        for value, index in self._store.representatives():
+            partner = partner_of(target - value, index)
+            if partner is not None:
+                return (min(index, partner), max(index, partner))
+        return None
+
+    def _search_from(self, target: int, start: int) -> tuple[int, int] | None:
+        """Check only the indices assigned at or after ``start``."""
+        value_at = self._store.value_at
+        partner_of = self._store.partner
+        for index in range(start, len(self._store)):
+            value = value_at(index)
+            if value is None:
+                continue
+            partner = partner_of(target - value, index)
+            if partner is not None:
+                return (min(index, partner), max(index, partner))
+        return None
@@ -0,0 +1,127 @@
+"""Tests for the NDJSON batch solver."""
+
+import io
+import json
+from typing import Any
+
+import pytest
+
+from src.batch import BatchSummary, run_batch, solve_line
+
+
+def _run(text: str, workers: int = 1) -> tuple[list[Any], BatchSummary]:
+    """Run a batch over text and decode the output lines."""
+    sink = io.BytesIO()
+    summary = run_batch(io.BytesIO(text.encode()), sink, workers=workers)
+    return [json.loads(line) for line in sink.getvalue().splitlines()], summary
+
+
+class TestSolveLine:
+    """Tests for answering a single query line."""
+
+    def test_result(self) -> None:
+        """Test a solvable query."""
+        line = b'{"nums": [2, 7, 11, 15], "target": 9}'
+        assert solve_line(line) == b'{"result":[0,1]}\n'
+
+    def test_no_solution(self) -> None:
+        """Test that a query without a pair reports an error."""
+        answer = json.loads(solve_line(b'{"nums": [1, 2], "target": 10}'))
+        assert answer == {"error": "No two numbers in the list sum to 10"}
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            b"not json",
+            b'{"nums": [1, 2]}',
+            b'{"nums": "12", "target": 3}',
+            b'{"nums": [1, 2], "target": "3"}',
+            b"[1, 2, 3]",
+            b'{"nums": [1], "target": 2}',
+        ],
+    )
+    def test_malformed_queries(self, line: bytes) -> None:
+        """Test that malformed queries produce an error line."""
+        assert set(json.loads(solve_line(line))) == {"error"}
+
+    def test_deeply_nested_line(self) -> None:
+        """Test that nesting past the recursion limit is an error line."""
+        line = b"[" * 100_000 + b"]" * 100_000
+        assert set(json.loads(solve_line(line))) == {"error"}
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            b'{"nums": [0, 1], "target": true}',
+            b'{"nums": [true, false], "target": 1}',
+            b'{"nums": [1.5, 1.5], "target": 3}',
+            b'{"nums": [1.0, 2], "target": 3}',
+            b'{"nums": [1, null], "target": 1}',
+        ],
+    )
+    def test_non_integers_rejected(self, line: bytes) -> None:
+        """Test that bools and floats are not taken for integers."""
+        answer = json.loads(solve_line(line))
+        assert answer == {
+            "error": "expected a list of integers 'nums' and an integer 'target'"
+        }
+
+
+class TestRunBatch:
+    """Tests for streaming many queries."""
+
+    @staticmethod
+    def _queries(count: int) -> str:
+        """Build count solvable queries, one per line."""
+        lines = [
+            json.dumps({"nums": [k, -1, -2, k + 1], "target": 2 * k + 1})
+            for k in range(count)
+        ]
+        return "\n".join(lines) + "\n"
+
+    def test_results_in_input_order(self) -> None:
+        """Test one output line per query, in order."""
+        answers, summary = _run(self._queries(3_000))
+        assert answers == [{"result": [0, 3]}] * 3_000
+        assert summary.queries == 3_000
+
+    def test_deeply_nested_line(self) -> None:
+        """Test that the lines around a too deeply nested one are answered."""
+        nested = "[" * 100_000 + "]" * 100_000
+        text = f'{{"nums": [3, 3], "target": 6}}\n{nested}\n' * 2
+        answers, summary = _run(text)
+        assert answers[0] == answers[2] == {"result": [0, 1]}
+        assert set(answers[1]) == set(answers[3]) == {"error"}
+        assert summary.queries == 4
+
+    def test_blank_lines_skipped(self) -> None:
+        """Test that blank lines produce no output."""
+        text = '\n{"nums": [3, 3], "target": 6}\n  \n{"nums": [1], "target": 1}\n'
+        answers, summary = _run(text)
+        assert answers[0] == {"result": [0, 1]}
+        assert set(answers[1]) == {"error"}
+        assert summary.queries == 2
+
+    def test_worker_pool_matches_in_process(self) -> None:
+        """Test that a process pool returns the same lines in order."""
+        text = self._queries(2_500) + '{"nums": [1, 2], "target": 9}\n'
+        assert _run(text, workers=2)[0] == _run(text)[0]
+
+    def test_summary(self) -> None:
+        """Test the latency percentiles and the formatted line."""
+        _, summary = _run(self._queries(100))
+        assert 0 < summary.p50_ns <= summary.p99_ns
+        assert summary.queries_per_second > 0
+        assert "100 queries" in summary.format()
+
+    def test_empty_input(self) -> None:
+        """Test that an empty stream gives an empty summary."""
+        answers, summary = _run("")
+        assert answers == []
+        assert summary.queries == 0
+        assert summary.p99_ns == 0
+
+    def test_invalid_workers_raises_error(self) -> None:
+        """Test that fewer than one worker is rejected."""
+        with pytest.raises(ValueError, match="workers must be at least 1"):
+            run_batch(io.BytesIO(), io.BytesIO(), workers=0)
@@ -0,0 +1,121 @@
+"""Test suite for the compact open-addressing CompactIndexTable."""
+
+import random
+
+import pytest
+
+from src.compact_index import CompactIndexTable
+
+
+class TestCompactIndexTableBasic:
+    """Mapping behaviour."""
+
+    def test_set_and_get(self) -> None:
+        """Test storing and reading values."""
+        table = CompactIndexTable()
+        table[5] = 0
+        table[-5] = 1
+        assert table.get(5) == 0
+        assert table[-5] == 1
+        assert table.get(6) is None
+        assert table.get(6, 42) == 42
+        assert len(table) == 2
+
+    def test_overwrite(self) -> None:
+        """Test that setting an existing key replaces its value."""
+        table = CompactIndexTable()
+        table[3] = 1
+        table[3] = 2
+        assert table[3] == 2
+        assert len(table) == 1
+
+    def test_contains(self) -> None:
+        """Test membership checks."""
+        table = CompactIndexTable()
+        table[0] = 0
+        assert 0 in table
+        assert 1 not in table
+
+    def test_delete(self) -> None:
+        """Test deletion and reinsertion over a tombstone."""
+        table = CompactIndexTable()
+        table[1] = 10
+        del table[1]
+        assert 1 not in table
+        assert len(table) == 0
+        table[1] = 11
+        assert table[1] == 11
+
+    def test_missing_key_raises_key_error(self) -> None:
+        """Test that reading or deleting a missing key raises KeyError."""
+        table = CompactIndexTable()
+        with pytest.raises(KeyError):
+            table[1]
+        with pytest.raises(KeyError):
+            del table[1]
+
+    def test_int64_extremes(self) -> None:
+        """Test keys at both ends of the int64 range."""
+        table = CompactIndexTable()
+        table[2**63 - 1] = 1
+        table[-(2**63)] = 2
+        assert table[2**63 - 1] == 1
+        assert table[-(2**63)] == 2
+        # Out-of-range lookups are simply misses
+        assert table.get(2**64) is None
+
+    def test_out_of_range_key_raises_overflow(self) -> None:
+        """Test that keys beyond int64 cannot be stored."""
+        with pytest.raises(OverflowError):
+            CompactIndexTable()[2**63] = 0
+
+    def test_negative_value_rejected(self) -> None:
+        """Test that values must be non-negative."""
+        with pytest.raises(ValueError, match="non-negative"):
+            CompactIndexTable()[1] = -1
+
+
+class TestCompactIndexTableGrowth:
+    """Resizing, tombstones and memory reporting."""
+
+    def test_grows_past_initial_capacity(self) -> None:
+        """Test many inserts across several resizes."""
+        table = CompactIndexTable()
+        for i in range(10_000):
+            table[i * 7919] = i
+        assert len(table) == 10_000
+        assert all(table[i * 7919] == i for i in range(10_000))
+        assert sorted(v for _, v in table.items()) == list(range(10_000))
+
+    def test_presized_table_does_not_grow(self) -> None:
+        """Test that a capacity hint avoids resizes."""
+        table = CompactIndexTable(capacity=1000)
+        before = table.nbytes
+        for i in range(1000):
+            table[i] = i
+        assert table.nbytes == before
+
+    def test_nbytes_is_compact(self) -> None:
+        """Test the footprint stays well under a dict's ~100 bytes/entry."""
+        table = CompactIndexTable()
+        for i in range(100_000):
+            table[i] = i
+        assert table.nbytes / len(table) < 45
+
+    def test_random_operations_match_dict(self) -> None:
+        """Verify random inserts/deletes against a dict."""
+        rng = random.Random(11)
+        table = CompactIndexTable()
+        reference: dict[int, int] = {}
+        for _ in range(20_000):
+            key = rng.randint(-500, 500)
+            if rng.random() < 0.35 and key in reference:
+                del table[key]
+                del reference[key]
+            else:
+                value = rng.randint(0, 10**6)
+                table[key] = value
+                reference[key] = value
+            assert table.get(key) == reference.get(key)
+        assert len(table) == len(reference)
+        assert dict(table.items()) == reference
@@ -0,0 +1,257 @@
+"""Tests for the persisted, memory-mapped Two Sum index."""
+
+import os
+import random
+import struct
+from pathlib import Path
+
+import pytest
+
+from src.mapped_index import (
+    _FORMAT_VERSION,
+    _HEADER_SIZE,
+    MappedTwoSumIndex,
+    source_digest,
+    write_index,
+)
+
+
+@pytest.fixture(params=[False, True], ids=["python", "numpy"])
+def vectorized(request: pytest.FixtureRequest) -> bool:
+    """Run a test against both query paths."""
+    if request.param:
+        pytest.importorskip("numpy")
+    return bool(request.param)
+
+
+def _build(
+    tmp_path: Path, nums: list[int], vectorized: bool = False
+) -> MappedTwoSumIndex:
+    """Write nums to an index file and open it."""
+    path = tmp_path / "nums.idx"
+    write_index(nums, path, vectorized=vectorized)
+    return MappedTwoSumIndex(path, vectorized=vectorized)
+
+
+def _has_pair(nums: list[int], target: int) -> bool:
+    """Check by brute force whether any pair sums to target."""
+    return any(
+        nums[i] + nums[j] == target
+        for i in range(len(nums))
+        for j in range(i + 1, len(nums))
+    )
+
+
+class TestMappedTwoSumIndexQuery:
+    """Tests for queries against a mapped index."""
+
+    def test_basic(self, tmp_path: Path, vectorized: bool) -> None:
+        """Test a pair reported with original indices in order."""
+        with _build(tmp_path, [2, 7, 11, 15], vectorized) as index:
+            assert len(index) == 4
+            assert index.query(9) == [0, 1]
+            assert index.query(26) == [2, 3]
+
+    def test_no_solution(self, tmp_path: Path, vectorized: bool) -> None:
+        """Test that a miss returns None, inside and outside the value range."""
+        with _build(tmp_path, [1, 2, 4, 8], vectorized) as index:
+            assert index.query(7) is None
+            assert index.query(-100) is None
+            assert index.query(100) is None
+
+    def test_value_used_once(self, tmp_path: Path, vectorized: bool) -> None:
+        """Test that a single occurrence cannot pair with itself."""
+        with _build(tmp_path, [3, 2, 4], vectorized) as index:
+            assert index.query(6) == [1, 2]
+            assert index.query(4) is None
+
+    def test_duplicates(self, tmp_path: Path, vectorized: bool) -> None:
+        """Test that the smallest value pairs with its partner's last copy."""
+        with _build(tmp_path, [5, 1, 5, 9, 1, 9], vectorized) as index:
+            assert index.query(10) == [1, 5]
+            assert index.query(2) == [1, 4]
+
+    def test_small_indexes(self, tmp_path: Path, vectorized: bool) -> None:
+        """Test indexes too small to hold a pair."""
+        with _build(tmp_path, [], vectorized) as index:
+            assert len(index) == 0
+            assert index.query(0) is None
+        with _build(tmp_path, [4], vectorized) as index:
+            assert index.query(8) is None
+
+    def test_int64_extremes(self, tmp_path: Path, vectorized: bool) -> None:
+        """Test targets beyond int64 built from values at its limits."""
+        low, high = -(1 << 63), (1 << 63) - 1
+        with _build(tmp_path, [high, 0, low, high], vectorized) as index:
+            assert index.query(2 * high) == [0, 3]
+            assert index.query(low + high) == [2, 3]
+            assert index.query(2 * low) is None
+
+    def test_paths_agree(self, tmp_path: Path) -> None:
+        """Test both query paths against brute force on random data."""
+        pytest.importorskip("numpy")
+        rng = random.Random(5)
+        for _ in range(100):
+            nums = [rng.randrange(-20, 20) for _ in range(rng.randrange(30))]
+            path = tmp_path / "nums.idx"
+            write_index(nums, path)
+            with (
+                MappedTwoSumIndex(path, vectorized=False) as python,
+                MappedTwoSumIndex(path, vectorized=True) as numpy,
+            ):
+                for target in range(-42, 42):
+                    found = python.query(target)
+                    assert numpy.query(target) == found
+                    assert (found is not None) == _has_pair(nums, target)
+                    if found is not None:
+                        i, j = found
+                        assert i < j and nums[i] + nums[j] == target
+
+    def test_long_scan(self, tmp_path: Path) -> None:
+        """Test searches that run through several doubling chunks."""
+        np = pytest.importorskip("numpy")
+        evens = np.arange(0, 200_000, 2, dtype=np.int64)
+        nums = np.append(evens, 99_999)
+        path = tmp_path / "nums.idx"
+        write_index(nums, path)
+        with MappedTwoSumIndex(path, source=nums) as index:
+            # 25K candidates; only 99_999, near the end, has a partner
+            assert index.query(99_999 + 150_000) == [75_000, 100_000]
+            assert index.query(100_000) == [0, 50_000]
+        write_index(evens, path)
+        with MappedTwoSumIndex(path, source=evens) as index:
+            assert index.query(100_001) is None
+
+    def test_closed(self, tmp_path: Path, vectorized: bool) -> None:
+        """Test that a closed index refuses queries and closes idempotently."""
+        index = _build(tmp_path, [1, 2], vectorized)
+        index.close()
+        index.close()
+        assert index.closed
+        with pytest.raises(ValueError, match="closed index"):
+            index.query(3)
+
+
+class TestWriteIndex:
+    """Tests for the file writer."""
+
+    def test_layout(self, tmp_path: Path) -> None:
+        """Test the header fields and the sorted payload."""
+        path = tmp_path / "nums.idx"
+        write_index([30, 10, 20, 10], path, vectorized=False)
+        data = path.read_bytes()
+        magic, version, header_size, count = struct.unpack_from("<8sIIQ", data)
+        assert (magic, version, header_size, count) == (
+            b"TWOSUMIX",
+            _FORMAT_VERSION,
+            _HEADER_SIZE,
+            4,
+        )
+        payload = struct.unpack_from("<8q", data, _HEADER_SIZE)
+        assert payload == (10, 10, 20, 30, 1, 3, 2, 0)
+        assert not os.path.exists(f"{path}.partial")
+
+    def test_writers_agree(self, tmp_path: Path) -> None:
+        """Test that the NumPy writer produces the same bytes."""
+        pytest.importorskip("numpy")
+        nums = [random.Random(2).randrange(-9, 9) for _ in range(500)]
+        write_index(nums, tmp_path / "python.idx", vectorized=False)
+        write_index(nums, tmp_path / "numpy.idx", vectorized=True)
+        python = (tmp_path / "python.idx").read_bytes()
+        assert (tmp_path / "numpy.idx").read_bytes() == python
+
+    def test_ndarray_source(self, tmp_path: Path) -> None:
+        """Test an ndarray input through the pure-Python writer."""
+        np = pytest.importorskip("numpy")
+        nums = np.array([4, 6, 1], dtype=np.int32)
+        write_index(nums, tmp_path / "nums.idx", vectorized=False)
+        with MappedTwoSumIndex(tmp_path / "nums.idx", source=[4, 6, 1]) as index:
+            assert index.query(10) == [0, 1]
+
+    def test_overflow(self, tmp_path: Path) -> None:
+        """Test that values beyond int64 are rejected by the Python writer."""
+        with pytest.raises(OverflowError):
+            write_index([1, 1 << 63], tmp_path / "nums.idx", vectorized=False)
+
+    def test_uint64_overflow(self, tmp_path: Path) -> None:
+        """Test that uint64 values beyond int64 are rejected."""
+        np = pytest.importorskip("numpy")
+        nums = np.array([1, 1 << 63], dtype=np.uint64)
+        with pytest.raises(OverflowError, match="int64"):
+            write_index(nums, tmp_path / "nums.idx")
+
+
+class TestStaleFiles:
+    """Tests for rejecting files that no longer describe the data."""
+
+    @pytest.fixture
+    def path(self, tmp_path: Path) -> Path:
+        """Write a small index file."""
+        path = tmp_path / "nums.idx"
+        write_index([2, 7, 11, 15], path)
+        return path
+
+    def test_source_matches(self, path: Path) -> None:
+        """Test that the source the file was built from is accepted."""
+        with MappedTwoSumIndex(path, source=[2, 7, 11, 15], verify=True) as index:
+            assert index.source_digest == source_digest([2, 7, 11, 15])
+
+    def test_source_changed(self, path: Path) -> None:
+        """Test that edited, reordered or resized data is detected."""
+        for source in ([2, 7, 11, 16], [7, 2, 11, 15], [2, 7, 11]):
+            with pytest.raises(ValueError, match="stale"):
+                MappedTwoSumIndex(path, source=source)
+
+    def test_ndarray_digest(self) -> None:
+        """Test that the digest does not depend on the container."""
+        np = pytest.importorskip("numpy")
+        nums = [3, -1, 1 << 40]
+        expected = source_digest(nums)
+        assert source_digest(np.array(nums, dtype=np.int64)) == expected
+        assert source_digest(np.array(nums, dtype=np.float64).astype(int)) == (expected)
+
+    def test_version(self, path: Path) -> None:
+        """Test that files from another format version are rejected."""
+        data = bytearray(path.read_bytes())
+        struct.pack_into("<I", data, 8, _FORMAT_VERSION + 1)
+        path.write_bytes(data)
+        with pytest.raises(ValueError, match="format version 2, expected 1"):
+            MappedTwoSumIndex(path)
+
+    def test_not_an_index(self, tmp_path: Path) -> None:
+        """Test files that are too short or carry the wrong magic."""
+        short = tmp_path / "short.idx"
+        short.write_bytes(b"TWOSUMIX")
+        other = tmp_path / "other.idx"
+        other.write_bytes(bytes(_HEADER_SIZE))
+        for path in (short, other):
+            with pytest.raises(ValueError, match="not a two_sum index"):
+                MappedTwoSumIndex(path)
+
+    def test_truncated(self, path: Path) -> None:
+        """Test that a file cut short is rejected before mapping the arrays."""
+        path.write_bytes(path.read_bytes()[:-8])
+        with pytest.raises(ValueError, match="truncated"):
+            MappedTwoSumIndex(path)
+
+    def test_corrupted(self, path: Path) -> None:
+        """Test that verify catches a payload edited after writing."""
+        data = bytearray(path.read_bytes())
+        data[_HEADER_SIZE] ^= 1
+        path.write_bytes(data)
+        with MappedTwoSumIndex(path) as index:
+            assert len(index) == 4
+        with pytest.raises(ValueError, match="checksum"):
+            MappedTwoSumIndex(path, verify=True)
+
+    def test_requires_numpy(self, path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the pure-Python defaults and explicit vectorized=True."""
+        monkeypatch.setattr("src.mapped_index.np", None)
+        monkeypatch.setattr("src.two_sum.np", None)
+        with MappedTwoSumIndex(path) as index:
+            assert index.query(18) == [1, 2]
+        write_index([1, 2], path)
+        with pytest.raises(ImportError, match="NumPy"):
+            MappedTwoSumIndex(path, vectorized=True)
+        with pytest.raises(ImportError, match="NumPy"):
+            write_index([1, 2], path, vectorized=True)
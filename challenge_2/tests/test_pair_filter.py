@@ -0,0 +1,62 @@
+"""Tests for the PairSumFilter prefilter."""
+
+import random
+
+import pytest
+
+from src.pair_filter import PairSumFilter
+
+
+class TestPairSumFilter:
+    """Tests for soundness and rejection power of the filter."""
+
+    def test_example(self) -> None:
+        """Test a reachable and an unreachable target."""
+        pairs = PairSumFilter([10, 20, 35])
+        assert pairs.might_have_pair(30)
+        assert not pairs.might_have_pair(31)
+
+    def test_min_max_pruning(self) -> None:
+        """Test that targets outside [2 * min, 2 * max] are rejected."""
+        pairs = PairSumFilter([-3, 4, 9])
+        assert not pairs.might_have_pair(-7)
+        assert not pairs.might_have_pair(19)
+        assert pairs.might_have_pair(6)
+
+    def test_never_rejects_a_solvable_target(self) -> None:
+        """Verify soundness on random values with and without strides."""
+        rng = random.Random(16)
+        for _ in range(500):
+            stride = rng.choice([1, 2, 5, 7, 64, 1_000_003])
+            values = [rng.randint(-50, 50) * stride for _ in range(rng.randint(1, 12))]
+            pairs = PairSumFilter(values)
+            for i, a in enumerate(values):
+                for b in values[i + 1 :]:
+                    assert pairs.might_have_pair(a + b)
+
+    def test_rejects_off_stride_targets(self) -> None:
+        """Test that multiples of 5 reject every target not divisible by 5."""
+        rng = random.Random(17)
+        pairs = PairSumFilter(5 * rng.randrange(10**6) for _ in range(10_000))
+        assert not any(pairs.might_have_pair(5 * t + 1) for t in range(1, 1000))
+
+    def test_sparse_values_false_positive_rate(self) -> None:
+        """Test that few unstructured values pass few impossible targets."""
+        rng = random.Random(18)
+        values = [rng.randrange(10**12) for _ in range(300)]
+        sums = {a + b for i, a in enumerate(values) for b in values[i + 1 :]}
+        pairs = PairSumFilter(values)
+        targets = [rng.randrange(2 * 10**12) for _ in range(5_000)]
+        impossible = [t for t in targets if t not in sums]
+        passed = sum(pairs.might_have_pair(t) for t in impossible)
+        assert passed / len(impossible) < 0.1
+
+    def test_nbytes(self) -> None:
+        """Test that the footprint covers the bitmasks and stays bounded."""
+        assert 0 < PairSumFilter([1, 2, 3]).nbytes < 1024
+        assert PairSumFilter(range(100_000)).nbytes < 1024
+
+    def test_empty_values_raises_error(self) -> None:
+        """Test that an empty collection is rejected."""
+        with pytest.raises(ValueError, match="at least 1 value"):
+            PairSumFilter([])
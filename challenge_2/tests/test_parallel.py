@@ -0,0 +1,91 @@
+"""Tests for the multi-core Two Sum engine.
+
+The whole module is skipped when NumPy (an optional extra) is not installed.
+"""
+
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.two_sum import two_sum
+
+np = pytest.importorskip("numpy")
+
+from src.parallel import two_sum_parallel  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def pool() -> Iterator[ProcessPoolExecutor]:
+    """Share one worker pool across the module."""
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.fixture(autouse=True)
+def small_parallel_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Partition even tiny inputs so the worker path is exercised."""
+    monkeypatch.setattr("src.parallel._PARALLEL_MIN_SIZE", 0)
+
+
+class TestTwoSumParallel:
+    """Correctness of the partitioned search."""
+
+    def test_example_case(self, pool: ProcessPoolExecutor) -> None:
+        """Test the problem example."""
+        assert two_sum_parallel([2, 7, 11, 15], 9, workers=4, executor=pool) == [0, 1]
+
+    def test_earliest_pair_across_partitions(self, pool: ProcessPoolExecutor) -> None:
+        """Test that the pair completing first wins, as in two_sum."""
+        # (1, 9) lies near target / 2 and (-100, 110) far from it, so the two
+        # pairs land in different partitions
+        nums = [-100, 1, 110, 9, 5, 5]
+        expected = two_sum(nums, 10)
+        assert two_sum_parallel(nums, 10, workers=3, executor=pool) == expected
+
+    def test_matches_two_sum_on_random_inputs(self, pool: ProcessPoolExecutor) -> None:
+        """Test parity with two_sum on random inputs and worker counts."""
+        rng = np.random.default_rng(3)
+        for workers in (2, 3, 5):
+            nums = rng.integers(-500, 500, size=3000).tolist()
+            for target in (-900, -1, 0, 333, 998):
+                try:
+                    expected = two_sum(nums, target)
+                except ValueError:
+                    with pytest.raises(ValueError, match="No two numbers"):
+                        two_sum_parallel(nums, target, workers=workers, executor=pool)
+                else:
+                    result = two_sum_parallel(
+                        nums, target, workers=workers, executor=pool
+                    )
+                    assert result == expected
+
+    def test_temporary_pool(self) -> None:
+        """Test the default path that creates and shuts down its own pool."""
+        nums = np.arange(1000, dtype=np.int32)
+        assert two_sum_parallel(nums, 1997, workers=2) == [998, 999]
+
+    def test_single_worker_runs_in_process(self) -> None:
+        """Test that workers=1 gives the serial result."""
+        assert two_sum_parallel([3, 2, 4], 6, workers=1) == [1, 2]
+
+    def test_huge_values_fall_back_to_serial(self, pool: ProcessPoolExecutor) -> None:
+        """Test values too large for the partition arithmetic."""
+        big = 2**62
+        nums = [big, 1, -big, 3]
+        assert two_sum_parallel(nums, 0, workers=2, executor=pool) == [0, 2]
+
+    def test_no_solution_raises_error(self, pool: ProcessPoolExecutor) -> None:
+        """Test that a missing pair raises ValueError."""
+        with pytest.raises(ValueError, match="No two numbers"):
+            two_sum_parallel([1, 2, 4, 8], 7, workers=2, executor=pool)
+
+    def test_invalid_worker_count(self) -> None:
+        """Test that workers must be positive."""
+        with pytest.raises(ValueError, match="workers must be at least 1"):
+            two_sum_parallel([1, 2], 3, workers=0)
+
+    def test_too_short_raises_error(self) -> None:
+        """Test that fewer than 2 elements raises ValueError."""
+        with pytest.raises(ValueError, match="at least 2 elements"):
+            two_sum_parallel([1], 2, workers=2)
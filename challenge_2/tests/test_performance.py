@@ -4,11 +4,47 @@ This module uses pytest-benchmark to measure and compare performance
 of different Two Sum implementations across various dataset sizes.
 """
 
+import sys
+import tracemalloc
+from array import array
+from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 
 import pytest
 
-from src.two_sum import two_sum, two_sum_brute_force
+from src.pair_filter import PairSumFilter
+from src.two_sum import (
+    k_sum,
+    two_sum,
+    two_sum_bounded,
+    two_sum_brute_force,
+    two_sum_compact,
+    two_sum_count,
+    two_sum_cross_mmap,
+    two_sum_hardened,
+    two_sum_many,
+    two_sum_mmap,
+)
+
+
+def _write_int64_file(path: Path, count: int) -> Path:
+    """Write 0..count-1 as packed little-endian int64 values."""
+    data = array("q", range(count))
+    if sys.byteorder == "big":
+        data.byteswap()
+    path.write_bytes(data.tobytes())
+    return path
+
+
+def _peak_traced_bytes(func: Callable[[], object]) -> int:
+    """Return the peak memory traced by tracemalloc while running func."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
 
 
 class TestTwoSumPerformance:
@@ -50,6 +86,15 @@ class TestTwoSumPerformance:
         result = benchmark(two_sum_brute_force, nums, target)
         assert result == [998, 999]
 
+    @pytest.mark.benchmark(group="large")
+    def test_performance_large_array_compact(self, benchmark: Any) -> None:
+        """Benchmark compact-index version with large array (10K elements)."""
+        nums = list(range(10000))
+        target = 19997
+
+        result = benchmark(two_sum_compact, nums, target)
+        assert result == [9998, 9999]
+
     @pytest.mark.benchmark(group="large")
     def test_performance_large_array_optimized(self, benchmark: Any) -> None:
         """Benchmark optimized version with large array (10K elements)."""
@@ -87,6 +132,179 @@ class TestTwoSumPerformance:
         assert result == [9998, 9999]
 
 
+class TestTwoSumCollisionPerformance:
+    """Benchmarks on a hash-collision attack with the only pair at the end.
+
+    Every value is a multiple of the int hash modulus, so all share hash 0.
+    """
+
+    @staticmethod
+    def _attack(size: int) -> tuple[list[int], int]:
+        """Build values that all hash to 0, solvable only at the end."""
+        modulus = sys.hash_info.modulus
+        nums = [k * modulus for k in range(1, size)] + [1]
+        return nums, nums[-2] + 1
+
+    @pytest.mark.benchmark(group="collision-attack")
+    def test_performance_10k_attack_two_sum(self, benchmark: Any) -> None:
+        """Benchmark the plain dict: every insert walks one probe chain."""
+        nums, target = self._attack(10_000)
+
+        result = benchmark.pedantic(two_sum, (nums, target), rounds=1, iterations=1)
+        assert result == [9_998, 9_999]
+
+    @pytest.mark.benchmark(group="collision-attack")
+    @pytest.mark.parametrize("size", [10_000, 100_000])
+    def test_performance_attack_hardened(self, benchmark: Any, size: int) -> None:
+        """Benchmark two_sum_hardened: linear even under the attack."""
+        nums, target = self._attack(size)
+
+        result = benchmark(two_sum_hardened, nums, target)
+        assert result == [size - 2, size - 1]
+
+
+class TestTwoSumServicePerformance:
+    """Load test of the asyncio service: 5K requests over 16 shared arrays."""
+
+    @pytest.mark.benchmark(group="service")
+    @pytest.mark.parametrize("max_batch", [1, 256], ids=["unbatched", "micro-batched"])
+    def test_performance_service_load(self, benchmark: Any, max_batch: int) -> None:
+        """Benchmark 256 concurrent clients against a one-process pool.
+
+        With ``max_batch=1`` every request is a separate pool call; otherwise
+        requests on the same array share one. Throughput and tail latency
+        are recorded in extra_info.
+        """
+        import asyncio
+
+        from src.service import TwoSumService, _demo_requests, generate_load
+
+        requests = _demo_requests(5_000, arrays=16, size=1_000)
+
+        async def load() -> Any:
+            async with TwoSumService(workers=1, max_batch=max_batch) as service:
+                return await generate_load(service, requests, concurrency=256)
+
+        summary = benchmark.pedantic(asyncio.run, args=(load(),), rounds=1)
+        benchmark.extra_info["queries_per_second"] = round(summary.queries_per_second)
+        benchmark.extra_info["p50_us"] = summary.p50_ns / 1000
+        benchmark.extra_info["p99_us"] = summary.p99_ns / 1000
+        assert summary.queries == len(requests)
+
+
+class TestKSumPerformance:
+    """Benchmarks for 3Sum and 4Sum on 10K and 100K elements.
+
+    Values are drawn from a bounded range, as the cost grows with the number
+    of distinct values (d² pair work) and with the number of results.
+    """
+
+    @staticmethod
+    def _workload(size: int, bound: int) -> list[int]:
+        """Build a seeded random list with values in [-bound, bound]."""
+        import random
+
+        rng = random.Random(42)
+        return [rng.randint(-bound, bound) for _ in range(size)]
+
+    @pytest.mark.benchmark(group="k-sum")
+    @pytest.mark.parametrize("size", [10_000, 100_000])
+    def test_performance_three_sum(self, benchmark: Any, size: int) -> None:
+        """Benchmark k_sum with k=3 on values in [-2000, 2000]."""
+        nums = self._workload(size, 2_000)
+
+        result = benchmark.pedantic(k_sum, (nums, 5_000, 3), rounds=3, iterations=1)
+        assert result
+        assert all(sum(nums[i] for i in combo) == 5_000 for combo in result)
+
+    @pytest.mark.benchmark(group="k-sum")
+    @pytest.mark.parametrize("size", [10_000, 100_000])
+    def test_performance_four_sum(self, benchmark: Any, size: int) -> None:
+        """Benchmark k_sum with k=4 on values in [-300, 300]."""
+        nums = self._workload(size, 300)
+
+        result = benchmark.pedantic(k_sum, (nums, 1_000, 4), rounds=3, iterations=1)
+        assert result
+        assert all(sum(nums[i] for i in combo) == 1_000 for combo in result)
+
+
+class TestTwoSumPrefilterPerformance:
+    """Benchmarks for two_sum_many on batches of mostly unsolvable targets.
+
+    ``extra_info["false_positive_rate"]`` records the share of unsolvable
+    targets that the prefilter let through to the exact search.
+    """
+
+    @staticmethod
+    def _stride_workload() -> tuple[list[int], list[int]]:
+        """20K multiples of 5 and 500 targets, ~80% of them unsolvable."""
+        import random
+
+        rng = random.Random(42)
+        nums = [5 * rng.randrange(10**6) for _ in range(20_000)]
+        targets = [rng.randrange(10**7) for _ in range(500)]
+        return nums, targets
+
+    @staticmethod
+    def _sparse_workload() -> tuple[list[int], list[int]]:
+        """500 unstructured values and 20K targets, nearly all unsolvable."""
+        import random
+
+        rng = random.Random(42)
+        nums = [rng.randrange(10**12) for _ in range(500)]
+        targets = [rng.randrange(2 * 10**12) for _ in range(20_000)]
+        return nums, targets
+
+    @staticmethod
+    def _false_positive_rate(
+        nums: list[int], targets: list[int], results: list[list[int] | None]
+    ) -> float:
+        """Share of unsolvable targets (None results) that pass the filter."""
+        screen = PairSumFilter(nums).might_have_pair
+        impossible = [t for t, r in zip(targets, results, strict=True) if r is None]
+        return sum(map(screen, impossible)) / len(impossible)
+
+    @pytest.mark.benchmark(group="prefilter-stride")
+    def test_performance_stride_without_prefilter(self, benchmark: Any) -> None:
+        """Benchmark the exact search alone on the strided batch."""
+        nums, targets = self._stride_workload()
+
+        results = benchmark.pedantic(
+            two_sum_many, (nums, targets), rounds=1, iterations=1
+        )
+        assert len(results) == len(targets)
+
+    @pytest.mark.benchmark(group="prefilter-stride")
+    def test_performance_stride_with_prefilter(self, benchmark: Any) -> None:
+        """Benchmark the prefiltered search on the strided batch."""
+        nums, targets = self._stride_workload()
+
+        results = benchmark(two_sum_many, nums, targets, prefilter=True)
+        rate = self._false_positive_rate(nums, targets, results)
+        benchmark.extra_info["false_positive_rate"] = rate
+        assert rate < 0.01  # nearly every unsolvable target is off-stride
+
+    @pytest.mark.benchmark(group="prefilter-sparse")
+    def test_performance_sparse_without_prefilter(self, benchmark: Any) -> None:
+        """Benchmark the exact search alone on the sparse batch."""
+        nums, targets = self._sparse_workload()
+
+        results = benchmark.pedantic(
+            two_sum_many, (nums, targets), rounds=1, iterations=1
+        )
+        assert len(results) == len(targets)
+
+    @pytest.mark.benchmark(group="prefilter-sparse")
+    def test_performance_sparse_with_prefilter(self, benchmark: Any) -> None:
+        """Benchmark the prefiltered search on the sparse batch."""
+        nums, targets = self._sparse_workload()
+
+        results = benchmark(two_sum_many, nums, targets, prefilter=True)
+        rate = self._false_positive_rate(nums, targets, results)
+        benchmark.extra_info["false_positive_rate"] = rate
+        assert rate < 0.1
+
+
 class TestTwoSumComplexity:
     """Tests to verify time and space complexity characteristics."""
 
@@ -129,6 +347,17 @@ class TestTwoSumComplexity:
         assert result == [998, 999]
         # If we got here, space complexity is acceptable
 
+        # Measured with tracemalloc: both indexes grow linearly, and the
+        # compact array-backed index needs less memory than the dict
+        nums_large = list(range(10000))
+        dict_small = _peak_traced_bytes(lambda: two_sum(nums, 1997))
+        dict_large = _peak_traced_bytes(lambda: two_sum(nums_large, 19997))
+        compact_small = _peak_traced_bytes(lambda: two_sum_compact(nums, 1997))
+        compact_large = _peak_traced_bytes(lambda: two_sum_compact(nums_large, 19997))
+        assert dict_large / dict_small < 20
+        assert compact_large / compact_small < 20
+        assert compact_large < dict_large
+
     def test_early_termination(self) -> None:
         """Verify algorithm terminates early when solution found.
 
@@ -170,6 +399,21 @@ class TestTwoSumMemoryEfficiency:
         assert nums[result[0]] + nums[result[1]] == 3
         assert result[0] != result[1]
 
+        # The compact index holds the same two keys in its minimum table
+        table_bytes = _peak_traced_bytes(lambda: two_sum_compact(nums, 3))
+        assert table_bytes < 2048
+
+    def test_memory_count_bounded_by_distinct_values(self) -> None:
+        """Test that counting holds one entry per distinct value.
+
+        1M values from 0..999 streamed from a generator: ~499.5M pairs are
+        counted while the Counter never exceeds 1000 keys.
+        """
+        peak = _peak_traced_bytes(
+            lambda: two_sum_count((x % 1000 for x in range(1_000_000)), 999)
+        )
+        assert peak < 256 * 1024
+
     def test_memory_with_unique_values(self) -> None:
         """Test memory usage with all unique values.
 
@@ -179,6 +423,65 @@ class TestTwoSumMemoryEfficiency:
         result = two_sum(nums, 19997)
         assert result == [9998, 9999]
 
+        # The keys are shared with the list, but every dict entry still costs
+        # a slot, an entry and a boxed index; the compact index stores
+        # unboxed int64 pairs instead
+        dict_peak = _peak_traced_bytes(lambda: two_sum(nums, 19997))
+        compact_peak = _peak_traced_bytes(lambda: two_sum_compact(nums, 19997))
+        assert compact_peak < dict_peak
+
+    def test_memory_bounded_vs_dict(self) -> None:
+        """Compare the direct-address table with the dict on a small range.
+
+        100K values drawn from 0..65535: the dict holds ~65K boxed entries,
+        the bytearray 2 bytes per value in the range.
+        """
+        import random
+
+        rng = random.Random(7)
+        nums = [2 * rng.randrange(32_768) for _ in range(100_000)] + [1]
+        target = nums[-2] + 1
+
+        dict_peak = _peak_traced_bytes(lambda: two_sum(nums, target))
+        table_peak = _peak_traced_bytes(lambda: two_sum_bounded(nums, target))
+        assert table_peak < dict_peak / 10
+
+    def test_memory_mmap_vs_list(self, tmp_path: Path) -> None:
+        """Compare peak memory of the mmap path with parsing into a list.
+
+        The vectorized mmap path only allocates a direct-address table for
+        this small value range (or the 16-byte-per-element sort permutation
+        and sorted copy for wide ones) plus bounded chunk buffers; the list
+        path pays for boxed ints, list slots and the hash map.
+        """
+        pytest.importorskip("numpy")
+        path = _write_int64_file(tmp_path / "nums.bin", 1_000_000)
+        target = 1_999_997
+
+        def list_based() -> list[int]:
+            return two_sum(array("q", path.read_bytes()).tolist(), target)
+
+        list_peak = _peak_traced_bytes(list_based)
+        mmap_peak = _peak_traced_bytes(
+            lambda: two_sum_mmap(path, target, vectorized=True)
+        )
+        assert mmap_peak < list_peak / 2
+
+    def test_memory_cross_mmap_streams_file(self, tmp_path: Path) -> None:
+        """Peak memory of a cross join tracks the in-memory side, not the file.
+
+        The chunked path keeps a dict of the 1K list plus one converted
+        block of the 2M-element file (about 2.5 MB), while the file alone is
+        16 MB on disk and over 70 MB as a Python list.
+        """
+        path = _write_int64_file(tmp_path / "b.bin", 2_000_000)
+        a = list(range(-1_000, 0))
+
+        peak = _peak_traced_bytes(
+            lambda: two_sum_cross_mmap(a, path, 1_999_999 - 1, vectorized=False)
+        )
+        assert peak < 2_000_000 * 8 / 4
+
 
 # Comparison test to demonstrate performance difference
 class TestAlgorithmComparison:
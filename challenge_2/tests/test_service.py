@@ -0,0 +1,228 @@
+"""Tests for the asyncio micro-batching service."""
+
+import asyncio
+from array import array
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+import src.service
+from src.service import TwoSumService, _demo_requests, _fingerprint, generate_load
+from src.two_sum import two_sum_many
+
+
+def _serve(client: Callable[[TwoSumService], Awaitable[Any]], **options: Any) -> Any:
+    """Run client(service) against a service backed by a thread pool."""
+
+    async def main() -> Any:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            async with TwoSumService(executor=pool, **options) as service:
+                return await client(service)
+
+    return asyncio.run(main())
+
+
+class TestTwoSumService:
+    """Tests for answering requests through the service."""
+
+    def test_solve(self) -> None:
+        """Test a single request."""
+
+        async def client(service: TwoSumService) -> list[int]:
+            return await service.solve([2, 7, 11, 15], 9)
+
+        assert _serve(client) == [0, 1]
+
+    def test_no_solution(self) -> None:
+        """Test that a request without a pair raises ValueError."""
+
+        async def client(service: TwoSumService) -> list[int]:
+            return await service.solve([1, 2, 3], 100)
+
+        with pytest.raises(ValueError, match="No two numbers in the list sum to 100"):
+            _serve(client)
+
+    def test_too_short(self) -> None:
+        """Test that an array with fewer than 2 elements raises ValueError."""
+
+        async def client(service: TwoSumService) -> list[int]:
+            return await service.solve([1], 2)
+
+        with pytest.raises(ValueError, match="at least 2 elements"):
+            _serve(client)
+
+    def test_concurrent_requests_match_two_sum_many(self) -> None:
+        """Test many concurrent requests over a few arrays."""
+        requests = _demo_requests(500, arrays=5, size=50, seed=7)
+
+        async def client(service: TwoSumService) -> list[list[int]]:
+            return await asyncio.gather(
+                *(service.solve(nums, target) for nums, target in requests)
+            )
+
+        expected = [two_sum_many(nums, [target])[0] for nums, target in requests]
+        assert _serve(client, max_pending=16) == expected
+
+    def test_same_array_is_batched(self) -> None:
+        """Test that requests on one array share a single two_sum_many call."""
+        calls: list[list[int]] = []
+
+        def recording(nums: list[int], targets: list[int]) -> Any:
+            calls.append(targets)
+            return two_sum_many(nums, targets)
+
+        nums = [1, 2, 3, 4, 5]
+
+        async def client(service: TwoSumService) -> list[list[int]]:
+            return await asyncio.gather(
+                *(service.solve(list(nums), t) for t in (3, 5, 7, 9))
+            )
+
+        with patch.object(src.service, "two_sum_many", recording):
+            results = _serve(client, batch_window=0.05)
+        assert results == [[0, 1], [0, 3], [1, 4], [3, 4]]
+        assert calls == [[3, 5, 7, 9]]
+
+    def test_different_arrays_are_not_mixed(self) -> None:
+        """Test that each array is solved against its own values."""
+
+        async def client(service: TwoSumService) -> tuple[list[int], list[int]]:
+            return await asyncio.gather(
+                service.solve([1, 2, 3], 5), service.solve([3, 2, 1], 5)
+            )
+
+        assert list(_serve(client, batch_window=0.05)) == [[1, 2], [0, 1]]
+
+    def test_process_pool(self) -> None:
+        """Test the default process pool owned by the service."""
+
+        async def main() -> list[int]:
+            async with TwoSumService(workers=1) as service:
+                return await service.solve([3, 2, 4], 6)
+
+        assert asyncio.run(main()) == [1, 2]
+
+    def test_not_running(self) -> None:
+        """Test that solve requires a started service."""
+
+        async def main() -> list[int]:
+            return await TwoSumService(workers=1).solve([1, 2], 3)
+
+        with pytest.raises(RuntimeError, match="not running"):
+            asyncio.run(main())
+
+    def test_start_twice(self) -> None:
+        """Test that a running service cannot be started again."""
+
+        async def client(service: TwoSumService) -> None:
+            await service.start()
+
+        with pytest.raises(RuntimeError, match="already running"):
+            _serve(client)
+
+    def test_close_cancels_queued_requests(self) -> None:
+        """Test that close cancels requests still waiting in the queue."""
+
+        async def main() -> None:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                service = TwoSumService(executor=pool, batch_window=10)
+                await service.start()
+                task = asyncio.create_task(service.solve([1, 2], 3))
+                await asyncio.sleep(0.01)
+                await service.close()
+                await service.close()  # closing twice is harmless
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+        asyncio.run(main())
+
+    def test_close_releases_blocked_callers(self) -> None:
+        """Test that callers waiting for room in a full queue are cancelled."""
+
+        async def main() -> list[object]:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                service = TwoSumService(
+                    executor=pool, max_pending=1, max_batch=1, batch_window=10
+                )
+                await service.start()
+                tasks = [
+                    asyncio.create_task(service.solve([1, 2], 3)) for _ in range(6)
+                ]
+                await asyncio.sleep(0.01)
+                await service.close()
+                return await asyncio.wait_for(
+                    asyncio.gather(*tasks, return_exceptions=True), timeout=5
+                )
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+
+    @pytest.mark.parametrize(
+        "nums", [[1.0, 2.0], [True, 2], [1, "2"]], ids=["float", "bool", "str"]
+    )
+    def test_non_integers_rejected(self, nums: list[Any]) -> None:
+        """Test that arrays of anything but ints raise a clear TypeError."""
+
+        async def client(service: TwoSumService) -> list[int]:
+            return await service.solve(nums, 3)
+
+        with pytest.raises(TypeError, match="Input must contain integers, got"):
+            _serve(client)
+
+    def test_colliding_encodings_are_not_mixed(self) -> None:
+        """Test that an int64 array packing to another array's repr is apart."""
+        big, small = _repr_twins()
+
+        async def client(service: TwoSumService) -> tuple[list[int], list[int]]:
+            return await asyncio.gather(
+                service.solve(big, big[1] + big[2]),
+                service.solve(small, small[0] + small[1]),
+            )
+
+        assert list(_serve(client, batch_window=0.05)) == [[1, 2], [0, 1]]
+
+
+def _repr_twins() -> tuple[list[int], list[int]]:
+    """Build a list beyond int64 and an int64 list whose bytes are its repr."""
+    big = [10**20, 1, 2, 3]
+    while len(repr(big)) % 8:
+        big.append(len(big))
+    return big, list(array("q", repr(big).encode()))
+
+
+class TestFingerprint:
+    """Tests for the array digest used to group requests."""
+
+    def test_equal_arrays(self) -> None:
+        """Test that equal contents give equal digests."""
+        assert _fingerprint([1, 2, 3]) == _fingerprint((1, 2, 3))
+        assert _fingerprint([1, 2, 3]) != _fingerprint([1, 3, 2])
+
+    def test_big_integers(self) -> None:
+        """Test values beyond int64."""
+        assert _fingerprint([1 << 70, 1]) != _fingerprint([1 << 71, 1])
+
+    def test_encodings_are_tagged(self) -> None:
+        """Test that packed bytes equal to another array's repr differ."""
+        big, small = _repr_twins()
+        assert array("q", small).tobytes() == repr(big).encode()
+        assert _fingerprint(big) != _fingerprint(small)
+
+
+class TestGenerateLoad:
+    """Tests for the local load generator."""
+
+    def test_summary(self) -> None:
+        """Test that every request is counted and timed."""
+        requests = [*_demo_requests(200, arrays=3, size=20), ([1, 2], 100)]
+
+        async def client(service: TwoSumService) -> Any:
+            return await generate_load(service, requests, concurrency=8)
+
+        summary = _serve(client)
+        assert summary.queries == 201
+        assert 0 < summary.p50_ns <= summary.p99_ns
+        assert summary.queries_per_second > 0
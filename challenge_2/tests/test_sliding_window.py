@@ -0,0 +1,105 @@
+"""Tests for sliding-window Two Sum over streams."""
+
+import itertools
+import random
+
+import pytest
+
+from src.sliding_window import SlidingWindowTwoSum, windowed_two_sum
+
+
+def _newest_partners(
+    nums: list[int], target: int, window: int
+) -> list[tuple[int, int]]:
+    """Compute the expected matches by scanning every window."""
+    pairs = []
+    for j, value in enumerate(nums):
+        partners = [
+            i for i in range(max(0, j - window + 1), j) if nums[i] + value == target
+        ]
+        if partners:
+            pairs.append((partners[-1], j))
+    return pairs
+
+
+class TestSlidingWindowTwoSum:
+    """Tests for the push-based processor."""
+
+    def test_pair_inside_window(self) -> None:
+        """Test a match between neighbouring events."""
+        window = SlidingWindowTwoSum(target=9, window=2)
+        assert window.push(2) is None
+        assert window.push(7) == [0, 1]
+
+    def test_evicted_value_does_not_match(self) -> None:
+        """Test that an event older than the window is forgotten."""
+        window = SlidingWindowTwoSum(target=9, window=2)
+        for value in (2, 5):
+            window.push(value)
+        assert window.push(7) is None
+        assert len(window) == 2
+
+    def test_duplicates_are_counted(self) -> None:
+        """Test that evicting one copy keeps the newer copies."""
+        window = SlidingWindowTwoSum(target=10, window=3)
+        for value in (3, 3, 1):
+            window.push(value)
+        assert window.partners(7) == 2
+        assert window.push(7) == [1, 3]  # the first 3 was just evicted
+        assert window.partners(7) == 1
+
+    def test_self_pair_needs_two_events(self) -> None:
+        """Test that an event never pairs with itself."""
+        window = SlidingWindowTwoSum(target=10, window=5)
+        assert window.push(5) is None
+        assert window.push(5) == [0, 1]
+
+    def test_pushed_counts_every_event(self) -> None:
+        """Test stream positions beyond the window size."""
+        window = SlidingWindowTwoSum(target=0, window=2)
+        for value in range(1, 101):
+            window.push(value)
+        assert window.pushed == 100
+        assert len(window) == 2
+        assert window.push(-100) == [99, 100]
+
+    @pytest.mark.parametrize("size", [-1, 0, 1])
+    def test_window_too_small_raises_error(self, size: int) -> None:
+        """Test that a window must hold at least two events."""
+        with pytest.raises(ValueError, match="at least 2 events"):
+            SlidingWindowTwoSum(target=0, window=size)
+
+
+class TestWindowedTwoSum:
+    """Tests for the generator over an iterable."""
+
+    def test_example_case(self) -> None:
+        """Test every match of a short stream."""
+        assert list(windowed_two_sum([4, 1, 2, 6, 8, 4], 10, window=3)) == [
+            (2, 4),
+            (3, 5),
+        ]
+
+    def test_unbounded_stream(self) -> None:
+        """Test that values are pulled lazily from an endless iterator."""
+        pairs = windowed_two_sum(itertools.count(), 101, window=10)
+        assert next(pairs) == (50, 51)
+
+    def test_invalid_window_raises_immediately(self) -> None:
+        """Test that validation happens before iteration starts."""
+        with pytest.raises(ValueError, match="at least 2 events"):
+            windowed_two_sum([1, 2], 3, window=1)
+
+    def test_matches_exhaustive_search(self) -> None:
+        """Verify both forms against a scan of every window."""
+        rng = random.Random(22)
+        for _ in range(200):
+            nums = [rng.randrange(-10, 10) for _ in range(rng.randint(0, 60))]
+            target = rng.randrange(-20, 20)
+            size = rng.randint(2, 12)
+            expected = _newest_partners(nums, target, size)
+
+            assert list(windowed_two_sum(nums, target, size)) == expected
+            window = SlidingWindowTwoSum(target, size)
+            pushed = [window.push(value) for value in nums]
+            assert [tuple(pair) for pair in pushed if pair] == expected
@@ -0,0 +1,168 @@
+"""Tests for the opt-in TwoSumStats instrumentation."""
+
+import random
+import sys
+
+import pytest
+
+from src.stats import (
+    TwoSumStats,
+    estimate_dict_bytes,
+    estimate_dict_resizes,
+    percentile,
+)
+from src.two_sum import two_sum, two_sum_bounded, two_sum_hardened
+
+
+class TestTwoSumStats:
+    """Tests for the stats record itself."""
+
+    def test_empty(self) -> None:
+        """Test a fresh record."""
+        assert TwoSumStats().as_dict() == {
+            "strategy": "",
+            "elements_scanned": 0,
+            "index_size": 0,
+            "index_bytes": 0,
+            "resizes": 0,
+            "phases": {},
+        }
+
+    def test_laps_accumulate(self) -> None:
+        """Test that repeated phases add up."""
+        stats = TwoSumStats()
+        stats.start()
+        stats.lap("scan")
+        first = stats.phases["scan"]
+        stats.lap("scan")
+        assert stats.phases["scan"] >= first >= 0
+
+    def test_repr(self) -> None:
+        """Test that the representation names every field."""
+        assert repr(TwoSumStats()).startswith("TwoSumStats(strategy='', ")
+
+
+class TestEstimateDictResizes:
+    """Tests for the dict growth model."""
+
+    def test_matches_cpython(self) -> None:
+        """Test the estimate against the table size of a growing dict."""
+        seen: dict[int, int] = {0: 0}
+        size, resizes = sys.getsizeof(seen), 0
+        for key in range(1, 50_000):
+            seen[key] = key
+            if sys.getsizeof(seen) != size:
+                size, resizes = sys.getsizeof(seen), resizes + 1
+            assert estimate_dict_resizes(len(seen)) == resizes
+
+    def test_small(self) -> None:
+        """Test that the first table holds 5 keys."""
+        assert estimate_dict_resizes(0) == 0
+        assert estimate_dict_resizes(5) == 0
+        assert estimate_dict_resizes(6) == 1
+
+
+class TestEstimateDictBytes:
+    """Tests for the dict size model."""
+
+    def test_matches_cpython(self) -> None:
+        """Test the estimate against the size of a growing dict."""
+        seen: dict[int, int] = {}
+        assert estimate_dict_bytes(0) == sys.getsizeof(seen)
+        for key in range(100_000):
+            seen[key] = key
+            assert estimate_dict_bytes(len(seen)) == sys.getsizeof(seen)
+
+
+class TestPercentile:
+    """Tests for the nearest-rank percentile of latency samples."""
+
+    def test_nearest_rank(self) -> None:
+        """Test ranks rounded up, with at least the first value."""
+        ordered = list(range(1, 101))
+        assert percentile(ordered, 0.50) == 50
+        assert percentile(ordered, 0.99) == 99
+        assert percentile(ordered, 0.0) == 1
+        assert percentile([7], 0.99) == 7
+
+    def test_empty(self) -> None:
+        """Test that no samples give 0."""
+        assert percentile([], 0.5) == 0
+
+
+class TestEngineStats:
+    """Tests for the stats filled in by the pure-Python engines."""
+
+    def test_two_sum_hash(self) -> None:
+        """Test that the scan stops at j with the distinct values before it."""
+        stats = TwoSumStats()
+        assert two_sum([4, 1, 4, 1, 9, 6], 10, stats=stats) == [3, 4]
+        assert stats.strategy == "hash"
+        assert stats.elements_scanned == 5
+        assert stats.index_size == 2
+        assert stats.index_bytes == sys.getsizeof({4: 0, 1: 1})
+        assert set(stats.phases) == {"scan"}
+
+    def test_two_sum_no_solution(self) -> None:
+        """Test that a failed search still reports the full scan."""
+        stats = TwoSumStats()
+        with pytest.raises(ValueError, match="No two numbers"):
+            two_sum(list(range(100)), 1000, stats=stats)
+        assert stats.elements_scanned == 100
+        assert stats.index_size == 100
+        assert stats.resizes == estimate_dict_resizes(100) > 0
+
+    def test_two_pointer(self) -> None:
+        """Test the elements read by the presorted scan."""
+        stats = TwoSumStats()
+        assert two_sum([1, 2, 3, 4, 6], 7, presorted=True, stats=stats) == [0, 4]
+        assert stats.strategy == "two-pointer"
+        assert stats.elements_scanned == 2
+        assert stats.index_size == 0
+
+    def test_hardened(self) -> None:
+        """Test that large values are counted as distinct keys."""
+        big = 1 << 70
+        stats = TwoSumStats()
+        assert two_sum_hardened([big, big, 3, 5], 8, stats=stats) == [2, 3]
+        assert stats.strategy == "hardened-hash"
+        assert stats.index_size == 2
+
+    def test_bounded_direct(self) -> None:
+        """Test the preallocated direct-address table."""
+        stats = TwoSumStats()
+        assert two_sum_bounded([3, -2, 4, 3], 6, stats=stats) == [0, 3]
+        assert stats.strategy == "direct-address"
+        assert stats.elements_scanned == 4
+        assert stats.index_size == stats.index_bytes == 11
+        assert stats.resizes == 0
+        assert set(stats.phases) == {"range", "scan"}
+
+    def test_bounded_fallback(self) -> None:
+        """Test that a wide range reports the hash engine it fell back to."""
+        stats = TwoSumStats()
+        assert two_sum_bounded([0, 10**9, 5, 7], 12, stats=stats) == [2, 3]
+        assert stats.strategy == "hash"
+        assert set(stats.phases) == {"range", "scan"}
+
+    def test_counters_add_up(self) -> None:
+        """Test that one record aggregates several calls."""
+        stats = TwoSumStats()
+        two_sum([2, 7, 11, 15], 9, stats=stats)
+        two_sum([2, 7, 11, 15], 26, stats=stats)
+        assert stats.elements_scanned == 2 + 4
+
+    def test_results_unchanged(self) -> None:
+        """Test that instrumented calls return the uninstrumented answers."""
+        rng = random.Random(3)
+        for _ in range(50):
+            nums = [rng.randrange(-50, 50) for _ in range(30)]
+            target = nums[rng.randrange(30)] + nums[rng.randrange(30)]
+            for engine in (two_sum, two_sum_hardened, two_sum_bounded):
+                try:
+                    expected = engine(nums, target)
+                except ValueError:
+                    with pytest.raises(ValueError):
+                        engine(nums, target, stats=TwoSumStats())
+                else:
+                    assert engine(nums, target, stats=TwoSumStats()) == expected
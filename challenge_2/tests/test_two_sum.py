@@ -4,9 +4,39 @@ This module tests the two_sum function with various scenarios including
 basic functionality, edge cases, error handling, and different data types.
 """
 
+import itertools
+import random
+import sys
+from array import array
+from collections.abc import Iterator
+from pathlib import Path
+
 import pytest
 
-from src.two_sum import two_sum, two_sum_brute_force, two_sum_generator
+from src.stats import TwoSumStats
+from src.two_sum import (
+    k_sum,
+    looks_sorted,
+    two_sum,
+    two_sum_all_pairs,
+    two_sum_auto,
+    two_sum_bounded,
+    two_sum_brute_force,
+    two_sum_closest,
+    two_sum_compact,
+    two_sum_count,
+    two_sum_count_bands,
+    two_sum_count_range,
+    two_sum_cross,
+    two_sum_cross_mmap,
+    two_sum_generator,
+    two_sum_hardened,
+    two_sum_many,
+    two_sum_mmap,
+    two_sum_stream,
+    two_sum_stream_chunks,
+    two_sum_tolerance,
+)
 
 
 class TestTwoSumBasic:
@@ -137,6 +167,29 @@ class TestTwoSumAlternativeImplementations:
         for nums, target in test_cases:
             assert two_sum_brute_force(nums, target) == two_sum(nums, target)
 
+    def test_compact_matches_optimized(self) -> None:
+        """Verify the compact-index version gives the same results."""
+        test_cases = [
+            ([2, 7, 11, 15], 9),
+            ([3, 2, 4], 6),
+            ([3, 3], 6),
+            ([1, 1, 5], 6),
+            ([0, 4, 3, 0], 0),
+            ([-1, -2, -3, -4, -5], -8),
+            (list(range(5000)), 9997),
+        ]
+        for nums, target in test_cases:
+            assert two_sum_compact(nums, target) == two_sum(nums, target)
+
+    def test_compact_errors(self) -> None:
+        """Test compact-index version error handling."""
+        with pytest.raises(ValueError, match="at least 2 elements"):
+            two_sum_compact([1], 2)
+        with pytest.raises(ValueError, match="No two numbers"):
+            two_sum_compact([1, 2, 3], 10)
+        with pytest.raises(OverflowError):
+            two_sum_compact([2**63, 1], 0)
+
     def test_generator_version(self) -> None:
         """Test generator-based implementation."""
         result = two_sum_generator([2, 7, 11, 15], 9)
@@ -156,6 +209,815 @@ class TestTwoSumAlternativeImplementations:
             assert list(tuple_result) == list_result
 
 
+class TestTwoSumPresorted:
+    """Tests for the sorted-input two-pointer fast path."""
+
+    def test_presorted_basic(self) -> None:
+        """Test the two-pointer scan on ascending input."""
+        assert two_sum([2, 7, 11, 15], 9, presorted=True) == [0, 1]
+        assert two_sum([-5, -4, -3, -2, -1], -8, presorted=True) == [0, 2]
+
+    def test_presorted_returns_smallest_i_last_j(self) -> None:
+        """Test which pair the scan reports when several exist."""
+        assert two_sum([1, 2, 3, 4, 6], 7, presorted=True) == [0, 4]
+        assert two_sum([3, 3, 3], 6, presorted=True) == [0, 2]
+
+    def test_presorted_no_solution_raises_error(self) -> None:
+        """Test that a missing pair raises ValueError."""
+        with pytest.raises(ValueError, match="No two numbers"):
+            two_sum([1, 2, 3], 10, presorted=True)
+        with pytest.raises(ValueError, match="at least 2 elements"):
+            two_sum([1], 2, presorted=True)
+
+    def test_presorted_finds_pair_whenever_hash_map_does(self) -> None:
+        """Verify existence and validity against the hash map version."""
+        rng = random.Random(9)
+        for _ in range(500):
+            nums = sorted(rng.randint(-30, 30) for _ in range(rng.randint(2, 30)))
+            target = rng.randint(-60, 60)
+            try:
+                two_sum(nums, target)
+            except ValueError:
+                with pytest.raises(ValueError):
+                    two_sum(nums, target, presorted=True)
+            else:
+                i, j = two_sum(nums, target, presorted=True)
+                assert i < j
+                assert nums[i] + nums[j] == target
+
+    def test_looks_sorted(self) -> None:
+        """Test the sortedness probe."""
+        assert looks_sorted(list(range(100_000)))
+        assert looks_sorted([5, 5, 5])
+        assert looks_sorted([]) and looks_sorted([1])
+        assert not looks_sorted([3, 1, 2])
+        assert not looks_sorted(list(range(100_000, 0, -1)))
+
+    def test_looks_sorted_is_a_sample(self) -> None:
+        """Test that a single unsampled inversion can go unnoticed."""
+        nums = list(range(1000))
+        nums[500], nums[501] = nums[501], nums[500]
+        assert looks_sorted(nums, samples=1000) is False
+        assert looks_sorted(nums, samples=4) is True
+
+
+class TestTwoSumHardened:
+    """Tests for the collision-resistant hash map variant."""
+
+    @staticmethod
+    def _collision_attack(size: int) -> tuple[list[int], int]:
+        """Build values sharing one int hash, solvable only at the end."""
+        modulus = sys.hash_info.modulus
+        nums = [k * modulus for k in range(1, size)] + [1]
+        return nums, nums[-2] + 1
+
+    def test_basic(self) -> None:
+        """Test the standard examples."""
+        assert two_sum_hardened([2, 7, 11, 15], 9) == [0, 1]
+        assert two_sum_hardened([3, 2, 4], 6) == [1, 2]
+        assert two_sum_hardened([3, 3], 6) == [0, 1]
+
+    def test_colliding_values(self) -> None:
+        """Test values congruent modulo the hash modulus."""
+        nums, target = self._collision_attack(2_000)
+        assert two_sum_hardened(nums, target) == [1_998, 1_999]
+        assert two_sum_hardened(nums, target) == two_sum(nums, target)
+
+    def test_matches_two_sum_around_modulus(self) -> None:
+        """Verify the two_sum contract for values near hash boundaries."""
+        modulus = sys.hash_info.modulus
+        pool = [-2, -1, 0, 1, modulus - 1, modulus, 1 - modulus, -modulus]
+        pool += [2 * modulus + 1, -3 * modulus, 1 << 100, -(1 << 100)]
+        rng = random.Random(13)
+        for _ in range(500):
+            nums = [rng.choice(pool) for _ in range(rng.randint(2, 10))]
+            target = rng.choice(pool) + rng.choice(pool)
+            try:
+                expected = two_sum(nums, target)
+            except ValueError:
+                with pytest.raises(ValueError, match="No two numbers"):
+                    two_sum_hardened(nums, target)
+            else:
+                assert two_sum_hardened(nums, target) == expected
+
+    def test_single_element_raises_error(self) -> None:
+        """Test that fewer than 2 elements is rejected."""
+        with pytest.raises(ValueError, match="at least 2 elements"):
+            two_sum_hardened([1], 2)
+
+
+class TestTwoSumBounded:
+    """Tests for the direct-address engine for small value ranges."""
+
+    def test_basic(self) -> None:
+        """Test the standard examples."""
+        assert two_sum_bounded([2, 7, 11, 15], 9) == [0, 1]
+        assert two_sum_bounded([3, 2, 4], 6) == [1, 2]
+        assert two_sum_bounded([3, 3], 6) == [0, 1]
+
+    def test_negative_values(self) -> None:
+        """Test a table offset below zero."""
+        assert two_sum_bounded([-1, -2, -3, -4, -5], -8) == [2, 4]
+        assert two_sum_bounded([-3, 4, 3, 90], 0) == [0, 2]
+
+    def test_latest_complement_index(self) -> None:
+        """Test that the latest earlier complement is paired, as in two_sum."""
+        nums = [1, 5, 1, 9, 5, 1]
+        assert two_sum_bounded(nums, 6) == two_sum(nums, 6) == [0, 1]
+        assert two_sum_bounded(nums, 10) == two_sum(nums, 10) == [2, 3]
+
+    def test_matches_two_sum(self) -> None:
+        """Verify the two_sum contract on random small-range input."""
+        rng = random.Random(15)
+        for _ in range(500):
+            nums = [rng.randint(-8, 8) for _ in range(rng.randint(2, 15))]
+            target = rng.randint(-20, 20)
+            try:
+                expected = two_sum(nums, target)
+            except ValueError:
+                with pytest.raises(ValueError, match="No two numbers"):
+                    two_sum_bounded(nums, target)
+            else:
+                assert two_sum_bounded(nums, target) == expected
+
+    def test_wide_range_falls_back(self) -> None:
+        """Test that a range too wide for a table still gets solved."""
+        nums = [10**12, 5, -(10**12), 7]
+        assert two_sum_bounded(nums, 12) == two_sum(nums, 12) == [1, 3]
+
+    def test_single_element_raises_error(self) -> None:
+        """Test that fewer than 2 elements is rejected."""
+        with pytest.raises(ValueError, match="at least 2 elements"):
+            two_sum_bounded([1], 2)
+
+
+class TestTwoSumMany:
+    """Tests for the batch multi-target query API."""
+
+    def test_multiple_targets(self) -> None:
+        """Test several targets answered from one index."""
+        assert two_sum_many([2, 7, 11, 15], [9, 18, 26]) == [
+            [0, 1],
+            [1, 2],
+            [2, 3],
+        ]
+
+    def test_no_solution_marker(self) -> None:
+        """Test that unsolvable targets yield None instead of raising."""
+        assert two_sum_many([1, 2, 3], [10, 5, -1]) == [None, [1, 2], None]
+
+    def test_self_pair_requires_two_occurrences(self) -> None:
+        """Test that a value only pairs with itself if it appears twice."""
+        assert two_sum_many([3, 1, 4], [6, 8]) == [None, None]
+        assert two_sum_many([3, 1, 3], [6]) == [[0, 2]]
+
+    def test_repeated_targets_return_independent_lists(self) -> None:
+        """Test that repeated targets do not share result lists."""
+        results = two_sum_many([1, 2, 3], [3, 3])
+        assert results == [[0, 1], [0, 1]]
+        assert results[0] is not results[1]
+
+    def test_accepts_any_iterable_of_targets(self) -> None:
+        """Test targets provided by a generator."""
+        assert two_sum_many([3, 2, 4], (t for t in (6, 5))) == [[1, 2], [0, 1]]
+
+    def test_empty_targets(self) -> None:
+        """Test that no targets gives no results."""
+        assert two_sum_many([1, 2], []) == []
+
+    def test_matches_brute_force(self) -> None:
+        """Verify every answer equals the brute force pair."""
+        nums = [4, -1, 3, 3, 0, 7, -1, 2]
+        targets = list(range(-4, 16))
+        for target, result in zip(targets, two_sum_many(nums, targets), strict=True):
+            try:
+                expected: list[int] | None = two_sum_brute_force(nums, target)
+            except ValueError:
+                expected = None
+            assert result == expected
+
+    def test_prefilter_keeps_answers(self) -> None:
+        """Test that the prefilter changes no answer, only skips searches."""
+        rng = random.Random(16)
+        for stride in (1, 3, 10):
+            nums = [stride * rng.randint(-30, 30) for _ in range(40)]
+            targets = list(range(-70 * stride, 70 * stride, max(1, stride // 2)))
+            assert two_sum_many(nums, targets, prefilter=True) == two_sum_many(
+                nums, targets
+            )
+
+    def test_too_short_raises_error(self) -> None:
+        """Test that fewer than 2 elements raises ValueError."""
+        with pytest.raises(ValueError, match="at least 2 elements"):
+            two_sum_many([1], [2])
+
+
+class TestTwoSumAuto:
+    """Tests for the adaptive engine dispatcher."""
+
+    def test_example_case(self) -> None:
+        """Test the problem example."""
+        assert two_sum_auto([2, 7, 11, 15], 9) == [0, 1]
+
+    def test_tiny_input_uses_nested_scan(self) -> None:
+        """Test that up to three elements skip the hash map."""
+        stats = TwoSumStats()
+        assert two_sum_auto([3, 2, 4], 6, stats=stats) == [1, 2]
+        assert stats.strategy == "nested-loop"
+        assert stats.elements_scanned == 3
+        assert stats.index_size == 0
+        assert set(stats.phases) == {"probe", "scan"}
+
+    def test_short_input_uses_hash(self) -> None:
+        """Test that short lists go to two_sum."""
+        stats = TwoSumStats()
+        assert two_sum_auto([1, 5, 3, 3, 7], 10, stats=stats) == [3, 4]
+        assert stats.strategy == "hash"
+
+    def test_matches_two_sum(self) -> None:
+        """Verify the two_sum pair for lists, tuples and arrays of any size."""
+        rng = random.Random(24)
+        for n in (2, 3, 4, 50, 300, 20_000):
+            nums = [rng.randrange(-n, n) for _ in range(n)]
+            for target in (nums[0] + nums[-1], rng.randrange(-2 * n, 2 * n)):
+                try:
+                    expected = two_sum(nums, target)
+                except ValueError:
+                    with pytest.raises(ValueError, match="No two numbers"):
+                        two_sum_auto(nums, target)
+                    continue
+                assert two_sum_auto(nums, target) == expected
+                assert two_sum_auto(tuple(nums), target) == expected
+                assert two_sum_auto(array("q", nums), target) == expected
+
+    def test_narrow_range_without_numpy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a long narrow-range list goes to two_sum_bounded."""
+        monkeypatch.setattr("src.two_sum.np", None)
+        nums = [2 * (i % 1000) for i in range(20_000)] + [1]
+        stats = TwoSumStats()
+        assert two_sum_auto(nums, 1999, stats=stats) == two_sum(nums, 1999)
+        assert stats.strategy == "direct-address"
+
+    def test_wide_range_without_numpy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a wide sampled range stays on the hash engine."""
+        monkeypatch.setattr("src.two_sum.np", None)
+        nums = [i * 10**6 for i in range(20_000)]
+        stats = TwoSumStats()
+        assert two_sum_auto(nums, 19_999 * 10**6, stats=stats) == [9_999, 10_000]
+        assert stats.strategy == "hash"
+        assert "range" not in stats.phases
+
+    def test_big_integers(self) -> None:
+        """Test a long list with values beyond int64."""
+        big = 1 << 70
+        nums = [big + i for i in range(20_000)]
+        assert two_sum_auto(nums, 2 * big + 39_997) == [19_998, 19_999]
+
+    def test_too_short_raises_error(self) -> None:
+        """Test that fewer than 2 elements raise ValueError."""
+        with pytest.raises(ValueError, match="at least 2 elements, got 1"):
+            two_sum_auto([1], 2)
+
+
+class TestTwoSumStream:
+    """Tests for the streaming implementations."""
+
+    @staticmethod
+    def _feed(values: list[int], consumed: list[int]) -> Iterator[int]:
+        """Yield values while recording how many were read."""
+        for value in values:
+            consumed.append(value)
+            yield value
+
+    def test_generator_input(self) -> None:
+        """Test a one-shot generator, which has no len()."""
+        assert two_sum_stream((x for x in [2, 7, 11, 15]), 9) == [0, 1]
+
+    def test_stops_reading_at_solution(self) -> None:
+        """Test that nothing past the pair is consumed."""
+        consumed: list[int] = []
+        feed = self._feed([1, 2, 3, 4, 5, 6], consumed)
+        assert two_sum_stream(feed, 5) == [1, 2]
+        assert consumed == [1, 2, 3]
+
+    def test_infinite_stream(self) -> None:
+        """Test an unbounded iterator whose answer appears early."""
+        assert two_sum_stream(itertools.count(), 7) == [3, 4]
+
+    def test_matches_two_sum(self) -> None:
+        """Verify stream results equal the list version."""
+        test_cases = [
+            ([2, 7, 11, 15], 9),
+            ([3, 2, 4], 6),
+            ([1, 1, 5], 6),
+            ([-1, -2, -3, -4, -5], -8),
+        ]
+        for nums, target in test_cases:
+            assert two_sum_stream(iter(nums), target) == two_sum(nums, target)
+
+    def test_short_stream_raises_error(self) -> None:
+        """Test that fewer than 2 streamed elements raises ValueError."""
+        with pytest.raises(ValueError, match="at least 2 elements, got 1"):
+            two_sum_stream(iter([5]), 10)
+
+    def test_no_solution_raises_error(self) -> None:
+        """Test that an exhausted stream without a pair raises ValueError."""
+        with pytest.raises(ValueError, match="No two numbers"):
+            two_sum_stream(iter([1, 2, 3]), 10)
+
+    def test_chunks_use_global_indices(self) -> None:
+        """Test that indices continue across chunk boundaries."""
+        assert two_sum_stream_chunks([[2, 7], [11], [], [15]], 26) == [2, 3]
+        assert two_sum_stream_chunks(iter([[1], [2, 3]]), 4) == [0, 2]
+
+    def test_chunks_from_buffers(self) -> None:
+        """Test array.array and memoryview chunks."""
+        chunks = [array("q", [3, 9]), memoryview(array("q", [4, 0])), range(2)]
+        assert two_sum_stream_chunks(chunks, 4) == [2, 3]
+
+    def test_chunks_stop_reading_at_solution(self) -> None:
+        """Test that later chunks are never requested."""
+
+        def chunks() -> Iterator[list[int]]:
+            yield [1, 2]
+            yield [3, 4]
+            raise AssertionError("read past the solution")
+
+        assert two_sum_stream_chunks(chunks(), 5) == [1, 2]
+
+    def test_chunks_no_solution_raises_error(self) -> None:
+        """Test exhaustion of chunked input without a pair."""
+        with pytest.raises(ValueError, match="No two numbers"):
+            two_sum_stream_chunks([[1], [2]], 10)
+
+
+class TestTwoSumAllPairs:
+    """Tests for the lazy all-pairs enumeration."""
+
+    def test_all_pairs_in_order(self) -> None:
+        """Test that every pair is yielded, ordered by j then i."""
+        pairs = list(two_sum_all_pairs([1, 3, 2, 2, 3], 5))
+        assert pairs == [(1, 2), (1, 3), (2, 4), (3, 4)]
+
+    def test_duplicates_pair_with_each_other(self) -> None:
+        """Test a value pairing with all its earlier duplicates."""
+        assert list(two_sum_all_pairs([3, 3, 3], 6)) == [(0, 1), (0, 2), (1, 2)]
+
+    def test_no_pairs(self) -> None:
+        """Test inputs without matches, including too-short ones."""
+        assert list(two_sum_all_pairs([1, 2, 3], 10)) == []
+        assert list(two_sum_all_pairs([], 0)) == []
+        assert list(two_sum_all_pairs([5], 10)) == []
+
+    def test_matches_brute_force_enumeration(self) -> None:
+        """Verify against a quadratic enumeration on random input."""
+        rng = random.Random(8)
+        nums = [rng.randint(-6, 6) for _ in range(120)]
+        for target in range(-12, 13):
+            expected = sorted(
+                (i, j)
+                for j in range(len(nums))
+                for i in range(j)
+                if nums[i] + nums[j] == target
+            )
+            pairs = list(two_sum_all_pairs(nums, target))
+            assert pairs == sorted(pairs, key=lambda pair: (pair[1], pair[0]))
+            assert sorted(pairs) == expected
+
+    def test_first_pair_shares_j_with_two_sum(self) -> None:
+        """Test that the first pair completes where two_sum stops."""
+        nums = [1, 1, 5, 3, 3]
+        first = next(two_sum_all_pairs(nums, 6))
+        assert first[1] == two_sum(nums, 6)[1]
+
+    def test_lazy_on_heavy_duplicates(self) -> None:
+        """Test that billions of potential pairs are produced on demand."""
+        nums = [0] * 100_000  # ~5 billion pairs summing to 0
+        head = list(itertools.islice(two_sum_all_pairs(nums, 0), 5))
+        assert head == [(0, 1), (0, 2), (1, 2), (0, 3), (1, 3)]
+
+    def test_accepts_iterator(self) -> None:
+        """Test a one-shot iterator input."""
+        assert list(two_sum_all_pairs(iter([4, 1, 4]), 5)) == [(0, 1), (1, 2)]
+
+
+class TestTwoSumCount:
+    """Tests for counting matching pairs without materializing them."""
+
+    def test_example_case(self) -> None:
+        """Test distinct values and repeated values."""
+        assert two_sum_count([1, 5, 3, 3, 3, 7, 5], 10) == 4
+        assert two_sum_count([2, 7, 11, 15], 9) == 1
+
+    def test_self_pairs(self) -> None:
+        """Test that k copies of target / 2 form k * (k - 1) / 2 pairs."""
+        assert two_sum_count([2, 2, 2, 2], 4) == 6
+        assert two_sum_count([2], 4) == 0
+        assert two_sum_count([3, 3, 3], 5) == 0
+
+    def test_no_pairs(self) -> None:
+        """Test empty, single-element and unmatched inputs."""
+        assert two_sum_count([], 0) == 0
+        assert two_sum_count([5], 10) == 0
+        assert two_sum_count([1, 2, 3], 100) == 0
+
+    def test_iterable_input(self) -> None:
+        """Test that any iterable is consumed in one pass."""
+        assert two_sum_count((x % 10 for x in range(100)), 9) == 5 * 10 * 10
+
+    def test_big_integers(self) -> None:
+        """Test values beyond 64 bits."""
+        big = 1 << 70
+        assert two_sum_count([big, -big, big, 0, 0], 0) == 3
+
+    def test_matches_all_pairs(self) -> None:
+        """Verify the count against every pair on random data."""
+        rng = random.Random(21)
+        for _ in range(200):
+            nums = [rng.randrange(-8, 8) for _ in range(rng.randint(0, 30))]
+            target = rng.randrange(-16, 16)
+            expected = sum(a + b == target for a, b in itertools.combinations(nums, 2))
+            assert two_sum_count(nums, target) == expected
+
+
+class TestTwoSumCountRange:
+    """Tests for counting pairs whose sum falls in a band."""
+
+    def test_example_case(self) -> None:
+        """Test a band over distinct values."""
+        assert two_sum_count_range([1, 2, 3, 4, 5], 5, 7) == 6
+
+    def test_single_target_band(self) -> None:
+        """Test that a band of width one matches two_sum_count."""
+        nums = [1, 5, 3, 3, 3, 7, 5]
+        assert two_sum_count_range(nums, 10, 10) == two_sum_count(nums, 10) == 4
+
+    def test_empty_band_and_short_input(self) -> None:
+        """Test bands with lo > hi and inputs without pairs."""
+        assert two_sum_count_range([1, 2, 3], 5, 4) == 0
+        assert two_sum_count_range([7], 0, 100) == 0
+        assert two_sum_count_range(iter([]), 0, 100) == 0
+
+    def test_band_covering_everything(self) -> None:
+        """Test that a wide band counts every pair."""
+        assert two_sum_count_range(range(100), -(1 << 70), 1 << 70) == 4950
+
+    def test_big_integers(self) -> None:
+        """Test values beyond 64 bits."""
+        big = 1 << 70
+        assert two_sum_count_range([big, -big, 1, 2], 0, 3) == 2
+
+    def test_bands_share_one_sort(self) -> None:
+        """Test several bands at once, including a repeated one."""
+        bands = [(5, 7), (3, 3), (10, 20), (5, 7)]
+        assert two_sum_count_bands([5, 4, 3, 2, 1], bands) == [6, 1, 0, 6]
+        assert two_sum_count_bands([1, 2], []) == []
+
+    def test_matches_exhaustive_search(self) -> None:
+        """Verify every band against all pairs on random data."""
+        rng = random.Random(23)
+        for _ in range(200):
+            nums = [rng.randrange(-20, 20) for _ in range(rng.randint(0, 30))]
+            bands = [(rng.randrange(-45, 45), rng.randrange(-45, 45)) for _ in range(4)]
+            expected = [
+                sum(lo <= a + b <= hi for a, b in itertools.combinations(nums, 2))
+                for lo, hi in bands
+            ]
+            assert two_sum_count_bands(nums, bands) == expected
+
+
+class TestKSum:
+    """Tests for the k-sum engine."""
+
+    @staticmethod
+    def _value_sets(nums: list[int], target: int, k: int) -> list[tuple[int, ...]]:
+        """Return the distinct sorted value combinations by enumeration."""
+        found = {
+            tuple(sorted(nums[i] for i in combo))
+            for combo in itertools.combinations(range(len(nums)), k)
+            if sum(nums[i] for i in combo) == target
+        }
+        return sorted(found)
+
+    def test_three_sum(self) -> None:
+        """Test the classic 3Sum example, with indices."""
+        assert k_sum([-1, 0, 1, 2, -1, -4], 0, 3) == [(0, 3, 4), (0, 1, 2)]
+
+    def test_four_sum(self) -> None:
+        """Test the classic 4Sum example, with indices."""
+        result = k_sum([1, 0, -1, 0, -2, 2], 0, 4)
+        assert result == [(0, 2, 4, 5), (1, 3, 4, 5), (0, 1, 2, 3)]
+
+    def test_two_sum_lists_every_value_pair(self) -> None:
+        """Test k=2 reporting each distinct value pair once."""
+        assert k_sum([3, 1, 2, 2, 3, 1], 4, 2) == [(0, 1), (2, 3)]
+
+    def test_repeated_value_uses_first_indices(self) -> None:
+        """Test a value used several times taking its earliest indices."""
+        assert k_sum([5, 2, 2, 9, 2, 2, 2], 8, 4) == [(1, 2, 4, 5)]
+        assert k_sum([0, 0, 0, 0, 0], 0, 3) == [(0, 1, 2)]
+
+    def test_value_not_reused_beyond_its_count(self) -> None:
+        """Test that a single occurrence cannot fill two slots."""
+        assert k_sum([1, 2, 6], 4, 3) == []
+        assert k_sum([1, 2, 6, 1], 4, 3) == [(0, 1, 3)]
+
+    def test_no_solution(self) -> None:
+        """Test an empty result when no combination matches."""
+        assert k_sum([1, 2, 3, 4], 100, 3) == []
+        assert k_sum([1, 2, 3, 4], -100, 4) == []
+
+    @pytest.mark.parametrize("k", [2, 3, 4, 5, 6])
+    def test_matches_enumeration(self, k: int) -> None:
+        """Verify every k against exhaustive enumeration on random input."""
+        rng = random.Random(k)
+        for _ in range(60):
+            nums = [rng.randint(-5, 5) for _ in range(rng.randint(k, 10))]
+            target = rng.randint(-3 * k, 3 * k)
+            result = k_sum(nums, target, k)
+            values = [tuple(sorted(nums[i] for i in combo)) for combo in result]
+            assert values == self._value_sets(nums, target, k)
+            for combo in result:
+                assert list(combo) == sorted(set(combo))
+
+    def test_invalid_k_raises_error(self) -> None:
+        """Test that k below 2 is rejected."""
+        with pytest.raises(ValueError, match="k must be at least 2"):
+            k_sum([1, 2, 3], 3, 1)
+
+    def test_too_few_elements_raises_error(self) -> None:
+        """Test that fewer than k elements is rejected."""
+        with pytest.raises(ValueError, match="at least 4 elements, got 3"):
+            k_sum([1, 2, 3], 6, 4)
+
+
+class TestTwoSumClosest:
+    """Tests for the closest-sum mode on lists."""
+
+    @staticmethod
+    def _best_gap(nums: list[int], target: int) -> int:
+        """Return the smallest |sum - target| over all pairs."""
+        return min(abs(a + b - target) for a, b in itertools.combinations(nums, 2))
+
+    def test_exact_pair(self) -> None:
+        """Test that an exact pair is found when it exists."""
+        assert two_sum_closest([2, 7, 11, 15], 9) == [0, 1]
+        assert two_sum_closest([3, 2, 4], 6) == [1, 2]
+
+    def test_nearest_pair(self) -> None:
+        """Test the nearest pair when no exact match exists."""
+        assert two_sum_closest([2, 7, 11, 15], 19) == [1, 2]
+        assert two_sum_closest([-1, 2, 1, -4], 4) == [1, 2]
+
+    def test_target_out_of_range(self) -> None:
+        """Test targets beyond the smallest and largest possible sums."""
+        assert two_sum_closest([5, 1, 9, 3], -100) == [1, 3]
+        assert two_sum_closest([5, 1, 9, 3], 100) == [0, 2]
+
+    def test_matches_exhaustive_search(self) -> None:
+        """Verify the gap against all pairs on random input."""
+        rng = random.Random(11)
+        for _ in range(300):
+            nums = [rng.randint(-50, 50) for _ in range(rng.randint(2, 30))]
+            target = rng.randint(-150, 150)
+            i, j = two_sum_closest(nums, target)
+            assert i < j
+            assert abs(nums[i] + nums[j] - target) == self._best_gap(nums, target)
+
+    def test_single_element_raises_error(self) -> None:
+        """Test that fewer than 2 elements is rejected."""
+        with pytest.raises(ValueError, match="at least 2 elements"):
+            two_sum_closest([1], 1)
+
+
+class TestTwoSumTolerance:
+    """Tests for float pairs matched within a tolerance."""
+
+    def test_float_amounts(self) -> None:
+        """Test amounts whose float sum is not exactly the target."""
+        nums = [0.1, 5.0, 0.2]
+        assert 0.1 + 0.2 != 0.3
+        assert two_sum_tolerance(nums, 0.3, 1e-9) == [0, 2]
+
+    def test_within_eps(self) -> None:
+        """Test that the distance may be up to eps, inclusive."""
+        assert two_sum_tolerance([1.0, 2.0, 4.0], 5.05, 0.1) == [0, 2]
+        assert two_sum_tolerance([1.0, 2.0, 4.0], 5.5, 0.5) == [0, 2]
+        with pytest.raises(ValueError, match="No two numbers"):
+            two_sum_tolerance([1.0, 2.0, 4.0], 5.5, 0.25)
+
+    def test_zero_eps_is_exact(self) -> None:
+        """Test that eps=0 only accepts exact sums."""
+        assert two_sum_tolerance([2, 7, 11, 15], 9, 0) == [0, 1]
+        with pytest.raises(ValueError, match="within 0"):
+            two_sum_tolerance([2, 7, 11, 15], 10, 0)
+
+    def test_zero_eps_float_sums(self) -> None:
+        """Test that eps=0 finds pairs whose float sum equals target."""
+        assert two_sum_tolerance([0.1, 0.2], 0.1 + 0.2, 0) == [0, 1]
+        assert two_sum_tolerance([24.49, -83.07], 24.49 + -83.07, 0) == [0, 1]
+        # -1e16 absorbs its partner: target - -1e16 is 0, not -1
+        assert two_sum_tolerance([-1.0, -1e16], -1e16 + -1.0, 0) == [0, 1]
+
+    def test_smallest_value_first(self) -> None:
+        """Test that the smallest value with a partner is chosen."""
+        nums = [5.0, 4.0, 6.0, 1.0, 9.0]
+        assert two_sum_tolerance(nums, 10.0, 0.01) == [3, 4]
+
+    def test_same_value_twice(self) -> None:
+        """Test that an element cannot pair with itself."""
+        with pytest.raises(ValueError, match="No two numbers"):
+            two_sum_tolerance([5.0, 1.0], 10.0, 0.5)
+        assert two_sum_tolerance([5.0, 1.0, 5.0], 10.0, 0.5) == [0, 2]
+
+    def test_negative_and_infinite_values(self) -> None:
+        """Test signed values and infinities."""
+        nums = [float("-inf"), -2.5, 7.5, float("inf")]
+        assert two_sum_tolerance(nums, 5.0, 0.0) == [1, 2]
+
+    def test_matches_exhaustive_search(self) -> None:
+        """Verify that a pair is found exactly when one exists."""
+        rng = random.Random(20)
+        for _ in range(300):
+            nums = [round(rng.uniform(-10, 10), 2) for _ in range(rng.randint(2, 12))]
+            target = round(rng.uniform(-20, 20), 2)
+            eps = rng.choice([0.0, 0.005, 0.5])
+            exists = any(
+                abs(a + b - target) <= eps for a, b in itertools.combinations(nums, 2)
+            )
+            if exists:
+                i, j = two_sum_tolerance(nums, target, eps)
+                assert i < j
+                assert abs(nums[i] + nums[j] - target) <= eps
+            else:
+                with pytest.raises(ValueError):
+                    two_sum_tolerance(nums, target, eps)
+
+    @pytest.mark.parametrize("eps", [-0.1, float("nan")])
+    def test_invalid_eps_raises_error(self, eps: float) -> None:
+        """Test that eps must be a non-negative number."""
+        with pytest.raises(ValueError, match="eps must be non-negative"):
+            two_sum_tolerance([1.0, 2.0], 3.0, eps)
+
+    def test_nan_raises_error(self) -> None:
+        """Test that NaN values are rejected."""
+        with pytest.raises(ValueError, match="NaN"):
+            two_sum_tolerance([1.0, float("nan"), 2.0], 3.0, 0.1)
+
+    def test_too_short_raises_error(self) -> None:
+        """Test that a single value is rejected."""
+        with pytest.raises(ValueError, match="at least 2 elements, got 1"):
+            two_sum_tolerance([1.0], 2.0, 0.1)
+
+
+class TestTwoSumMmap:
+    """Tests for memory-mapped binary input (chunked, NumPy-free path)."""
+
+    @staticmethod
+    def _write(path: Path, typecode: str, values: list[int]) -> Path:
+        """Write values as packed little-endian integers."""
+        data = array(typecode, values)
+        if sys.byteorder == "big":
+            data.byteswap()
+        path.write_bytes(data.tobytes())
+        return path
+
+    def test_int64_file(self, tmp_path: Path) -> None:
+        """Test an int64 file."""
+        path = self._write(tmp_path / "nums.bin", "q", [2, 7, 11, 15])
+        assert two_sum_mmap(path, 9, vectorized=False) == [0, 1]
+
+    def test_int32_file(self, tmp_path: Path) -> None:
+        """Test an int32 file with negative values."""
+        path = self._write(tmp_path / "nums.bin", "i", [-1, -2, -3, -4, -5])
+        assert two_sum_mmap(str(path), -8, "int32", vectorized=False) == [2, 4]
+
+    def test_pair_across_blocks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that indices stay global across mapped blocks."""
+        monkeypatch.setattr("src.two_sum._MMAP_CHUNK_SIZE", 3)
+        nums = list(range(20))
+        path = self._write(tmp_path / "nums.bin", "q", nums)
+        assert two_sum_mmap(path, 37, vectorized=False) == two_sum(nums, 37)
+
+    def test_no_solution_raises_error(self, tmp_path: Path) -> None:
+        """Test a file without a pair."""
+        path = self._write(tmp_path / "nums.bin", "q", [1, 2, 3])
+        with pytest.raises(ValueError, match="No two numbers"):
+            two_sum_mmap(path, 10, vectorized=False)
+
+    def test_empty_file_raises_error(self, tmp_path: Path) -> None:
+        """Test that an empty file is reported like an empty list."""
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+        with pytest.raises(ValueError, match="at least 2 elements, got 0"):
+            two_sum_mmap(path, 0, vectorized=False)
+
+    def test_truncated_file_raises_error(self, tmp_path: Path) -> None:
+        """Test a file whose size is not a multiple of the element size."""
+        path = tmp_path / "bad.bin"
+        path.write_bytes(b"\x00" * 12)
+        with pytest.raises(ValueError, match="not a multiple"):
+            two_sum_mmap(path, 0, "int64", vectorized=False)
+
+    def test_unsupported_dtype_raises_error(self, tmp_path: Path) -> None:
+        """Test that only int32/int64 are accepted."""
+        path = self._write(tmp_path / "nums.bin", "q", [1, 2])
+        with pytest.raises(ValueError, match="Unsupported dtype"):
+            two_sum_mmap(path, 3, "float64")
+
+
+class TestTwoSumCross:
+    """Tests for pairs joining two separate inputs."""
+
+    @staticmethod
+    def _reference(a: list[int], b: list[int], target: int) -> list[int] | None:
+        """Smallest index in the larger input, first partner in the other."""
+        if len(a) <= len(b):
+            pairs = [(j, i) for j in range(len(b)) for i in range(len(a))]
+            hits = [[i, j] for j, i in pairs if a[i] + b[j] == target]
+        else:
+            pairs = [(i, j) for i in range(len(a)) for j in range(len(b))]
+            hits = [[i, j] for i, j in pairs if a[i] + b[j] == target]
+        return hits[0] if hits else None
+
+    def test_basic(self) -> None:
+        """Test the docstring example."""
+        assert two_sum_cross([1, 5, 9], [10, 4, 2], 13) == [2, 1]
+
+    def test_pairs_never_within_one_input(self) -> None:
+        """Test that a pair inside a single input is not a match."""
+        with pytest.raises(ValueError, match="No two numbers in the lists sum to 6"):
+            two_sum_cross([1, 5], [4, 10], 6)
+
+    def test_larger_first_input(self) -> None:
+        """Test that indices keep their meaning when a is indexed last."""
+        a = [9, 9, 1, 2, 3, 4]
+        b = [8, 7]
+        assert two_sum_cross(a, b, 10) == [3, 0]
+
+    def test_duplicates_use_first_index(self) -> None:
+        """Test that the indexed side reports its first occurrence."""
+        assert two_sum_cross([3, 3], [3], 6) == [0, 0]
+        assert two_sum_cross([5, 2, 2], [1, 3, 3, 8], 5) == [1, 1]
+
+    def test_empty_input_raises_error(self) -> None:
+        """Test that both inputs must hold at least one value."""
+        with pytest.raises(ValueError, match="non-empty, got 0 and 2"):
+            two_sum_cross([], [1, 2], 3)
+        with pytest.raises(ValueError, match="non-empty, got 1 and 0"):
+            two_sum_cross([1], [], 3)
+
+    def test_matches_reference(self) -> None:
+        """Verify against an exhaustive search on random inputs."""
+        rng = random.Random(19)
+        for _ in range(200):
+            a = [rng.randint(-10, 10) for _ in range(rng.randint(1, 8))]
+            b = [rng.randint(-10, 10) for _ in range(rng.randint(1, 8))]
+            target = rng.randint(-20, 20)
+            expected = self._reference(a, b, target)
+            if expected is None:
+                with pytest.raises(ValueError):
+                    two_sum_cross(a, b, target)
+            else:
+                assert two_sum_cross(a, b, target) == expected
+
+
+class TestTwoSumCrossMmap:
+    """Tests for cross pairs against a memory-mapped file (chunked path)."""
+
+    def test_file_is_larger(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test streaming the file across blocks against an indexed list."""
+        monkeypatch.setattr("src.two_sum._MMAP_CHUNK_SIZE", 3)
+        data = list(range(100, 120))
+        path = TestTwoSumMmap._write(tmp_path / "b.bin", "q", data)
+        a = [5, 1, 7]
+        assert two_sum_cross_mmap(a, path, 118, vectorized=False) == [2, 11]
+        assert two_sum_cross(a, data, 118) == [2, 11]
+
+    def test_file_is_smaller(self, tmp_path: Path) -> None:
+        """Test that a small int32 file is indexed instead."""
+        path = TestTwoSumMmap._write(tmp_path / "b.bin", "i", [-4, 6])
+        a = [1, 2, 3, 4, 10, 5]
+        assert two_sum_cross_mmap(a, str(path), 6, "int32", vectorized=False) == [4, 0]
+
+    def test_no_solution_raises_error(self, tmp_path: Path) -> None:
+        """Test a file without a partner."""
+        path = TestTwoSumMmap._write(tmp_path / "b.bin", "q", [1, 2, 3])
+        with pytest.raises(ValueError, match="No two numbers"):
+            two_sum_cross_mmap([100], path, 0, vectorized=False)
+
+    def test_empty_file_raises_error(self, tmp_path: Path) -> None:
+        """Test that an empty file is rejected before mapping."""
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+        with pytest.raises(ValueError, match="non-empty, got 1 and 0"):
+            two_sum_cross_mmap([1], path, 1, vectorized=False)
+
+
 class TestTwoSumTypeHints:
     """Test type hint compliance (these pass if mypy passes)."""
 
@@ -0,0 +1,166 @@
+"""Test suite for the incremental TwoSumIndex."""
+
+import random
+
+import pytest
+
+from src.two_sum import two_sum_brute_force
+from src.two_sum_index import TwoSumIndex
+
+
+class TestTwoSumIndexBasic:
+    """Basic add/query behaviour."""
+
+    def test_query_initial_values(self) -> None:
+        """Test a query against values passed to the constructor."""
+        index = TwoSumIndex([2, 7, 11, 15])
+        assert index.query(9) == [0, 1]
+        assert len(index) == 4
+
+    def test_add_returns_sequential_indices(self) -> None:
+        """Test that add assigns list-like indices."""
+        index = TwoSumIndex()
+        assert [index.add(v) for v in (5, 6, 7)] == [0, 1, 2]
+        assert index[1] == 6
+
+    def test_extend_then_query(self) -> None:
+        """Test extend with a generator."""
+        index = TwoSumIndex()
+        index.extend(v for v in (3, 2, 4))
+        assert index.query(6) == [1, 2]
+
+    def test_no_solution_returns_none(self) -> None:
+        """Test that a missing pair yields None."""
+        assert TwoSumIndex([1, 2, 3]).query(10) is None
+
+    def test_empty_index(self) -> None:
+        """Test queries on an empty index."""
+        index = TwoSumIndex()
+        assert index.query(0) is None
+        assert len(index) == 0
+
+
+class TestTwoSumIndexDuplicates:
+    """Duplicate handling, which the overwriting seen map gets wrong."""
+
+    def test_value_pairs_with_its_duplicate(self) -> None:
+        """Test that two equal values form a pair."""
+        assert TwoSumIndex([3, 3]).query(6) == [0, 1]
+
+    def test_single_value_does_not_pair_with_itself(self) -> None:
+        """Test that one occurrence cannot be used twice."""
+        assert TwoSumIndex([3, 1]).query(6) is None
+
+    def test_removing_one_duplicate_keeps_the_other(self) -> None:
+        """Test that earlier duplicates are not lost on removal."""
+        index = TwoSumIndex([4, 4, 4])
+        index.remove(1)
+        assert index.query(8) == [0, 2]
+        index.remove(0)
+        assert index.query(8) is None
+
+
+class TestTwoSumIndexUpdates:
+    """Removal and cache invalidation."""
+
+    def test_remove_returns_value(self) -> None:
+        """Test that remove returns the removed value."""
+        index = TwoSumIndex([10, 20])
+        assert index.remove(0) == 10
+        assert len(index) == 1
+
+    def test_remove_invalidates_cached_pair(self) -> None:
+        """Test that a cached pair is recomputed after removal."""
+        index = TwoSumIndex([1, 5, 1, 5])
+        assert index.query(6) == [0, 1]
+        index.remove(1)
+        result = index.query(6)
+        assert result is not None
+        assert index[result[0]] + index[result[1]] == 6
+
+    def test_add_after_cached_miss(self) -> None:
+        """Test that a cached miss sees values appended later."""
+        index = TwoSumIndex([1, 2])
+        assert index.query(10) is None
+        index.add(8)
+        assert index.query(10) == [1, 2]
+
+    def test_indices_are_not_reused(self) -> None:
+        """Test that removed indices stay removed."""
+        index = TwoSumIndex([1, 2])
+        index.remove(1)
+        assert index.add(2) == 2
+        with pytest.raises(IndexError, match="No value at index 1"):
+            index[1]
+
+    def test_remove_invalid_index_raises_error(self) -> None:
+        """Test that removing an unknown or removed index raises IndexError."""
+        index = TwoSumIndex([1])
+        index.remove(0)
+        for bad in (0, 1, -1):
+            with pytest.raises(IndexError):
+                index.remove(bad)
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_random_operations_match_brute_force(self, compact: bool) -> None:
+        """Verify query existence against brute force under random updates."""
+        rng = random.Random(7)
+        index = TwoSumIndex(compact=compact)
+        live: dict[int, int] = {}
+        for _ in range(2000):
+            if live and rng.random() < 0.3:
+                position = rng.choice(list(live))
+                index.remove(position)
+                del live[position]
+            else:
+                value = rng.randint(-15, 15)
+                live[index.add(value)] = value
+
+            target = rng.randint(-20, 20)
+            result = index.query(target)
+            values = list(live.values())
+            try:
+                two_sum_brute_force(values, target)
+                expected = True
+            except ValueError:
+                expected = False
+            assert (result is not None) == expected
+            if result is not None:
+                i, j = result
+                assert i < j
+                assert live[i] + live[j] == target
+
+
+class TestTwoSumIndexCompact:
+    """The array-backed layout selected with compact=True."""
+
+    def test_duplicates_and_removal(self) -> None:
+        """Test duplicate chains when removing head, middle and tail."""
+        index = TwoSumIndex([4, 4, 4, 4], compact=True)
+        index.remove(3)
+        index.remove(1)
+        assert index.query(8) == [0, 2]
+        index.remove(0)
+        assert index.query(8) is None
+        assert index.add(4) == 4
+        assert index.query(8) == [2, 4]
+
+    def test_getitem_and_len(self) -> None:
+        """Test value access on the compact layout."""
+        index = TwoSumIndex([-(2**63), 2**63 - 1], compact=True)
+        assert index[0] == -(2**63)
+        assert index.query(-1) == [0, 1]
+        assert len(index) == 2
+
+    def test_value_beyond_int64_rejected(self) -> None:
+        """Test that values must fit in int64."""
+        with pytest.raises(OverflowError):
+            TwoSumIndex([2**63], compact=True)
+
+    def test_nbytes_smaller_than_dict_layout(self) -> None:
+        """Test that the compact layout uses a fraction of the memory."""
+        values = [i * 7919 for i in range(20_000)]
+        dict_bytes = TwoSumIndex(values).nbytes
+        compact_bytes = TwoSumIndex(values, compact=True).nbytes
+        assert compact_bytes / len(values) < 80
+        assert compact_bytes * 3 < dict_bytes
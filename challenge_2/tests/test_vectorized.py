@@ -0,0 +1,596 @@
+"""Tests for the NumPy-vectorized Two Sum engines.
+
+The whole module is skipped when NumPy (an optional extra) is not installed.
+"""
+
+import random
+from array import array
+from pathlib import Path
+
+import pytest
+
+from src.stats import TwoSumStats
+from src.two_sum import (
+    two_sum,
+    two_sum_auto,
+    two_sum_closest,
+    two_sum_count,
+    two_sum_count_bands,
+    two_sum_count_range,
+    two_sum_cross,
+    two_sum_cross_mmap,
+    two_sum_cross_np,
+    two_sum_mmap,
+    two_sum_np,
+    two_sum_tolerance,
+)
+
+np = pytest.importorskip("numpy")
+
+
+class TestTwoSumNumPy:
+    """Correctness tests for two_sum_np against the hash map contract."""
+
+    def test_example_case(self) -> None:
+        """Test the problem example with an ndarray."""
+        assert two_sum_np(np.array([2, 7, 11, 15]), 9) == [0, 1]
+
+    def test_returns_python_ints(self) -> None:
+        """Verify the result is a list of plain Python ints."""
+        result = two_sum_np(np.array([3, 2, 4]), 6)
+        assert result == [1, 2]
+        assert all(type(x) is int for x in result)
+
+    def test_duplicates_match_latest_index(self) -> None:
+        """Test that duplicates resolve like the overwriting hash map."""
+        nums = [1, 1, 5, 3, 3]
+        assert two_sum_np(np.array(nums), 6) == two_sum(nums, 6) == [1, 2]
+        assert two_sum_np(np.array([5, 5, 5, 5]), 10) == [0, 1]
+
+    def test_negative_numbers(self) -> None:
+        """Test with negative integers."""
+        assert two_sum_np(np.array([-1, -2, -3, -4, -5]), -8) == [2, 4]
+
+    def test_array_array_input(self) -> None:
+        """Test with an array.array buffer."""
+        assert two_sum_np(array("i", [0, 4, 3, 0]), 0) == [0, 3]
+
+    def test_memoryview_input(self) -> None:
+        """Test with a memoryview over an int64 buffer."""
+        buf = memoryview(array("q", [-3, 4, 3, 90]))
+        assert two_sum_np(buf, 0) == [0, 2]
+
+    def test_small_dtypes_do_not_overflow(self) -> None:
+        """Test that int8/uint8 inputs are widened before summing."""
+        assert two_sum_np(np.array([100, 27, 100], dtype=np.int8), 200) == [0, 2]
+        assert two_sum_np(np.array([1, 255, 255], dtype=np.uint8), 510) == [1, 2]
+
+    def test_int64_extremes(self) -> None:
+        """Test that wrapped complements never produce false matches."""
+        big = int(np.iinfo(np.int64).max)
+        # big - 1 - (-big) wraps around to -3, which is present at index 0
+        nums = np.array([-3, -big, 5, big - 6], dtype=np.int64)
+        assert two_sum_np(nums, big - 1) == [2, 3]
+
+    def test_target_beyond_int64(self) -> None:
+        """Test targets outside int64 via the exact fallback."""
+        big = int(np.iinfo(np.int64).max)
+        nums = np.array([big, 1, -2, big - 1], dtype=np.int64)
+        assert two_sum_np(nums, 2 * big - 1) == [0, 3]
+
+    def test_uint64_falls_back_to_exact_ints(self) -> None:
+        """Test values beyond int64 via the exact fallback."""
+        nums = np.array([2**64 - 2, 1, 1], dtype=np.uint64)
+        assert two_sum_np(nums, 2**64 - 1) == [0, 1]
+
+    def test_matches_two_sum_on_random_inputs(self) -> None:
+        """Test parity with two_sum across random small-range inputs."""
+        rng = random.Random(1234)
+        for _ in range(300):
+            nums = [rng.randint(-20, 20) for _ in range(rng.randint(2, 40))]
+            target = rng.randint(-40, 40)
+            try:
+                expected = two_sum(nums, target)
+            except ValueError:
+                with pytest.raises(ValueError, match="No two numbers"):
+                    two_sum_np(np.array(nums), target)
+            else:
+                assert two_sum_np(np.array(nums), target) == expected
+
+    def test_sort_path_matches_two_sum(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the argsort path on small ranges with the table disabled."""
+        monkeypatch.setattr("src.two_sum._DIRECT_ADDRESS_MIN_SPAN", 0)
+        monkeypatch.setattr("src.two_sum._DIRECT_ADDRESS_SPAN_RATIO", 0)
+        rng = random.Random(4321)
+        for _ in range(300):
+            nums = [rng.randint(-20, 20) for _ in range(rng.randint(2, 40))]
+            target = rng.randint(-40, 40)
+            try:
+                expected = two_sum(nums, target)
+            except ValueError:
+                with pytest.raises(ValueError, match="No two numbers"):
+                    two_sum_np(np.array(nums), target)
+            else:
+                assert two_sum_np(np.array(nums), target) == expected
+
+    def test_direct_table_spanning_chunks(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a small-range pair found after several chunked steps."""
+        monkeypatch.setattr("src.two_sum._NP_CHUNK_SIZE", 4)
+        nums = [2 * (k % 7) for k in range(30)] + [3, 1]
+        assert two_sum_np(np.array(nums), 13) == two_sum(nums, 13)
+
+    def test_direct_table_many_duplicates(self) -> None:
+        """Test that the table keeps each value's first index."""
+        rng = random.Random(15)
+        nums = [rng.randint(0, 5) for _ in range(10_000)]
+        for target in range(11):
+            assert two_sum_np(np.array(nums), target) == two_sum(nums, target)
+
+    def test_pair_spanning_chunks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a pair found after several chunked search steps."""
+        monkeypatch.setattr("src.two_sum._NP_CHUNK_SIZE", 4)
+        nums = list(range(0, 40, 2))
+        assert two_sum_np(np.array(nums), 70) == two_sum(nums, 70)
+
+    def test_presorted_matches_two_sum(self) -> None:
+        """Test that skipping the sort keeps the two_sum contract."""
+        rng = random.Random(21)
+        for _ in range(300):
+            nums = sorted(rng.randint(-20, 20) for _ in range(rng.randint(2, 40)))
+            target = rng.randint(-40, 40)
+            try:
+                expected = two_sum(nums, target)
+            except ValueError:
+                with pytest.raises(ValueError, match="No two numbers"):
+                    two_sum_np(np.array(nums), target, presorted=True)
+            else:
+                assert two_sum_np(np.array(nums), target, presorted=True) == expected
+
+    def test_too_short_raises_error(self) -> None:
+        """Test that fewer than 2 elements raises ValueError."""
+        with pytest.raises(ValueError, match="at least 2 elements"):
+            two_sum_np(np.array([1]), 2)
+
+    def test_out_of_range_target_raises_error(self) -> None:
+        """Test the min/max pruning for impossible targets."""
+        with pytest.raises(ValueError, match="No two numbers"):
+            two_sum_np(np.array([1, 2, 3]), 100)
+
+    def test_float_input_rejected(self) -> None:
+        """Test that non-integer data raises TypeError."""
+        with pytest.raises(TypeError, match="integers"):
+            two_sum_np(np.array([1.5, 2.5]), 4)
+
+    def test_two_dimensional_input_rejected(self) -> None:
+        """Test that multi-dimensional arrays raise ValueError."""
+        with pytest.raises(ValueError, match="one-dimensional"):
+            two_sum_np(np.array([[1, 2], [3, 4]]), 3)
+
+
+class TestTwoSumNumPyStats:
+    """Tests for the stats filled in by the vectorized engine."""
+
+    def test_direct_address(self) -> None:
+        """Test the small-range path: a table of one index per value."""
+        stats = TwoSumStats()
+        assert two_sum_np(np.arange(10, dtype=np.int64), 17, stats=stats) == [8, 9]
+        assert stats.strategy == "direct-address"
+        assert stats.index_size == 10
+        assert stats.index_bytes == 10 * 4
+        assert set(stats.phases) == {"convert", "range", "table", "search"}
+
+    def test_sort_search(self) -> None:
+        """Test the sorting path: permutation plus sorted copy."""
+        stats = TwoSumStats()
+        nums = np.array([5, 10**12, 3, 8, 1], dtype=np.int64)
+        assert two_sum_np(nums, 11, stats=stats) == [2, 3]
+        assert stats.strategy == "sort-search"
+        assert stats.elements_scanned == 5
+        assert stats.index_bytes == 2 * nums.nbytes
+        assert "sort" in stats.phases
+
+    def test_presorted(self) -> None:
+        """Test that the presorted path builds no index."""
+        stats = TwoSumStats()
+        nums = np.arange(10, dtype=np.int64)
+        assert two_sum_np(nums, 17, presorted=True, stats=stats) == [8, 9]
+        assert stats.strategy == "presorted-search"
+        assert stats.index_size == 0
+
+    def test_no_solution(self) -> None:
+        """Test that a failed search counts every element."""
+        stats = TwoSumStats()
+        with pytest.raises(ValueError, match="No two numbers"):
+            two_sum_np(np.array([1, 3, 5, 7]), 9, stats=stats)
+        assert stats.elements_scanned == 4
+
+    def test_big_values_fall_back(self) -> None:
+        """Test that uint64 data reports the hash engine it fell back to."""
+        stats = TwoSumStats()
+        nums = np.array([2**63, 1, 2**63 + 1], dtype=np.uint64)
+        assert two_sum_np(nums, 2**63 + 2, stats=stats) == [1, 2]
+        assert stats.strategy == "hash"
+
+
+class TestTwoSumClosestNumPy:
+    """Tests for the vectorized closest-sum path on ndarrays."""
+
+    def test_matches_list_gap(self) -> None:
+        """Test that arrays reach the same gap as the list scan."""
+        rng = random.Random(12)
+        for _ in range(300):
+            nums = [rng.randint(-50, 50) for _ in range(rng.randint(2, 30))]
+            target = rng.randint(-150, 150)
+            i, j = two_sum_closest(np.array(nums), target)
+            k, m = two_sum_closest(nums, target)
+            assert i < j
+            assert abs(nums[i] + nums[j] - target) == abs(nums[k] + nums[m] - target)
+
+    def test_pair_spanning_chunks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the best pair found across several chunked steps."""
+        monkeypatch.setattr("src.two_sum._NP_CHUNK_SIZE", 4)
+        nums = list(range(0, 40, 2))
+        i, j = two_sum_closest(np.array(nums), 71)
+        assert abs(nums[i] + nums[j] - 71) == 1
+
+    def test_large_magnitudes_fall_back(self) -> None:
+        """Test values whose sums would overflow int64."""
+        nums = np.array([2**62, -(2**62), 5], dtype=np.int64)
+        assert two_sum_closest(nums, 2**62 + 3) == [0, 2]
+
+    def test_float_array_rejected(self) -> None:
+        """Test that non-integer arrays raise TypeError."""
+        with pytest.raises(TypeError):
+            two_sum_closest(np.array([1.5, 2.5]), 4)
+
+    def test_single_element_raises_error(self) -> None:
+        """Test that fewer than 2 elements is rejected."""
+        with pytest.raises(ValueError, match="at least 2 elements"):
+            two_sum_closest(np.array([1]), 1)
+
+
+class TestTwoSumMmapVectorized:
+    """Tests for memory-mapped files searched by the vectorized engine."""
+
+    def test_int64_file(self, tmp_path: Path) -> None:
+        """Test the default (auto) path on an int64 file."""
+        path = tmp_path / "nums.bin"
+        np.array([3, 2, 4], dtype="<i8").tofile(path)
+        assert two_sum_mmap(path, 6) == [1, 2]
+        assert two_sum_mmap(path, 6, vectorized=True) == [1, 2]
+
+    def test_int32_file(self, tmp_path: Path) -> None:
+        """Test an int32 file, which is widened before searching."""
+        path = tmp_path / "nums.bin"
+        np.array([0, 4, 3, 0], dtype="<i4").tofile(path)
+        assert two_sum_mmap(path, 0, "int32", vectorized=True) == [0, 3]
+
+    def test_paths_agree(self, tmp_path: Path) -> None:
+        """Verify the vectorized and chunked paths return the same pair."""
+        rng = np.random.default_rng(5)
+        nums = rng.integers(-1000, 1000, size=5000, dtype=np.int64)
+        path = tmp_path / "nums.bin"
+        nums.astype("<i8").tofile(path)
+        for target in (-1500, 0, 777, 1990):
+            vectorized = two_sum_mmap(path, target, vectorized=True)
+            chunked = two_sum_mmap(path, target, vectorized=False)
+            assert vectorized == chunked == two_sum(nums.tolist(), target)
+
+
+class TestTwoSumCrossNumPy:
+    """Tests for the vectorized cross-input join."""
+
+    def test_basic(self) -> None:
+        """Test the docstring example and swapped sides."""
+        assert two_sum_cross_np(np.array([1, 5, 9]), np.array([10, 4, 2]), 13) == [2, 1]
+        assert two_sum_cross_np([9, 9, 1, 2, 3, 4], [8, 7], 10) == [3, 0]
+
+    def test_matches_pure_python(self) -> None:
+        """Verify identical pairs on random inputs of mixed lengths."""
+        rng = np.random.default_rng(19)
+        for _ in range(100):
+            a = rng.integers(-50, 50, size=int(rng.integers(1, 40)))
+            b = rng.integers(-50, 50, size=int(rng.integers(1, 40)))
+            target = int(rng.integers(-100, 100))
+            try:
+                expected = two_sum_cross(a.tolist(), b.tolist(), target)
+            except ValueError:
+                with pytest.raises(ValueError, match="No two numbers"):
+                    two_sum_cross_np(a, b, target)
+            else:
+                assert two_sum_cross_np(a, b, target) == expected
+
+    def test_match_in_later_chunk(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that positions stay global across chunks."""
+        monkeypatch.setattr("src.two_sum._NP_CHUNK_SIZE", 4)
+        b = np.arange(100, 130)
+        assert two_sum_cross_np([3, 1], b, 127) == [0, 24]
+
+    def test_wrapped_complement_ignored(self) -> None:
+        """Test that complements overflowing int64 do not match."""
+        big = np.iinfo(np.int64).max
+        # -10 - big wraps around to big - 8, which is in the small side
+        small = np.array([big - 8], dtype=np.int64)
+        large = np.array([big, 0, 1], dtype=np.int64)
+        with pytest.raises(ValueError, match="No two numbers"):
+            two_sum_cross_np(small, large, -10)
+
+    def test_uint64_falls_back(self) -> None:
+        """Test values beyond int64 with exact Python arithmetic."""
+        a = np.array([2**63 + 5], dtype=np.uint64)
+        b = np.array([1, 2, 3], dtype=np.uint64)
+        assert two_sum_cross_np(a, b, 2**63 + 7) == [0, 1]
+        assert two_sum_cross_np(b, a, 2**63 + 7) == [1, 0]
+
+    def test_empty_input_raises_error(self) -> None:
+        """Test that both inputs must hold at least one value."""
+        with pytest.raises(ValueError, match="non-empty"):
+            two_sum_cross_np(np.array([], dtype=np.int64), [1], 1)
+
+    def test_memmap_paths_agree(self, tmp_path: Path) -> None:
+        """Verify the vectorized and chunked file paths return the same pair."""
+        rng = np.random.default_rng(7)
+        data = rng.integers(-10_000, 10_000, size=20_000, dtype=np.int64)
+        path = tmp_path / "b.bin"
+        data.astype("<i8").tofile(path)
+        a = rng.integers(-10_000, 10_000, size=50).tolist()
+        for target in (-15_000, 0, 12_345, 19_999):
+            try:
+                expected = two_sum_cross(a, data.tolist(), target)
+            except ValueError:
+                continue
+            assert two_sum_cross_mmap(a, path, target) == expected
+            assert two_sum_cross_mmap(a, path, target, vectorized=False) == expected
+
+
+class TestTwoSumToleranceNumPy:
+    """Tests for the vectorized tolerance search on ndarrays."""
+
+    def test_float64_array(self) -> None:
+        """Test the docstring example on an ndarray."""
+        nums = np.array([10.25, 3.1, 7.2, 0.35])
+        assert two_sum_tolerance(nums, 10.3, 1e-9) == [1, 2]
+
+    def test_matches_list_path(self) -> None:
+        """Verify the same pair as the pure-Python path on random data."""
+        rng = np.random.default_rng(20)
+        for _ in range(100):
+            nums = np.round(rng.uniform(-10, 10, int(rng.integers(2, 60))), 2)
+            target = float(np.round(rng.uniform(-20, 20), 2))
+            for eps in (0.0, 0.005, 0.5):
+                try:
+                    expected = two_sum_tolerance(nums.tolist(), target, eps)
+                except ValueError:
+                    with pytest.raises(ValueError, match="No two numbers"):
+                        two_sum_tolerance(nums, target, eps)
+                else:
+                    assert two_sum_tolerance(nums, target, eps) == expected
+
+    def test_pair_across_chunks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that positions stay global across chunks."""
+        monkeypatch.setattr("src.two_sum._NP_CHUNK_SIZE", 3)
+        nums = np.arange(20, dtype=np.float64) * 0.5
+        assert two_sum_tolerance(nums, 18.5, 0.01) == [18, 19]
+
+    def test_zero_eps_float_sums(self) -> None:
+        """Test that eps=0 finds pairs whose float sum equals target."""
+        nums = np.array([0.1, 0.2])
+        assert two_sum_tolerance(nums, 0.1 + 0.2, 0) == [0, 1]
+        nums = np.array([24.49, -83.07])
+        assert two_sum_tolerance(nums, 24.49 + -83.07, 0) == [0, 1]
+
+    def test_other_dtypes(self) -> None:
+        """Test float32 and integer arrays, converted to float64."""
+        assert two_sum_tolerance(np.array([1.5, 2.5], np.float32), 4.0, 0) == [0, 1]
+        assert two_sum_tolerance(np.array([3, 2, 4]), 6.2, 0.25) == [1, 2]
+
+    def test_nan_raises_error(self) -> None:
+        """Test that NaN values are rejected."""
+        with pytest.raises(ValueError, match="NaN"):
+            two_sum_tolerance(np.array([1.0, np.nan, 2.0]), 3.0, 0.1)
+
+    def test_invalid_arrays_raise_error(self) -> None:
+        """Test dtype, shape and size checks."""
+        with pytest.raises(TypeError, match="real numbers"):
+            two_sum_tolerance(np.array([1 + 2j, 3j]), 1.0, 0.1)
+        with pytest.raises(ValueError, match="one-dimensional"):
+            two_sum_tolerance(np.ones((2, 2)), 2.0, 0.1)
+        with pytest.raises(ValueError, match="at least 2 elements"):
+            two_sum_tolerance(np.ones(1), 2.0, 0.1)
+
+
+class TestTwoSumCountNumPy:
+    """Tests for counting pairs over the unique values of an ndarray."""
+
+    def test_example_case(self) -> None:
+        """Test the docstring example on an ndarray."""
+        assert two_sum_count(np.array([1, 5, 3, 3, 3, 7, 5]), 10) == 4
+
+    def test_matches_list_path(self) -> None:
+        """Verify the pure-Python count on random data, odd and even targets."""
+        rng = np.random.default_rng(21)
+        for _ in range(100):
+            nums = rng.integers(-20, 20, int(rng.integers(0, 80)))
+            for target in rng.integers(-40, 40, 4).tolist():
+                expected = two_sum_count(nums.tolist(), target)
+                assert two_sum_count(nums, target) == expected
+
+    def test_chunked_unique(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that counts merged across chunks stay exact."""
+        monkeypatch.setattr("src.two_sum._NP_CHUNK_SIZE", 7)
+        nums = np.arange(1000) % 13
+        assert two_sum_count(nums, 12) == two_sum_count(nums.tolist(), 12)
+        assert two_sum_count(nums, 12) > 0
+
+    def test_returns_python_int(self) -> None:
+        """Verify the result is a plain Python int."""
+        result = two_sum_count(np.zeros(10, dtype=np.int32), 0)
+        assert result == 45
+        assert type(result) is int
+
+    def test_int64_extremes(self) -> None:
+        """Test values and targets at the edges of int64."""
+        info = np.iinfo(np.int64)
+        nums = np.array([info.min, info.max, info.max, 0, -1])
+        assert two_sum_count(nums, -1) == 3
+        assert two_sum_count(nums, 2 * info.max) == 1
+        assert two_sum_count(nums, 2 * info.max + 1) == 0
+        assert two_sum_count(nums, 2 * info.min) == 0
+
+    def test_uint64_beyond_int64(self) -> None:
+        """Test unsigned values that do not fit in int64."""
+        top = np.iinfo(np.uint64).max
+        nums = np.array([top, 0, top, 1], dtype=np.uint64)
+        assert two_sum_count(nums, int(top)) == 2
+        assert two_sum_count(nums, 2 * int(top)) == 1
+
+    def test_invalid_arrays_raise_error(self) -> None:
+        """Test dtype and shape checks."""
+        with pytest.raises(TypeError, match="integer"):
+            two_sum_count(np.array([1.5, 2.5]), 4)
+        with pytest.raises(ValueError, match="one-dimensional"):
+            two_sum_count(np.ones((2, 2), dtype=np.int64), 2)
+
+
+class TestTwoSumCountRangeNumPy:
+    """Tests for band counting with searchsorted on ndarrays."""
+
+    def test_example_case(self) -> None:
+        """Test the docstring example on an ndarray."""
+        assert two_sum_count_range(np.array([1, 2, 3, 4, 5]), 5, 7) == 6
+
+    def test_matches_list_path(self) -> None:
+        """Verify the pure-Python counts on random data."""
+        rng = np.random.default_rng(23)
+        for _ in range(100):
+            nums = rng.integers(-50, 50, int(rng.integers(0, 200)))
+            bands = [tuple(sorted(b)) for b in rng.integers(-110, 110, (5, 2)).tolist()]
+            expected = two_sum_count_bands(nums.tolist(), bands)
+            assert two_sum_count_bands(nums, bands) == expected
+
+    def test_across_chunks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that chunked prefix counts add up."""
+        monkeypatch.setattr("src.two_sum._NP_CHUNK_SIZE", 7)
+        nums = np.arange(100)
+        assert two_sum_count_range(nums, 50, 120) == two_sum_count_range(
+            nums.tolist(), 50, 120
+        )
+
+    def test_band_beyond_values(self) -> None:
+        """Test limits below and above every pair sum."""
+        nums = np.arange(10, dtype=np.int32)
+        assert two_sum_count_bands(nums, [(-100, 0), (17, 10**30)]) == [0, 1]
+        assert two_sum_count_range(nums, -(10**30), 10**30) == 45
+
+    def test_large_magnitudes_fall_back(self) -> None:
+        """Test int64 and uint64 extremes, counted with Python ints."""
+        info = np.iinfo(np.int64)
+        nums = np.array([info.min, info.max, info.max, 0])
+        assert two_sum_count_range(nums, -1, 2 * info.max) == 5
+        top = np.array([np.iinfo(np.uint64).max, 1], dtype=np.uint64)
+        assert two_sum_count_range(top, 1 << 64, 1 << 64) == 1
+
+    def test_invalid_arrays_raise_error(self) -> None:
+        """Test the dtype check."""
+        with pytest.raises(TypeError, match="integer"):
+            two_sum_count_range(np.array([1.5, 2.5]), 0, 10)
+
+
+class TestTwoSumAutoNumPy:
+    """Tests for the vectorized choices of the adaptive dispatcher."""
+
+    def test_sorted_array_skips_argsort(self) -> None:
+        """Test that verified sorted input takes the presorted search."""
+        nums = np.arange(0, 2_000_000, 2, dtype=np.int64)
+        stats = TwoSumStats()
+        assert two_sum_auto(nums, 1_999_994, stats=stats) == [499_998, 499_999]
+        assert stats.strategy == "presorted-search"
+        assert "probe" in stats.phases
+
+    def test_unsorted_array(self) -> None:
+        """Test a wide-range unsorted array and a small-range one."""
+        rng = np.random.default_rng(24)
+        nums = rng.integers(0, 10**12, 10_000)
+        target = int(nums[10] + nums[9_000])
+        stats = TwoSumStats()
+        assert two_sum_auto(nums, target, stats=stats) == two_sum(nums.tolist(), target)
+        assert stats.strategy == "sort-search"
+
+        narrow = np.arange(1000) % 100
+        assert two_sum_auto(narrow, 150, stats=stats) == two_sum(narrow.tolist(), 150)
+        assert stats.strategy == "direct-address"
+
+    def test_almost_sorted_array(self) -> None:
+        """Test that one inversion the probe misses is caught."""
+        nums = np.arange(10_000, dtype=np.int64) * 10**6
+        nums[[5_001, 5_002]] = nums[[5_002, 5_001]]
+        target = 10_001 * 10**6
+        stats = TwoSumStats()
+        assert two_sum_auto(nums, target, stats=stats) == two_sum(nums.tolist(), target)
+        assert stats.strategy == "sort-search"
+
+    def test_short_array_uses_hash(self) -> None:
+        """Test that a short ndarray is searched as Python ints."""
+        stats = TwoSumStats()
+        result = two_sum_auto(np.array([2, 7, 11, 15]), 9, stats=stats)
+        assert result == [0, 1]
+        assert all(type(x) is int for x in result)
+        assert stats.strategy == "hash"
+
+    def test_long_list_is_converted(self) -> None:
+        """Test that a pair past the hash-scanned prefix uses NumPy."""
+        nums = list(range(0, 40_000, 2)) + [1]
+        stats = TwoSumStats()
+        assert two_sum_auto(nums, 39_999, stats=stats) == [19_999, 20_000]
+        assert stats.strategy in {"sort-search", "direct-address"}
+
+    def test_pair_in_list_prefix(self) -> None:
+        """Test that a pair near the front skips the conversion."""
+        nums = [5, 5] + list(range(100, 40_000))
+        stats = TwoSumStats()
+        assert two_sum_auto(nums, 10, stats=stats) == [0, 1]
+        assert stats.strategy == "hash"
+        assert stats.elements_scanned == 2
+
+    def test_prefix_sized_by_shape(self) -> None:
+        """Test that the hash-scanned prefix depends on container and range."""
+        rng = np.random.default_rng(5)
+        wide = (2 * rng.integers(0, 10**12, 40_000)).tolist()
+        narrow = (2 * rng.integers(0, 30_000, 40_000)).tolist()
+        cases = [
+            (wide, "list", "hash"),  # n / 4 of a wide list
+            (narrow, "list", "direct-address"),  # n / 16 of a narrow one
+            (wide, "ndarray", "sort-search"),  # n / 8 of a wide array
+        ]
+        for values, container, strategy in cases:
+            nums = list(values)
+            nums[8_000] = 1  # 20% in: the only odd value
+            target = nums[7_999] + 1
+            data = nums if container == "list" else np.array(nums)
+            stats = TwoSumStats()
+            assert two_sum_auto(data, target, stats=stats) == two_sum(nums, target)
+            assert stats.strategy == strategy
+
+    def test_prefix_chunks_match_two_sum(self) -> None:
+        """Test pairs that span the doubling chunks of the prefix scan."""
+        rng = np.random.default_rng(6)
+        nums = rng.integers(0, 10**9, 40_000).tolist()
+        for i, j in ((10, 1_023), (1_023, 1_024), (500, 3_071), (3_000, 9_000)):
+            target = nums[i] + nums[j]
+            assert two_sum_auto(nums, target) == two_sum(nums, target)
+
+    def test_memmap(self, tmp_path: Path) -> None:
+        """Test a memory-mapped array, searched in place."""
+        path = tmp_path / "values.bin"
+        np.arange(1000, dtype="<i8").tofile(path)
+        data = np.memmap(path, dtype="<i8", mode="r")
+        stats = TwoSumStats()
+        assert two_sum_auto(data, 1997, stats=stats) == [998, 999]
+        assert stats.strategy == "presorted-search"
+
+    def test_float_array_raises_error(self) -> None:
+        """Test that a non-integer ndarray is rejected."""
+        with pytest.raises(TypeError, match="integers"):
+            two_sum_auto(np.linspace(0, 1, 1000), 1)